@@ -0,0 +1,30 @@
+import { vi } from 'vitest';
+import type { LocaleSection, RawSectionTable, SectionLanguage } from '../../lib/locale-sections';
+
+// Stand-in for the generated lib/locale-sections.ts with the same shapes
+// scripts/build_locale_bundles.py emits: numbers are indexes into the
+// language string table and arrays are precompiled {{var}} parts
+
+export const LOCALE_SECTIONS = ['common', 'home'] as const;
+
+export const STRING_TABLES: Record<SectionLanguage, () => string[]> = {
+  es: vi.fn(() => ['Guardar', 'Cancelar']),
+  en: vi.fn(() => ['Save', 'Cancel']),
+  de: vi.fn(() => []),
+};
+
+export const SECTION_LOADERS: Record<SectionLanguage, Partial<Record<LocaleSection, () => RawSectionTable>>> = {
+  es: {
+    common: () => ({ save: 0, cancel: 1, title: 'Inicio' }),
+    home: () => ({
+      save_button: 0,
+      'error.navigation_unit_not_supported': 'Unidad de navegación no soportada',
+      greeting: ['Hola ', 'name', ', tienes ', 'count', ' mensajes'],
+      empty: '',
+    }),
+  },
+  en: {
+    common: () => ({ save: 0, cancel: 1, title: 'Home' }),
+  },
+  de: {},
+};
@@ -0,0 +1,30 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import i18n, { t } from '../lib/i18n';
+
+vi.mock('../lib/locale-sections', () => import('./fixtures/locale-sections'));
+
+describe('i18n', () => {
+  describe('t', () => {
+    beforeEach(() => {
+      i18n.locale = 'es';
+    });
+
+    it('should nest keys containing dots for i18n-js', () => {
+      expect(t('home.error.navigation_unit_not_supported')).toBe('Unidad de navegación no soportada');
+    });
+
+    it('should resolve interned strings across sections', () => {
+      expect(t('common.save')).toBe('Guardar');
+      expect(t('home.save_button')).toBe('Guardar');
+    });
+
+    it('should rebuild {{var}} placeholders for i18n-js to interpolate', () => {
+      expect(t('home.greeting', { name: 'Ana', count: 3 })).toBe('Hola Ana, tienes 3 mensajes');
+    });
+
+    it('should fall back to the default locale', () => {
+      i18n.locale = 'de';
+      expect(t('common.title')).toBe('Home');
+    });
+  });
+});
@@ -0,0 +1,64 @@
+import { describe, it, expect, vi } from 'vitest';
+import { interpolate, loadSection, loadedSections } from '../lib/locale-loader';
+import { STRING_TABLES } from '../lib/locale-sections';
+
+vi.mock('../lib/locale-sections', () => import('./fixtures/locale-sections'));
+
+describe('locale-loader', () => {
+  describe('loadSection', () => {
+    it('should resolve interned string indexes across sections', () => {
+      const common = loadSection('es', 'common');
+      const home = loadSection('es', 'home');
+
+      expect(common?.save).toBe('Guardar');
+      expect(common?.cancel).toBe('Cancelar');
+      expect(home?.save_button).toBe('Guardar');
+      expect(STRING_TABLES.es).toHaveBeenCalledTimes(1);
+    });
+
+    it('should resolve indexes against the string table of its language', () => {
+      expect(loadSection('en', 'common')?.save).toBe('Save');
+    });
+
+    it('should keep plain strings and interpolation parts as they are', () => {
+      const home = loadSection('es', 'home');
+      expect(home?.['error.navigation_unit_not_supported']).toBe('Unidad de navegación no soportada');
+      expect(home?.greeting).toEqual(['Hola ', 'name', ', tienes ', 'count', ' mensajes']);
+    });
+
+    it('should cache loaded sections', () => {
+      expect(loadSection('es', 'common')).toBe(loadSection('es', 'common'));
+      expect(loadedSections('es')).toEqual(expect.arrayContaining(['common', 'home']));
+    });
+
+    it('should return undefined for unknown or missing sections', () => {
+      expect(loadSection('es', 'unknown')).toBeUndefined();
+      expect(loadSection('de', 'common')).toBeUndefined();
+    });
+  });
+
+  describe('interpolate', () => {
+    const parts = ['Hola ', 'name', ', tienes ', 'count', ' mensajes'];
+
+    it('should join parts with the given params', () => {
+      expect(interpolate(parts, { name: 'Ana', count: 3 })).toBe('Hola Ana, tienes 3 mensajes');
+    });
+
+    it('should keep placeholders when params are missing', () => {
+      expect(interpolate(parts)).toBe('Hola {{name}}, tienes {{count}} mensajes');
+      expect(interpolate(parts, { name: 'Ana' })).toBe('Hola Ana, tienes {{count}} mensajes');
+    });
+
+    it('should keep placeholders for empty params', () => {
+      expect(interpolate(parts, { name: '', count: 3 })).toBe('Hola {{name}}, tienes 3 mensajes');
+    });
+
+    it('should render zero', () => {
+      expect(interpolate(parts, { name: 'Ana', count: 0 })).toBe('Hola Ana, tienes 0 mensajes');
+    });
+
+    it('should return text without placeholders unchanged', () => {
+      expect(interpolate(['Guardar'])).toBe('Guardar');
+    });
+  });
+});
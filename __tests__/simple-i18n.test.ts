@@ -0,0 +1,65 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { getTranslation } from '../lib/simple-i18n';
+
+vi.mock('../lib/locale-sections', () => import('./fixtures/locale-sections'));
+
+describe('simple-i18n', () => {
+  describe('getTranslation', () => {
+    afterEach(() => {
+      vi.restoreAllMocks();
+    });
+
+    it('should return the key and warn only once for a missing key', () => {
+      const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+
+      expect(getTranslation('home.missing', 'es')).toBe('home.missing');
+      expect(getTranslation('home.missing', 'es')).toBe('home.missing');
+
+      expect(warn).toHaveBeenCalledTimes(1);
+      expect(warn).toHaveBeenCalledWith('[simple-i18n] Translation not found: home.missing in es');
+    });
+
+    it('should warn again for the same missing key in another language', () => {
+      const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+
+      expect(getTranslation('home.missing', 'en')).toBe('home.missing');
+
+      expect(warn).toHaveBeenCalledTimes(1);
+      expect(warn).toHaveBeenCalledWith('[simple-i18n] Translation not found: home.missing in en');
+    });
+
+    it('should return a key without section as is', () => {
+      vi.spyOn(console, 'warn').mockImplementation(() => {});
+      expect(getTranslation('common', 'es')).toBe('common');
+    });
+
+    it('should find keys containing dots inside a section', () => {
+      expect(getTranslation('home.error.navigation_unit_not_supported', 'es'))
+        .toBe('Unidad de navegación no soportada');
+    });
+
+    it('should resolve interned strings', () => {
+      expect(getTranslation('common.save', 'es')).toBe('Guardar');
+      expect(getTranslation('home.save_button', 'es')).toBe('Guardar');
+    });
+
+    it('should interpolate params', () => {
+      expect(getTranslation('home.greeting', 'es', { name: 'Ana', count: 3 }))
+        .toBe('Hola Ana, tienes 3 mensajes');
+    });
+
+    it('should keep placeholders for missing or empty params', () => {
+      expect(getTranslation('home.greeting', 'es')).toBe('Hola {{name}}, tienes {{count}} mensajes');
+      expect(getTranslation('home.greeting', 'es', { name: '' }))
+        .toBe('Hola {{name}}, tienes {{count}} mensajes');
+    });
+
+    it('should fall back to the key for an empty value', () => {
+      expect(getTranslation('home.empty', 'es')).toBe('home.empty');
+    });
+
+    it('should use English for unsupported languages', () => {
+      expect(getTranslation('common.save', 'fr')).toBe('Save');
+    });
+  });
+});
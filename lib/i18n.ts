@@ -1,21 +1,51 @@
 import { I18n } from 'i18n-js';
-import es from '../locales/es.json';
-import en from '../locales/en.json';
-import de from '../locales/de.json';
+import { interpolate, loadSection } from './locale-loader';
+import type { SectionLanguage, SectionTable } from './locale-sections';
 
-// Crear instancia de i18n
-const i18n = new I18n({
-  es,
-  en,
-  de,
-});
+// Crear instancia de i18n sin traducciones: cada sección se agrega la
+// primera vez que se pide una clave suya (ver lib/locale-loader.ts)
+const i18n = new I18n({});
 
 // NO setear i18n.locale aquí - será seteado por LanguageProvider después de detectar idioma del sistema
 i18n.defaultLocale = 'en';
 i18n.enableFallback = true;
 
+const stored = new Set<string>();
+
+// i18n-js busca por rutas anidadas: rearma el árbol de una tabla plana
+function nestTable(section: string, table: SectionTable): Record<string, unknown> {
+  const root: Record<string, any> = {};
+  for (const [key, value] of Object.entries(table)) {
+    const parts = key.split('.');
+    let node = (root[section] ??= {});
+    for (const part of parts.slice(0, -1)) {
+      node = node[part] ??= {};
+    }
+    // i18n-js interpola por su cuenta: necesita el texto con {{var}}
+    node[parts[parts.length - 1]] = typeof value === 'string' ? value : interpolate(value);
+  }
+  return root;
+}
+
+// Agrega al store de i18n-js la sección de una clave, si hace falta
+function ensureSection(language: string, section: string): void {
+  const id = `${language}:${section}`;
+  if (stored.has(id)) {
+    return;
+  }
+  stored.add(id);
+  const table = loadSection(language as SectionLanguage, section);
+  if (table) {
+    i18n.store({ [language]: nestTable(section, table) });
+  }
+}
+
 // Función helper para traducir (no reactiva - usar useTranslation en componentes)
 export function t(key: string, options?: object): string {
+  const section = key.split('.', 1)[0];
+  ensureSection(i18n.locale, section);
+  // Con enableFallback, i18n-js busca en defaultLocale lo que falta
+  ensureSection(i18n.defaultLocale, section);
   return i18n.t(key, options);
 }
 
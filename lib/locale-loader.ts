@@ -0,0 +1,102 @@
+/**
+ * Locale Loader - Carga las secciones de los locales a demanda
+ *
+ * Los locales están partidos por idioma y sección en locales/sections/
+ * (scripts/build_locale_bundles.py) como tablas planas (clave dentro de la sección -> texto).
+ * Cada sección se evalúa la primera vez que se pide una clave suya y queda
+ * en memoria; los demás idiomas y secciones nunca se parsean. Los textos
+ * repetidos entre secciones vienen como índices de la tabla de strings del
+ * idioma y se resuelven al cargar la sección, así todas comparten el mismo
+ * string.
+ */
+
+import {
+  LOCALE_SECTIONS,
+  LocaleSection,
+  RawSectionTable,
+  SECTION_LOADERS,
+  STRING_TABLES,
+  SectionLanguage,
+  SectionTable,
+} from './locale-sections';
+
+const loaded: Record<SectionLanguage, Partial<Record<LocaleSection, SectionTable>>> = {
+  es: {},
+  en: {},
+  de: {},
+};
+
+const strings: Partial<Record<SectionLanguage, string[]>> = {};
+
+// Reemplaza los índices de la tabla de strings por los textos
+function resolveStrings(language: SectionLanguage, raw: RawSectionTable): SectionTable {
+  let shared: string[] | undefined;
+  const table: SectionTable = {};
+  for (const key in raw) {
+    const value = raw[key];
+    if (typeof value === 'number') {
+      shared ??= strings[language] ??= STRING_TABLES[language]();
+      table[key] = shared[value];
+    } else {
+      table[key] = value;
+    }
+  }
+  return table;
+}
+
+export function isLocaleSection(section: string): section is LocaleSection {
+  return (LOCALE_SECTIONS as readonly string[]).includes(section);
+}
+
+/**
+ * Sección de un idioma, cargándola si todavía no se usó
+ */
+export function loadSection(language: SectionLanguage, section: string): SectionTable | undefined {
+  const cache = loaded[language];
+  if (!cache) {
+    return undefined;
+  }
+  const cached = cache[section as LocaleSection];
+  if (cached) {
+    return cached;
+  }
+  if (!isLocaleSection(section)) {
+    return undefined;
+  }
+  const loader = SECTION_LOADERS[language][section];
+  if (!loader) {
+    return undefined;
+  }
+  const table = resolveStrings(language, loader());
+  cache[section] = table;
+  return table;
+}
+
+/**
+ * Carga por adelantado las secciones que usa una pantalla
+ */
+export function preloadSections(language: SectionLanguage, sections: readonly LocaleSection[]): void {
+  for (const section of sections) {
+    loadSection(language, section);
+  }
+}
+
+/**
+ * Secciones ya cargadas de un idioma
+ */
+export function loadedSections(language: SectionLanguage): LocaleSection[] {
+  return Object.keys(loaded[language]) as LocaleSection[];
+}
+
+/**
+ * Une las partes precompiladas de un texto con {{var}}. Las posiciones
+ * impares son nombres de placeholder; uno sin valor queda como {{var}}.
+ */
+export function interpolate(parts: string[], params?: Record<string, any>): string {
+  let result = parts[0];
+  for (let i = 1; i < parts.length; i += 2) {
+    const name = parts[i];
+    result += (params?.[name]?.toString() || `{{${name}}}`) + parts[i + 1];
+  }
+  return result;
+}
@@ -0,0 +1,166 @@
+/**
+ * Generado por scripts/build_locale_bundles.py: no editar a mano.
+ * Un require() diferido por idioma y sección de locales/sections/.
+ */
+
+export type SectionLanguage = 'es' | 'en' | 'de';
+
+export const LOCALE_SECTIONS = [
+  'common',
+  'tabs',
+  'actions',
+  'tools',
+  'home',
+  'network_scanner',
+  'toolbox',
+  'fec',
+  'recovery',
+  'commands',
+  'auto_spoof',
+  'safe_test',
+  'diag',
+  'settings',
+  'guides',
+  'success',
+  'alerts',
+  'usb',
+  'onboarding',
+  'eeprom_progress',
+  'chipset',
+  'macros',
+  'safety',
+  'profiles',
+  'logs',
+  'backups',
+  'telnet_scripts',
+  'mib2_state',
+  'installation_guide',
+  'offline_guides',
+  'feedback',
+  'rating',
+  'tos',
+] as const;
+
+export type LocaleSection = (typeof LOCALE_SECTIONS)[number];
+
+// Texto, o partes [texto, placeholder, texto, ...] si tiene {{var}}
+export type SectionValue = string | string[];
+
+export type SectionTable = Record<string, SectionValue>;
+
+// Tal como está en el JSON: un número es un índice de la tabla de strings
+export type RawSectionTable = Record<string, SectionValue | number>;
+
+export const STRING_TABLES: Record<SectionLanguage, () => string[]> = {
+  es: () => require('../locales/sections/es.strings.json'),
+  en: () => require('../locales/sections/en.strings.json'),
+  de: () => require('../locales/sections/de.strings.json'),
+};
+
+export const SECTION_LOADERS: Record<SectionLanguage, Partial<Record<LocaleSection, () => RawSectionTable>>> = {
+  es: {
+    common: () => require('../locales/sections/es/common.json'),
+    tabs: () => require('../locales/sections/es/tabs.json'),
+    actions: () => require('../locales/sections/es/actions.json'),
+    tools: () => require('../locales/sections/es/tools.json'),
+    home: () => require('../locales/sections/es/home.json'),
+    network_scanner: () => require('../locales/sections/es/network_scanner.json'),
+    toolbox: () => require('../locales/sections/es/toolbox.json'),
+    fec: () => require('../locales/sections/es/fec.json'),
+    recovery: () => require('../locales/sections/es/recovery.json'),
+    commands: () => require('../locales/sections/es/commands.json'),
+    auto_spoof: () => require('../locales/sections/es/auto_spoof.json'),
+    safe_test: () => require('../locales/sections/es/safe_test.json'),
+    diag: () => require('../locales/sections/es/diag.json'),
+    settings: () => require('../locales/sections/es/settings.json'),
+    guides: () => require('../locales/sections/es/guides.json'),
+    success: () => require('../locales/sections/es/success.json'),
+    alerts: () => require('../locales/sections/es/alerts.json'),
+    usb: () => require('../locales/sections/es/usb.json'),
+    onboarding: () => require('../locales/sections/es/onboarding.json'),
+    eeprom_progress: () => require('../locales/sections/es/eeprom_progress.json'),
+    chipset: () => require('../locales/sections/es/chipset.json'),
+    macros: () => require('../locales/sections/es/macros.json'),
+    safety: () => require('../locales/sections/es/safety.json'),
+    profiles: () => require('../locales/sections/es/profiles.json'),
+    logs: () => require('../locales/sections/es/logs.json'),
+    backups: () => require('../locales/sections/es/backups.json'),
+    telnet_scripts: () => require('../locales/sections/es/telnet_scripts.json'),
+    mib2_state: () => require('../locales/sections/es/mib2_state.json'),
+    installation_guide: () => require('../locales/sections/es/installation_guide.json'),
+    offline_guides: () => require('../locales/sections/es/offline_guides.json'),
+    feedback: () => require('../locales/sections/es/feedback.json'),
+    rating: () => require('../locales/sections/es/rating.json'),
+    tos: () => require('../locales/sections/es/tos.json'),
+  },
+  en: {
+    common: () => require('../locales/sections/en/common.json'),
+    tabs: () => require('../locales/sections/en/tabs.json'),
+    actions: () => require('../locales/sections/en/actions.json'),
+    tools: () => require('../locales/sections/en/tools.json'),
+    home: () => require('../locales/sections/en/home.json'),
+    network_scanner: () => require('../locales/sections/en/network_scanner.json'),
+    toolbox: () => require('../locales/sections/en/toolbox.json'),
+    fec: () => require('../locales/sections/en/fec.json'),
+    recovery: () => require('../locales/sections/en/recovery.json'),
+    commands: () => require('../locales/sections/en/commands.json'),
+    auto_spoof: () => require('../locales/sections/en/auto_spoof.json'),
+    safe_test: () => require('../locales/sections/en/safe_test.json'),
+    diag: () => require('../locales/sections/en/diag.json'),
+    settings: () => require('../locales/sections/en/settings.json'),
+    guides: () => require('../locales/sections/en/guides.json'),
+    success: () => require('../locales/sections/en/success.json'),
+    alerts: () => require('../locales/sections/en/alerts.json'),
+    usb: () => require('../locales/sections/en/usb.json'),
+    onboarding: () => require('../locales/sections/en/onboarding.json'),
+    eeprom_progress: () => require('../locales/sections/en/eeprom_progress.json'),
+    chipset: () => require('../locales/sections/en/chipset.json'),
+    macros: () => require('../locales/sections/en/macros.json'),
+    safety: () => require('../locales/sections/en/safety.json'),
+    profiles: () => require('../locales/sections/en/profiles.json'),
+    logs: () => require('../locales/sections/en/logs.json'),
+    backups: () => require('../locales/sections/en/backups.json'),
+    telnet_scripts: () => require('../locales/sections/en/telnet_scripts.json'),
+    mib2_state: () => require('../locales/sections/en/mib2_state.json'),
+    installation_guide: () => require('../locales/sections/en/installation_guide.json'),
+    offline_guides: () => require('../locales/sections/en/offline_guides.json'),
+    feedback: () => require('../locales/sections/en/feedback.json'),
+    rating: () => require('../locales/sections/en/rating.json'),
+    tos: () => require('../locales/sections/en/tos.json'),
+  },
+  de: {
+    common: () => require('../locales/sections/de/common.json'),
+    tabs: () => require('../locales/sections/de/tabs.json'),
+    actions: () => require('../locales/sections/de/actions.json'),
+    tools: () => require('../locales/sections/de/tools.json'),
+    home: () => require('../locales/sections/de/home.json'),
+    network_scanner: () => require('../locales/sections/de/network_scanner.json'),
+    toolbox: () => require('../locales/sections/de/toolbox.json'),
+    fec: () => require('../locales/sections/de/fec.json'),
+    recovery: () => require('../locales/sections/de/recovery.json'),
+    commands: () => require('../locales/sections/de/commands.json'),
+    auto_spoof: () => require('../locales/sections/de/auto_spoof.json'),
+    safe_test: () => require('../locales/sections/de/safe_test.json'),
+    diag: () => require('../locales/sections/de/diag.json'),
+    settings: () => require('../locales/sections/de/settings.json'),
+    guides: () => require('../locales/sections/de/guides.json'),
+    success: () => require('../locales/sections/de/success.json'),
+    alerts: () => require('../locales/sections/de/alerts.json'),
+    usb: () => require('../locales/sections/de/usb.json'),
+    onboarding: () => require('../locales/sections/de/onboarding.json'),
+    eeprom_progress: () => require('../locales/sections/de/eeprom_progress.json'),
+    chipset: () => require('../locales/sections/de/chipset.json'),
+    macros: () => require('../locales/sections/de/macros.json'),
+    safety: () => require('../locales/sections/de/safety.json'),
+    profiles: () => require('../locales/sections/de/profiles.json'),
+    logs: () => require('../locales/sections/de/logs.json'),
+    backups: () => require('../locales/sections/de/backups.json'),
+    telnet_scripts: () => require('../locales/sections/de/telnet_scripts.json'),
+    mib2_state: () => require('../locales/sections/de/mib2_state.json'),
+    installation_guide: () => require('../locales/sections/de/installation_guide.json'),
+    offline_guides: () => require('../locales/sections/de/offline_guides.json'),
+    feedback: () => require('../locales/sections/de/feedback.json'),
+    rating: () => require('../locales/sections/de/rating.json'),
+    tos: () => require('../locales/sections/de/tos.json'),
+  },
+};
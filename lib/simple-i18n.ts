@@ -1,20 +1,21 @@
 /**
  * Simple i18n system without external dependencies
- * Uses plain JavaScript objects for translations
+ * Uses flat "section.key" -> string tables, loaded per section on demand
  */
 
-import es from '../locales/es.json';
-import en from '../locales/en.json';
-import de from '../locales/de.json';
+import { interpolate, loadSection } from './locale-loader';
+import type { SectionLanguage } from './locale-sections';
 
-type Translations = typeof es;
-type TranslationKey = keyof Translations;
+// Missing keys already reported, so re-renders don't flood the console
+const warnedKeys = new Set<string>();
 
-const translations: Record<string, Translations> = {
-  es,
-  en,
-  de,
-};
+function warnMissing(key: string, language: string): void {
+  const id = `${language}:${key}`;
+  if (!warnedKeys.has(id)) {
+    warnedKeys.add(id);
+    console.warn(`[simple-i18n] Translation not found: ${key} in ${language}`);
+  }
+}
 
 /**
  * Get translation for a key in a specific language
@@ -24,28 +25,23 @@ export function getTranslation(
   language: string,
   params?: Record<string, any>
 ): string {
-  const languageTranslations = translations[language] || translations.en;
-  
-  // Navigate nested keys (e.g., "home.title")
-  const keys = key.split('.');
-  let value: any = languageTranslations;
-  
-  for (const k of keys) {
-    value = value?.[k];
-    if (value === undefined) {
-      console.warn(`[simple-i18n] Translation not found: ${key} in ${language}`);
-      return key; // Fallback to key itself
-    }
+  const lang = (isSupportedLanguage(language) ? language : 'en') as SectionLanguage;
+
+  // The section is the first part of the key (e.g., "home" in "home.title")
+  // and its flat table is keyed by the rest, so this is a single lookup
+  const dot = key.indexOf('.');
+  const value = dot === -1 ? undefined : loadSection(lang, key.slice(0, dot))?.[key.slice(dot + 1)];
+  if (value === undefined) {
+    warnMissing(key, language);
+    return key; // Fallback to key itself
   }
-  
-  // Handle string interpolation {{variable}}
-  if (typeof value === 'string' && params) {
-    return value.replace(/\{\{(\w+)\}\}/g, (match, paramKey) => {
-      return params[paramKey]?.toString() || match;
-    });
+
+  // Strings with {{variable}} come precompiled as parts: just join them
+  if (typeof value !== 'string') {
+    return interpolate(value, params);
   }
-  
-  return value?.toString() || key;
+
+  return value || key;
 }
 
 /**
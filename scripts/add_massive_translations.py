@@ -1,619 +0,0 @@
-import json
-
-# Cargar archivos de traducción
-with open('locales/es.json', 'r') as f:
-    es = json.load(f)
-with open('locales/en.json', 'r') as f:
-    en = json.load(f)
-with open('locales/de.json', 'r') as f:
-    de = json.load(f)
-
-# Traducciones masivas para todos los archivos lib/*.ts
-translations = {
-    # Chipset compatibility messages
-    'chipset': {
-        'es': {
-            'confirmed_message': '{{chipset}} está confirmado como compatible para spoofing MIB2. Probado y funcionando correctamente.',
-            'experimental_message': '{{chipset}} es experimental. Comparte arquitectura ASIX similar y debería funcionar, pero no está 100% confirmado.',
-            'incompatible_message': '{{chipset}} NO es compatible con spoofing en Android. Requiere herramientas específicas o no soporta modificación de VID/PID.',
-            'unknown_message': '{{chipset}} es desconocido. No hay información sobre compatibilidad para spoofing MIB2.',
-        },
-        'en': {
-            'confirmed_message': '{{chipset}} is confirmed compatible for MIB2 spoofing. Tested and working correctly.',
-            'experimental_message': '{{chipset}} is experimental. Shares similar ASIX architecture and should work, but not 100% confirmed.',
-            'incompatible_message': '{{chipset}} is NOT compatible with Android spoofing. Requires specific tools or does not support VID/PID modification.',
-            'unknown_message': '{{chipset}} is unknown. No compatibility information available for MIB2 spoofing.',
-        },
-        'de': {
-            'confirmed_message': '{{chipset}} ist als kompatibel für MIB2-Spoofing bestätigt. Getestet und funktioniert korrekt.',
-            'experimental_message': '{{chipset}} ist experimentell. Teilt ähnliche ASIX-Architektur und sollte funktionieren, aber nicht 100% bestätigt.',
-            'incompatible_message': '{{chipset}} ist NICHT kompatibel mit Android-Spoofing. Erfordert spezifische Tools oder unterstützt keine VID/PID-Modifikation.',
-            'unknown_message': '{{chipset}} ist unbekannt. Keine Kompatibilitätsinformationen für MIB2-Spoofing verfügbar.',
-        },
-    },
-    # FEC codes and categories
-    'fec': {
-        'es': {
-            'apple_carplay': 'Apple CarPlay',
-            'apple_carplay_desc': 'Activa Apple CarPlay para iPhone',
-            'android_auto': 'Android Auto',
-            'android_auto_desc': 'Activa Android Auto para dispositivos Android',
-            'mirrorlink': 'MirrorLink',
-            'mirrorlink_desc': 'Activa MirrorLink para dispositivos compatibles',
-            'app_connect': 'App-Connect (Full-Link)',
-            'app_connect_desc': 'Activa todas las funciones de App-Connect',
-            'maps_europe': 'Mapas Europa',
-            'maps_europe_desc': 'Activa región de mapas Europa (EU)',
-            'maps_north_america': 'Mapas Norteamérica',
-            'maps_north_america_desc': 'Activa región de mapas Norteamérica (NAR)',
-            'maps_china': 'Mapas China',
-            'maps_china_desc': 'Activa región de mapas China (CN)',
-            'maps_row': 'Mapas Resto del Mundo',
-            'maps_row_desc': 'Activa región de mapas ROW (Rest of World)',
-            'performance_monitor': 'Monitor de Rendimiento',
-            'performance_monitor_desc': 'Activa monitor de rendimiento del vehículo',
-            'vehicle_data_interface': 'Interfaz de Datos del Vehículo',
-            'vehicle_data_interface_desc': 'Interfaz de datos del vehículo',
-            'ambient_light': 'Control de Luz Ambiental',
-            'ambient_light_desc': 'Control de iluminación ambiental',
-            'digital_cockpit': 'Cockpit Digital',
-            'digital_cockpit_desc': 'Activa funciones del cockpit digital',
-            'voice_control': 'Control por Voz',
-            'voice_control_desc': 'Control por voz avanzado',
-            'gesture_control': 'Control por Gestos',
-            'gesture_control_desc': 'Control por gestos',
-            'category_connectivity': 'Conectividad',
-            'category_navigation': 'Navegación',
-            'category_display': 'Pantalla',
-            'category_performance': 'Rendimiento',
-            'category_other': 'Otros',
-            'cmd_mount_filesystem': '# Montar sistema de archivos',
-            'cmd_mount': 'mount -uw /net/rcc/dev/shmem',
-            'cmd_inject_codes': '# Inyectar códigos FEC',
-            'cmd_echo': 'echo "{{code}}" >> /net/rcc/dev/shmem/addfec.txt',
-            'cmd_reboot_apply': '# Reiniciar unidad para aplicar cambios',
-            'cmd_reboot': 'reboot',
-        },
-        'en': {
-            'apple_carplay': 'Apple CarPlay',
-            'apple_carplay_desc': 'Enables Apple CarPlay for iPhone',
-            'android_auto': 'Android Auto',
-            'android_auto_desc': 'Enables Android Auto for Android devices',
-            'mirrorlink': 'MirrorLink',
-            'mirrorlink_desc': 'Enables MirrorLink for compatible devices',
-            'app_connect': 'App-Connect (Full-Link)',
-            'app_connect_desc': 'Enables all App-Connect features',
-            'maps_europe': 'Europe Maps',
-            'maps_europe_desc': 'Enables Europe map region (EU)',
-            'maps_north_america': 'North America Maps',
-            'maps_north_america_desc': 'Enables North America map region (NAR)',
-            'maps_china': 'China Maps',
-            'maps_china_desc': 'Enables China map region (CN)',
-            'maps_row': 'Rest of World Maps',
-            'maps_row_desc': 'Enables ROW map region (Rest of World)',
-            'performance_monitor': 'Performance Monitor',
-            'performance_monitor_desc': 'Enables vehicle performance monitor',
-            'vehicle_data_interface': 'Vehicle Data Interface',
-            'vehicle_data_interface_desc': 'Vehicle data interface',
-            'ambient_light': 'Ambient Light Control',
-            'ambient_light_desc': 'Ambient lighting control',
-            'digital_cockpit': 'Digital Cockpit',
-            'digital_cockpit_desc': 'Enables digital cockpit features',
-            'voice_control': 'Voice Control',
-            'voice_control_desc': 'Advanced voice control',
-            'gesture_control': 'Gesture Control',
-            'gesture_control_desc': 'Gesture control',
-            'category_connectivity': 'Connectivity',
-            'category_navigation': 'Navigation',
-            'category_display': 'Display',
-            'category_performance': 'Performance',
-            'category_other': 'Other',
-            'cmd_mount_filesystem': '# Mount filesystem',
-            'cmd_mount': 'mount -uw /net/rcc/dev/shmem',
-            'cmd_inject_codes': '# Inject FEC codes',
-            'cmd_echo': 'echo "{{code}}" >> /net/rcc/dev/shmem/addfec.txt',
-            'cmd_reboot_apply': '# Reboot unit to apply changes',
-            'cmd_reboot': 'reboot',
-        },
-        'de': {
-            'apple_carplay': 'Apple CarPlay',
-            'apple_carplay_desc': 'Aktiviert Apple CarPlay für iPhone',
-            'android_auto': 'Android Auto',
-            'android_auto_desc': 'Aktiviert Android Auto für Android-Geräte',
-            'mirrorlink': 'MirrorLink',
-            'mirrorlink_desc': 'Aktiviert MirrorLink für kompatible Geräte',
-            'app_connect': 'App-Connect (Full-Link)',
-            'app_connect_desc': 'Aktiviert alle App-Connect-Funktionen',
-            'maps_europe': 'Europa-Karten',
-            'maps_europe_desc': 'Aktiviert Europa-Kartenregion (EU)',
-            'maps_north_america': 'Nordamerika-Karten',
-            'maps_north_america_desc': 'Aktiviert Nordamerika-Kartenregion (NAR)',
-            'maps_china': 'China-Karten',
-            'maps_china_desc': 'Aktiviert China-Kartenregion (CN)',
-            'maps_row': 'Rest der Welt-Karten',
-            'maps_row_desc': 'Aktiviert ROW-Kartenregion (Rest der Welt)',
-            'performance_monitor': 'Leistungsmonitor',
-            'performance_monitor_desc': 'Aktiviert Fahrzeugleistungsmonitor',
-            'vehicle_data_interface': 'Fahrzeugdatenschnittstelle',
-            'vehicle_data_interface_desc': 'Fahrzeugdatenschnittstelle',
-            'ambient_light': 'Ambientebeleuchtung',
-            'ambient_light_desc': 'Ambientebeleuchtungssteuerung',
-            'digital_cockpit': 'Digitales Cockpit',
-            'digital_cockpit_desc': 'Aktiviert digitale Cockpit-Funktionen',
-            'voice_control': 'Sprachsteuerung',
-            'voice_control_desc': 'Erweiterte Sprachsteuerung',
-            'gesture_control': 'Gestensteuerung',
-            'gesture_control_desc': 'Gestensteuerung',
-            'category_connectivity': 'Konnektivität',
-            'category_navigation': 'Navigation',
-            'category_display': 'Anzeige',
-            'category_performance': 'Leistung',
-            'category_other': 'Sonstiges',
-            'cmd_mount_filesystem': '# Dateisystem mounten',
-            'cmd_mount': 'mount -uw /net/rcc/dev/shmem',
-            'cmd_inject_codes': '# FEC-Codes injizieren',
-            'cmd_echo': 'echo "{{code}}" >> /net/rcc/dev/shmem/addfec.txt',
-            'cmd_reboot_apply': '# Gerät neu starten um Änderungen anzuwenden',
-            'cmd_reboot': 'reboot',
-        },
-    },
-    # Macros
-    'macros': {
-        'es': {
-            'full_backup': 'Backup Completo',
-            'full_backup_desc': 'Crea un backup completo de adaptaciones y configuración',
-            'backup_adaptations': 'Backup de Adaptaciones',
-            'backup_adaptations_desc': 'Crea un backup solo de las adaptaciones',
-            'enable_all_features': 'Activar Todas las Características',
-            'enable_all_features_desc': 'Activa Green Menu, Video en Movimiento y líneas guía de cámara',
-            'safe_adaptations': 'Adaptaciones Seguras',
-            'safe_adaptations_desc': 'Activa solo adaptaciones seguras (Green Menu y líneas guía)',
-            'system_health_check': 'Chequeo de Salud del Sistema',
-            'system_health_check_desc': 'Verifica memoria, disco, temperatura y procesos',
-            'network_diagnostic': 'Diagnóstico de Red',
-            'network_diagnostic_desc': 'Verifica configuración de red y conectividad',
-            'firmware_info': 'Información de Firmware',
-            'firmware_info_desc': 'Obtiene información detallada del firmware y hardware',
-            'cleanup_system': 'Limpieza del Sistema',
-            'cleanup_system_desc': 'Limpia archivos temporales y logs antiguos',
-            'category_backup': 'Backup',
-            'category_adaptation': 'Adaptaciones',
-            'category_diagnostic': 'Diagnóstico',
-            'category_maintenance': 'Mantenimiento',
-            'category_custom': 'Personalizado',
-            'step_get_date': 'Obtener fecha actual',
-            'step_create_backup_dir': 'Crear directorio de backups',
-            'step_backup_adaptations': 'Backup de adaptaciones',
-            'step_backup_skin': 'Backup de configuración de skin',
-            'step_verify_backups': 'Verificar backups creados',
-            'step_copy_adaptations': 'Copiar adaptaciones',
-            'step_list_backups': 'Listar backups',
-            'step_safety_backup': 'Backup de seguridad',
-            'step_enable_green_menu': 'Activar Green Menu',
-            'step_enable_vim': 'Activar Video en Movimiento',
-            'step_enable_camera_guidelines': 'Activar líneas guía de cámara',
-            'step_verify_adaptations': 'Verificar adaptaciones',
-            'step_verify_green_menu': 'Verificar Green Menu',
-            'step_check_memory': 'Verificar uso de memoria',
-            'step_check_disk': 'Verificar espacio en disco',
-            'step_check_temp': 'Verificar temperatura',
-            'step_list_processes': 'Listar procesos principales',
-            'step_check_uptime': 'Verificar tiempo de actividad',
-            'step_show_interfaces': 'Mostrar interfaces de red',
-            'step_show_routes': 'Mostrar tabla de rutas',
-            'step_show_dns': 'Mostrar servidores DNS',
-            'step_test_gateway': 'Probar conectividad con gateway',
-            'step_fw_version': 'Versión de firmware',
-            'step_hw_version': 'Versión de hardware',
-            'step_serial_number': 'Número de serie',
-            'step_system_info': 'Información del sistema',
-            'step_check_space_before': 'Verificar espacio antes de limpiar',
-            'step_clean_temp': 'Limpiar archivos temporales',
-            'step_delete_old_logs': 'Eliminar logs antiguos (>7 días)',
-            'step_check_space_after': 'Verificar espacio después de limpiar',
-        },
-        'en': {
-            'full_backup': 'Full Backup',
-            'full_backup_desc': 'Creates a complete backup of adaptations and configuration',
-            'backup_adaptations': 'Adaptations Backup',
-            'backup_adaptations_desc': 'Creates a backup of adaptations only',
-            'enable_all_features': 'Enable All Features',
-            'enable_all_features_desc': 'Enables Green Menu, Video in Motion and camera guidelines',
-            'safe_adaptations': 'Safe Adaptations',
-            'safe_adaptations_desc': 'Enables only safe adaptations (Green Menu and guidelines)',
-            'system_health_check': 'System Health Check',
-            'system_health_check_desc': 'Checks memory, disk, temperature and processes',
-            'network_diagnostic': 'Network Diagnostic',
-            'network_diagnostic_desc': 'Checks network configuration and connectivity',
-            'firmware_info': 'Firmware Information',
-            'firmware_info_desc': 'Gets detailed firmware and hardware information',
-            'cleanup_system': 'System Cleanup',
-            'cleanup_system_desc': 'Cleans temporary files and old logs',
-            'category_backup': 'Backup',
-            'category_adaptation': 'Adaptations',
-            'category_diagnostic': 'Diagnostic',
-            'category_maintenance': 'Maintenance',
-            'category_custom': 'Custom',
-            'step_get_date': 'Get current date',
-            'step_create_backup_dir': 'Create backup directory',
-            'step_backup_adaptations': 'Backup adaptations',
-            'step_backup_skin': 'Backup skin configuration',
-            'step_verify_backups': 'Verify created backups',
-            'step_copy_adaptations': 'Copy adaptations',
-            'step_list_backups': 'List backups',
-            'step_safety_backup': 'Safety backup',
-            'step_enable_green_menu': 'Enable Green Menu',
-            'step_enable_vim': 'Enable Video in Motion',
-            'step_enable_camera_guidelines': 'Enable camera guidelines',
-            'step_verify_adaptations': 'Verify adaptations',
-            'step_verify_green_menu': 'Verify Green Menu',
-            'step_check_memory': 'Check memory usage',
-            'step_check_disk': 'Check disk space',
-            'step_check_temp': 'Check temperature',
-            'step_list_processes': 'List main processes',
-            'step_check_uptime': 'Check uptime',
-            'step_show_interfaces': 'Show network interfaces',
-            'step_show_routes': 'Show routing table',
-            'step_show_dns': 'Show DNS servers',
-            'step_test_gateway': 'Test gateway connectivity',
-            'step_fw_version': 'Firmware version',
-            'step_hw_version': 'Hardware version',
-            'step_serial_number': 'Serial number',
-            'step_system_info': 'System information',
-            'step_check_space_before': 'Check space before cleanup',
-            'step_clean_temp': 'Clean temporary files',
-            'step_delete_old_logs': 'Delete old logs (>7 days)',
-            'step_check_space_after': 'Check space after cleanup',
-        },
-        'de': {
-            'full_backup': 'Vollständiges Backup',
-            'full_backup_desc': 'Erstellt ein vollständiges Backup von Adaptionen und Konfiguration',
-            'backup_adaptations': 'Adaptionen-Backup',
-            'backup_adaptations_desc': 'Erstellt ein Backup nur der Adaptionen',
-            'enable_all_features': 'Alle Funktionen aktivieren',
-            'enable_all_features_desc': 'Aktiviert Green Menu, Video in Bewegung und Kamera-Hilfslinien',
-            'safe_adaptations': 'Sichere Adaptionen',
-            'safe_adaptations_desc': 'Aktiviert nur sichere Adaptionen (Green Menu und Hilfslinien)',
-            'system_health_check': 'System-Gesundheitscheck',
-            'system_health_check_desc': 'Überprüft Speicher, Festplatte, Temperatur und Prozesse',
-            'network_diagnostic': 'Netzwerkdiagnose',
-            'network_diagnostic_desc': 'Überprüft Netzwerkkonfiguration und Konnektivität',
-            'firmware_info': 'Firmware-Informationen',
-            'firmware_info_desc': 'Ruft detaillierte Firmware- und Hardware-Informationen ab',
-            'cleanup_system': 'Systemreinigung',
-            'cleanup_system_desc': 'Bereinigt temporäre Dateien und alte Logs',
-            'category_backup': 'Backup',
-            'category_adaptation': 'Adaptionen',
-            'category_diagnostic': 'Diagnose',
-            'category_maintenance': 'Wartung',
-            'category_custom': 'Benutzerdefiniert',
-            'step_get_date': 'Aktuelles Datum abrufen',
-            'step_create_backup_dir': 'Backup-Verzeichnis erstellen',
-            'step_backup_adaptations': 'Adaptionen sichern',
-            'step_backup_skin': 'Skin-Konfiguration sichern',
-            'step_verify_backups': 'Erstellte Backups überprüfen',
-            'step_copy_adaptations': 'Adaptionen kopieren',
-            'step_list_backups': 'Backups auflisten',
-            'step_safety_backup': 'Sicherheits-Backup',
-            'step_enable_green_menu': 'Green Menu aktivieren',
-            'step_enable_vim': 'Video in Bewegung aktivieren',
-            'step_enable_camera_guidelines': 'Kamera-Hilfslinien aktivieren',
-            'step_verify_adaptations': 'Adaptionen überprüfen',
-            'step_verify_green_menu': 'Green Menu überprüfen',
-            'step_check_memory': 'Speichernutzung prüfen',
-            'step_check_disk': 'Festplattenplatz prüfen',
-            'step_check_temp': 'Temperatur prüfen',
-            'step_list_processes': 'Hauptprozesse auflisten',
-            'step_check_uptime': 'Betriebszeit prüfen',
-            'step_show_interfaces': 'Netzwerkschnittstellen anzeigen',
-            'step_show_routes': 'Routing-Tabelle anzeigen',
-            'step_show_dns': 'DNS-Server anzeigen',
-            'step_test_gateway': 'Gateway-Konnektivität testen',
-            'step_fw_version': 'Firmware-Version',
-            'step_hw_version': 'Hardware-Version',
-            'step_serial_number': 'Seriennummer',
-            'step_system_info': 'Systeminformationen',
-            'step_check_space_before': 'Speicherplatz vor Bereinigung prüfen',
-            'step_clean_temp': 'Temporäre Dateien bereinigen',
-            'step_delete_old_logs': 'Alte Logs löschen (>7 Tage)',
-            'step_check_space_after': 'Speicherplatz nach Bereinigung prüfen',
-        },
-    },
-    # Commands
-    'commands': {
-        'es': {
-            'firmware_version': 'Versión de Firmware',
-            'firmware_version_desc': 'Obtiene la versión actual del firmware instalado',
-            'system_info': 'Información del Sistema',
-            'system_info_desc': 'Muestra información del sistema operativo QNX',
-            'cpu_info': 'Información de CPU',
-            'cpu_info_desc': 'Muestra información del procesador',
-            'serial_number': 'Número de Serie',
-            'serial_number_desc': 'Obtiene el número de serie de la unidad',
-            'hardware_version': 'Versión de Hardware',
-            'hardware_version_desc': 'Muestra la versión de hardware de la unidad',
-            'memory_info': 'Uso de Memoria',
-            'memory_info_desc': 'Muestra el uso actual de memoria',
-            'mounted_devices': 'Dispositivos Montados',
-            'mounted_devices_desc': 'Lista todos los dispositivos y puntos de montaje',
-            'network_interfaces': 'Interfaces de Red',
-            'network_interfaces_desc': 'Muestra configuración de interfaces de red',
-            'running_processes': 'Procesos en Ejecución',
-            'running_processes_desc': 'Lista todos los procesos activos',
-            'disk_usage': 'Uso de Disco',
-            'disk_usage_desc': 'Muestra el uso de espacio en disco',
-            'temperature': 'Temperatura del Sistema',
-            'temperature_desc': 'Muestra la temperatura actual del sistema',
-            'list_adaptations': 'Listar Adaptaciones',
-            'list_adaptations_desc': 'Lista todas las adaptaciones disponibles',
-            'backup_adaptations': 'Backup de Adaptaciones',
-            'backup_adaptations_desc': 'Crea un backup de las adaptaciones actuales',
-            'backup_adaptations_notes': 'Recomendado antes de modificar adaptaciones',
-            'enable_green_menu': 'Habilitar Menú Verde',
-            'enable_green_menu_desc': 'Activa el menú de ingeniería (Green Menu)',
-            'enable_green_menu_notes': 'Permite acceso a funciones de diagnóstico avanzadas',
-            'disable_green_menu': 'Deshabilitar Menú Verde',
-            'disable_green_menu_desc': 'Desactiva el menú de ingeniería (Green Menu)',
-            'enable_vim': 'Video en Movimiento',
-            'enable_vim_desc': 'Permite reproducir video mientras el vehículo está en movimiento',
-            'enable_vim_notes': '⚠️ ADVERTENCIA: Puede ser ilegal en tu jurisdicción',
-            'enable_camera_guidelines': 'Líneas Guía de Cámara',
-            'enable_camera_guidelines_desc': 'Activa las líneas guía en la cámara de reversa',
-            'list_skins': 'Listar Skins Disponibles',
-            'list_skins_desc': 'Lista todos los skins instalados',
-            'current_skin': 'Skin Actual',
-            'current_skin_desc': 'Muestra el skin actualmente activo',
-            'backup_skin': 'Backup de Skin',
-            'backup_skin_desc': 'Crea un backup del skin actual',
-            'restore_default_skin': 'Restaurar Skin por Defecto',
-            'restore_default_skin_desc': 'Restaura el skin de fábrica',
-            'wifi_status': 'Estado de WiFi',
-            'wifi_status_desc': 'Muestra el estado de la conexión WiFi',
-            'network_routes': 'Rutas de Red',
-            'network_routes_desc': 'Muestra la tabla de rutas de red',
-            'ping_gateway': 'Ping a Gateway',
-            'ping_gateway_desc': 'Prueba conectividad con el gateway',
-            'dns_servers': 'Servidores DNS',
-            'dns_servers_desc': 'Muestra los servidores DNS configurados',
-            'list_root': 'Listar Directorio Raíz',
-            'list_root_desc': 'Lista el contenido del directorio raíz',
-            'list_persist': 'Listar Partición Persist',
-            'list_persist_desc': 'Lista archivos en la partición de persistencia',
-            'list_system': 'Listar Partición System',
-            'list_system_desc': 'Lista archivos en la partición del sistema',
-            'disk_partitions': 'Particiones de Disco',
-            'disk_partitions_desc': 'Muestra información de particiones',
-            'reboot_system': 'Reiniciar Sistema',
-            'reboot_system_desc': 'Reinicia la unidad MIB2',
-            'reboot_system_notes': 'El sistema se reiniciará inmediatamente',
-            'kill_process': 'Terminar Proceso',
-            'kill_process_desc': 'Termina un proceso específico (requiere PID)',
-            'kill_process_notes': 'Reemplaza <PID> con el ID del proceso',
-            'clear_logs': 'Limpiar Logs del Sistema',
-            'clear_logs_desc': 'Elimina los archivos de log del sistema',
-            'factory_reset': 'Reset de Fábrica (Adaptaciones)',
-            'factory_reset_desc': 'Restaura todas las adaptaciones a valores de fábrica',
-            'factory_reset_notes': '⚠️ CRÍTICO: Esto eliminará todas las adaptaciones personalizadas',
-            'category_information': 'Información',
-            'category_diagnostic': 'Diagnóstico',
-            'category_configuration': 'Configuración',
-            'category_adaptation': 'Adaptaciones',
-            'category_skin': 'Skins',
-            'category_network': 'Red',
-            'category_filesystem': 'Sistema de Archivos',
-            'category_advanced': 'Avanzado',
-            'risk_safe': 'Seguro',
-            'risk_moderate': 'Moderado',
-            'risk_high': 'Alto',
-            'risk_critical': 'Crítico',
-            'risk_unknown': 'Desconocido',
-            'category_unknown': 'Desconocido',
-        },
-        'en': {
-            'firmware_version': 'Firmware Version',
-            'firmware_version_desc': 'Gets the current installed firmware version',
-            'system_info': 'System Information',
-            'system_info_desc': 'Shows QNX operating system information',
-            'cpu_info': 'CPU Information',
-            'cpu_info_desc': 'Shows processor information',
-            'serial_number': 'Serial Number',
-            'serial_number_desc': 'Gets the unit serial number',
-            'hardware_version': 'Hardware Version',
-            'hardware_version_desc': 'Shows the unit hardware version',
-            'memory_info': 'Memory Usage',
-            'memory_info_desc': 'Shows current memory usage',
-            'mounted_devices': 'Mounted Devices',
-            'mounted_devices_desc': 'Lists all devices and mount points',
-            'network_interfaces': 'Network Interfaces',
-            'network_interfaces_desc': 'Shows network interface configuration',
-            'running_processes': 'Running Processes',
-            'running_processes_desc': 'Lists all active processes',
-            'disk_usage': 'Disk Usage',
-            'disk_usage_desc': 'Shows disk space usage',
-            'temperature': 'System Temperature',
-            'temperature_desc': 'Shows current system temperature',
-            'list_adaptations': 'List Adaptations',
-            'list_adaptations_desc': 'Lists all available adaptations',
-            'backup_adaptations': 'Backup Adaptations',
-            'backup_adaptations_desc': 'Creates a backup of current adaptations',
-            'backup_adaptations_notes': 'Recommended before modifying adaptations',
-            'enable_green_menu': 'Enable Green Menu',
-            'enable_green_menu_desc': 'Activates the engineering menu (Green Menu)',
-            'enable_green_menu_notes': 'Allows access to advanced diagnostic functions',
-            'disable_green_menu': 'Disable Green Menu',
-            'disable_green_menu_desc': 'Deactivates the engineering menu (Green Menu)',
-            'enable_vim': 'Video in Motion',
-            'enable_vim_desc': 'Allows video playback while vehicle is moving',
-            'enable_vim_notes': '⚠️ WARNING: May be illegal in your jurisdiction',
-            'enable_camera_guidelines': 'Camera Guidelines',
-            'enable_camera_guidelines_desc': 'Activates guidelines on reverse camera',
-            'list_skins': 'List Available Skins',
-            'list_skins_desc': 'Lists all installed skins',
-            'current_skin': 'Current Skin',
-            'current_skin_desc': 'Shows the currently active skin',
-            'backup_skin': 'Backup Skin',
-            'backup_skin_desc': 'Creates a backup of current skin',
-            'restore_default_skin': 'Restore Default Skin',
-            'restore_default_skin_desc': 'Restores factory skin',
-            'wifi_status': 'WiFi Status',
-            'wifi_status_desc': 'Shows WiFi connection status',
-            'network_routes': 'Network Routes',
-            'network_routes_desc': 'Shows network routing table',
-            'ping_gateway': 'Ping Gateway',
-            'ping_gateway_desc': 'Tests gateway connectivity',
-            'dns_servers': 'DNS Servers',
-            'dns_servers_desc': 'Shows configured DNS servers',
-            'list_root': 'List Root Directory',
-            'list_root_desc': 'Lists root directory contents',
-            'list_persist': 'List Persist Partition',
-            'list_persist_desc': 'Lists files in persistence partition',
-            'list_system': 'List System Partition',
-            'list_system_desc': 'Lists files in system partition',
-            'disk_partitions': 'Disk Partitions',
-            'disk_partitions_desc': 'Shows partition information',
-            'reboot_system': 'Reboot System',
-            'reboot_system_desc': 'Reboots the MIB2 unit',
-            'reboot_system_notes': 'System will reboot immediately',
-            'kill_process': 'Kill Process',
-            'kill_process_desc': 'Terminates a specific process (requires PID)',
-            'kill_process_notes': 'Replace <PID> with process ID',
-            'clear_logs': 'Clear System Logs',
-            'clear_logs_desc': 'Deletes system log files',
-            'factory_reset': 'Factory Reset (Adaptations)',
-            'factory_reset_desc': 'Restores all adaptations to factory values',
-            'factory_reset_notes': '⚠️ CRITICAL: This will delete all custom adaptations',
-            'category_information': 'Information',
-            'category_diagnostic': 'Diagnostic',
-            'category_configuration': 'Configuration',
-            'category_adaptation': 'Adaptations',
-            'category_skin': 'Skins',
-            'category_network': 'Network',
-            'category_filesystem': 'Filesystem',
-            'category_advanced': 'Advanced',
-            'risk_safe': 'Safe',
-            'risk_moderate': 'Moderate',
-            'risk_high': 'High',
-            'risk_critical': 'Critical',
-            'risk_unknown': 'Unknown',
-            'category_unknown': 'Unknown',
-        },
-        'de': {
-            'firmware_version': 'Firmware-Version',
-            'firmware_version_desc': 'Ruft die aktuelle installierte Firmware-Version ab',
-            'system_info': 'Systeminformationen',
-            'system_info_desc': 'Zeigt QNX-Betriebssysteminformationen',
-            'cpu_info': 'CPU-Informationen',
-            'cpu_info_desc': 'Zeigt Prozessorinformationen',
-            'serial_number': 'Seriennummer',
-            'serial_number_desc': 'Ruft die Seriennummer der Einheit ab',
-            'hardware_version': 'Hardware-Version',
-            'hardware_version_desc': 'Zeigt die Hardware-Version der Einheit',
-            'memory_info': 'Speichernutzung',
-            'memory_info_desc': 'Zeigt aktuelle Speichernutzung',
-            'mounted_devices': 'Gemountete Geräte',
-            'mounted_devices_desc': 'Listet alle Geräte und Einhängepunkte',
-            'network_interfaces': 'Netzwerkschnittstellen',
-            'network_interfaces_desc': 'Zeigt Netzwerkschnittstellenkonfiguration',
-            'running_processes': 'Laufende Prozesse',
-            'running_processes_desc': 'Listet alle aktiven Prozesse',
-            'disk_usage': 'Festplattennutzung',
-            'disk_usage_desc': 'Zeigt Festplattenplatznutzung',
-            'temperature': 'Systemtemperatur',
-            'temperature_desc': 'Zeigt aktuelle Systemtemperatur',
-            'list_adaptations': 'Adaptionen auflisten',
-            'list_adaptations_desc': 'Listet alle verfügbaren Adaptionen',
-            'backup_adaptations': 'Adaptionen sichern',
-            'backup_adaptations_desc': 'Erstellt ein Backup der aktuellen Adaptionen',
-            'backup_adaptations_notes': 'Empfohlen vor Änderung von Adaptionen',
-            'enable_green_menu': 'Green Menu aktivieren',
-            'enable_green_menu_desc': 'Aktiviert das Engineering-Menü (Green Menu)',
-            'enable_green_menu_notes': 'Ermöglicht Zugang zu erweiterten Diagnosefunktionen',
-            'disable_green_menu': 'Green Menu deaktivieren',
-            'disable_green_menu_desc': 'Deaktiviert das Engineering-Menü (Green Menu)',
-            'enable_vim': 'Video in Bewegung',
-            'enable_vim_desc': 'Ermöglicht Videowiedergabe während der Fahrt',
-            'enable_vim_notes': '⚠️ WARNUNG: Kann in Ihrer Gerichtsbarkeit illegal sein',
-            'enable_camera_guidelines': 'Kamera-Hilfslinien',
-            'enable_camera_guidelines_desc': 'Aktiviert Hilfslinien bei der Rückfahrkamera',
-            'list_skins': 'Verfügbare Skins auflisten',
-            'list_skins_desc': 'Listet alle installierten Skins',
-            'current_skin': 'Aktueller Skin',
-            'current_skin_desc': 'Zeigt den aktuell aktiven Skin',
-            'backup_skin': 'Skin sichern',
-            'backup_skin_desc': 'Erstellt ein Backup des aktuellen Skins',
-            'restore_default_skin': 'Standard-Skin wiederherstellen',
-            'restore_default_skin_desc': 'Stellt den Werks-Skin wieder her',
-            'wifi_status': 'WLAN-Status',
-            'wifi_status_desc': 'Zeigt WLAN-Verbindungsstatus',
-            'network_routes': 'Netzwerkrouten',
-            'network_routes_desc': 'Zeigt Netzwerk-Routing-Tabelle',
-            'ping_gateway': 'Gateway anpingen',
-            'ping_gateway_desc': 'Testet Gateway-Konnektivität',
-            'dns_servers': 'DNS-Server',
-            'dns_servers_desc': 'Zeigt konfigurierte DNS-Server',
-            'list_root': 'Stammverzeichnis auflisten',
-            'list_root_desc': 'Listet Stammverzeichnisinhalt',
-            'list_persist': 'Persist-Partition auflisten',
-            'list_persist_desc': 'Listet Dateien in Persistenz-Partition',
-            'list_system': 'System-Partition auflisten',
-            'list_system_desc': 'Listet Dateien in System-Partition',
-            'disk_partitions': 'Festplattenpartitionen',
-            'disk_partitions_desc': 'Zeigt Partitionsinformationen',
-            'reboot_system': 'System neu starten',
-            'reboot_system_desc': 'Startet die MIB2-Einheit neu',
-            'reboot_system_notes': 'System wird sofort neu gestartet',
-            'kill_process': 'Prozess beenden',
-            'kill_process_desc': 'Beendet einen bestimmten Prozess (erfordert PID)',
-            'kill_process_notes': 'Ersetzen Sie <PID> durch die Prozess-ID',
-            'clear_logs': 'System-Logs löschen',
-            'clear_logs_desc': 'Löscht System-Log-Dateien',
-            'factory_reset': 'Werksreset (Adaptionen)',
-            'factory_reset_desc': 'Setzt alle Adaptionen auf Werkswerte zurück',
-            'factory_reset_notes': '⚠️ KRITISCH: Dies löscht alle benutzerdefinierten Adaptionen',
-            'category_information': 'Information',
-            'category_diagnostic': 'Diagnose',
-            'category_configuration': 'Konfiguration',
-            'category_adaptation': 'Adaptionen',
-            'category_skin': 'Skins',
-            'category_network': 'Netzwerk',
-            'category_filesystem': 'Dateisystem',
-            'category_advanced': 'Erweitert',
-            'risk_safe': 'Sicher',
-            'risk_moderate': 'Moderat',
-            'risk_high': 'Hoch',
-            'risk_critical': 'Kritisch',
-            'risk_unknown': 'Unbekannt',
-            'category_unknown': 'Unbekannt',
-        },
-    },
-}
-
-# Agregar traducciones
-for section, langs in translations.items():
-    if section not in es:
-        es[section] = {}
-    if section not in en:
-        en[section] = {}
-    if section not in de:
-        de[section] = {}
-    
-    for key, value in langs['es'].items():
-        es[section][key] = value
-    for key, value in langs['en'].items():
-        en[section][key] = value
-    for key, value in langs['de'].items():
-        de[section][key] = value
-
-# Guardar archivos
-with open('locales/es.json', 'w') as f:
-    json.dump(es, f, ensure_ascii=False, indent=2)
-with open('locales/en.json', 'w') as f:
-    json.dump(en, f, ensure_ascii=False, indent=2)
-with open('locales/de.json', 'w') as f:
-    json.dump(de, f, ensure_ascii=False, indent=2)
-
-print("Traducciones masivas agregadas exitosamente!")
-print(f"- chipset: {len(translations['chipset']['es'])} claves")
-print(f"- fec: {len(translations['fec']['es'])} claves")
-print(f"- macros: {len(translations['macros']['es'])} claves")
-print(f"- commands: {len(translations['commands']['es'])} claves")
@@ -1,342 +0,0 @@
-import json
-
-# Cargar archivos
-with open('locales/es.json', 'r') as f:
-    es = json.load(f)
-with open('locales/en.json', 'r') as f:
-    en = json.load(f)
-with open('locales/de.json', 'r') as f:
-    de = json.load(f)
-
-# Traducciones de safety-validator
-safety_es = {
-    # Hardware descriptions
-    'hw_790_desc': 'MIB2 STD2 Base (sin letra)',
-    'hw_790a_desc': 'MIB2 STD2 Revisión A',
-    'hw_790b_desc': 'MIB2 STD2 Revisión B',
-    'hw_790b_plus_desc': 'MIB2 STD2 Revisión B+ (Vista Sport)',
-    
-    # Capabilities
-    'cap_basic_digital': 'Cuadro digital básico',
-    'cap_carbon_skin_v2': 'Compatible con skin Carbono (Variante 2)',
-    'cap_vcds_standard': 'Soporte para modificaciones VCDS estándar',
-    'cap_improved_digital': 'Cuadro digital mejorado',
-    'cap_vcds_full': 'Soporte completo para VCDS',
-    'cap_advanced_digital': 'Cuadro digital avanzado',
-    'cap_carbon_cupra_skins': 'Compatible con skins Carbono y Cupra (Variantes 2 y 3)',
-    'cap_vista_sport_digital': 'Cuadro digital con Vista Sport',
-    'cap_all_skins': 'Compatible con todos los skins',
-    'cap_native_perf_monitor': 'Performance Monitor nativo',
-    
-    # Firmware features
-    'feat_toolbox_support': 'Soporte para MIB2 Toolbox',
-    'feat_fec_compatible': 'Compatible con códigos FEC',
-    'feat_vcds_standard': 'Modificaciones VCDS estándar',
-    'feat_toolbox_improved': 'Soporte mejorado para MIB2 Toolbox',
-    'feat_vcds_full': 'Modificaciones VCDS completas',
-    'feat_latest_stable': 'Última versión estable',
-    'feat_toolbox_full': 'Soporte completo para MIB2 Toolbox',
-    'issue_1sd_no_signature': 'Algunas unidades 1-SD carecen de rutinas de validación de firmas',
-    
-    # Validation titles and messages
-    'unknown_hardware_title': 'Hardware Desconocido',
-    'unknown_hardware_message': 'El número de parte "{{partNumber}}" no está en la base de datos de hardware conocido.',
-    'unknown_hardware_details': 'Las modificaciones pueden funcionar, pero no hay garantía de compatibilidad completa.',
-    'limited_hardware_title': 'Hardware con Limitaciones',
-    'limited_hardware_message': 'Hardware {{description}} identificado con limitaciones conocidas.',
-    'hardware_capabilities': 'Capacidades del hardware',
-    'compatible_hardware_title': 'Hardware Compatible',
-    'compatible_hardware_message': 'Hardware {{description}} identificado correctamente.',
-    
-    'unknown_firmware_title': 'Firmware Desconocido',
-    'unknown_firmware_message': 'La versión de firmware "{{version}}" no está en la base de datos.',
-    'firmware_issues_title': 'Firmware con Problemas Conocidos',
-    'firmware_issues_message': 'Firmware {{version}} tiene problemas conocidos.',
-    'firmware_features': 'Características del firmware',
-    'compatible_firmware_title': 'Firmware Compatible',
-    'compatible_firmware_message': 'Firmware {{version}} identificado correctamente.',
-    
-    'unidentified_hardware_title': 'Hardware No Identificado',
-    'unidentified_hardware_message': 'No se puede validar la compatibilidad de códigos FEC sin identificar el hardware.',
-    'unidentified_firmware_title': 'Firmware No Identificado',
-    'unidentified_firmware_message': 'No se puede garantizar que el método de inyección funcione con este firmware.',
-    
-    'fec_validation_title': 'Validación de Inyección FEC',
-    'fec_validation_message': 'La inyección de códigos FEC sortea la validación de firmware digital de VW AG.',
-    'fec_technical_details': 'El método de parcheo modifica el binario del sistema para alterar la rutina de verificación de firmas.',
-    
-    # Recommendations
-    'rec_verify_part_number': 'Verificar el número de parte en la etiqueta de la unidad',
-    'rec_check_manual': 'Consultar el manual del vehículo para confirmar la versión',
-    'rec_proceed_caution': 'Proceder con precaución al aplicar modificaciones',
-    'rec_verify_firmware': 'Verificar la versión de firmware en el menú del sistema',
-    'rec_check_vw_docs': 'Consultar la documentación oficial de VW',
-    'rec_consider_update': 'Considerar actualizar a una versión conocida',
-    'rec_identify_hardware': 'Identificar el número de parte del hardware',
-    'rec_verify_compatibility': 'Verificar la compatibilidad antes de inyectar códigos',
-    'rec_identify_firmware': 'Identificar la versión de firmware',
-    'rec_verify_toolbox': 'Verificar que el MIB2 Toolbox esté instalado',
-    'rec_backup_first': 'Realizar backup antes de proceder',
-    'rec_ensure_toolbox': 'Asegurarse de que el MIB2 Toolbox esté instalado',
-    'rec_verify_patch': 'Verificar que el sistema esté parcheado (tsd.mibstd2.system.swap)',
-    'rec_create_exception_list': 'Crear ExceptionList.txt con los códigos seleccionados',
-    'rec_full_backup': 'Realizar backup completo antes de proceder',
-    
-    # XDS warnings
-    'xds_strong_title': '⚠️ ADVERTENCIA CRÍTICA: XDS+ en Modo "Strong"',
-    'xds_strong_message': 'NO configurar el XDS+ en modo "Strong" (Stark). Este ajuste genera desgaste parasitario de frenos y estrés térmico sin beneficios tangibles.',
-    'xds_temp_warning': 'Las temperaturas del disco pueden superar 600°C-700°C',
-    'xds_brake_fluid_warning': 'El líquido de frenos puede alcanzar su punto de ebullición (vapor lock)',
-    'xds_wear_warning': 'El desgaste se acelera exponencialmente',
-    'xds_pads_warning': 'Un juego de pastillas puede destruirse en una sola sesión de pista',
-    'xds_vaq_conflict': 'En vehículos con VAQ, genera un bucle de control conflictivo',
-    'xds_technical': 'Configuración recomendada: "Standard" (Estándar). El XDS+ debe actuar solo como red de seguridad de último recurso.',
-    
-    # VAQ warnings
-    'vaq_traction_title': 'Recomendación: VAQ Tracción Aumentada',
-    'vaq_traction_message': 'Para maximizar tracción, ajustar el VAQ a "Tracción Aumentada" en lugar de modificar XDS+.',
-    'vaq_aggressive_lock': 'Permite un bloqueo más agresivo y rápido de los discos del embrague',
-    'vaq_acoustic_tradeoff': 'Sacrifica suavidad acústica a cambio de mayor rendimiento',
-    'vaq_mechanical_superior': 'El VAQ es mecánicamente superior y térmicamente eficiente',
-    'vaq_noise_warning': 'Pueden escucharse crujidos o arrastre de neumáticos en giros cerrados a baja velocidad',
-    'vaq_technical': 'El VAQ (Vorderachsquersperre) es el diferencial de deslizamiento limitado electrohidráulico.',
-    
-    # Vista Sport warnings
-    'vista_sport_title': 'Limitación: Vista Sport',
-    'vista_sport_message': 'La Vista Sport solo está disponible en unidades de hardware 790 B+.',
-    'vista_verify_hardware': 'Verificar el número de parte del hardware antes de intentar activar',
-    'vista_not_available': 'En unidades 790, 790A o 790B sin el sufijo "+", la Vista Sport no estará disponible',
-    'vista_consider_upgrade': 'Considerar actualización de hardware si se requiere esta función',
-    'vista_technical': 'La Vista Sport es una característica de hardware que requiere el cuadro digital específico de la revisión B+.',
-    
-    # eMMC warnings
-    'emmc_access_title': '⚠️ ADVERTENCIA CRÍTICA: Acceso Directo eMMC',
-    'emmc_access_message': 'El acceso directo al chip eMMC es un método avanzado que puede dañar permanentemente la unidad.',
-    'emmc_microsolder_required': 'Requiere habilidades avanzadas de microsoldadura',
-    'emmc_warranty_void': 'Puede anular la garantía',
-    'emmc_brick_risk': 'Riesgo de "brickear" la unidad permanentemente',
-    'emmc_expert_only': 'Solo para usuarios con experiencia en electrónica',
-    'emmc_last_resort': 'Último recurso cuando otros métodos fallan',
-    'emmc_technical': 'Este método implica soldadura directa a los pines del chip eMMC para acceder a la memoria no volátil.',
-    
-    # Report
-    'report_header': 'Reporte de Validación de Configuración',
-    'report_summary': 'Resumen de validaciones',
-    'conclusion_all_pass': 'Todas las validaciones pasaron correctamente.',
-    'conclusion_critical': 'Se encontraron problemas críticos o errores. Revisar las recomendaciones antes de proceder.',
-    'conclusion_warnings': 'Se encontraron advertencias. Proceder con precaución.',
-}
-
-safety_en = {
-    'hw_790_desc': 'MIB2 STD2 Base (no letter)',
-    'hw_790a_desc': 'MIB2 STD2 Revision A',
-    'hw_790b_desc': 'MIB2 STD2 Revision B',
-    'hw_790b_plus_desc': 'MIB2 STD2 Revision B+ (Vista Sport)',
-    'cap_basic_digital': 'Basic digital cluster',
-    'cap_carbon_skin_v2': 'Compatible with Carbon skin (Variant 2)',
-    'cap_vcds_standard': 'Standard VCDS modifications support',
-    'cap_improved_digital': 'Improved digital cluster',
-    'cap_vcds_full': 'Full VCDS support',
-    'cap_advanced_digital': 'Advanced digital cluster',
-    'cap_carbon_cupra_skins': 'Compatible with Carbon and Cupra skins (Variants 2 and 3)',
-    'cap_vista_sport_digital': 'Digital cluster with Vista Sport',
-    'cap_all_skins': 'Compatible with all skins',
-    'cap_native_perf_monitor': 'Native Performance Monitor',
-    'feat_toolbox_support': 'MIB2 Toolbox support',
-    'feat_fec_compatible': 'FEC codes compatible',
-    'feat_vcds_standard': 'Standard VCDS modifications',
-    'feat_toolbox_improved': 'Improved MIB2 Toolbox support',
-    'feat_vcds_full': 'Full VCDS modifications',
-    'feat_latest_stable': 'Latest stable version',
-    'feat_toolbox_full': 'Full MIB2 Toolbox support',
-    'issue_1sd_no_signature': 'Some 1-SD units lack signature validation routines',
-    'unknown_hardware_title': 'Unknown Hardware',
-    'unknown_hardware_message': 'Part number "{{partNumber}}" is not in the known hardware database.',
-    'unknown_hardware_details': 'Modifications may work, but full compatibility is not guaranteed.',
-    'limited_hardware_title': 'Hardware with Limitations',
-    'limited_hardware_message': 'Hardware {{description}} identified with known limitations.',
-    'hardware_capabilities': 'Hardware capabilities',
-    'compatible_hardware_title': 'Compatible Hardware',
-    'compatible_hardware_message': 'Hardware {{description}} identified correctly.',
-    'unknown_firmware_title': 'Unknown Firmware',
-    'unknown_firmware_message': 'Firmware version "{{version}}" is not in the database.',
-    'firmware_issues_title': 'Firmware with Known Issues',
-    'firmware_issues_message': 'Firmware {{version}} has known issues.',
-    'firmware_features': 'Firmware features',
-    'compatible_firmware_title': 'Compatible Firmware',
-    'compatible_firmware_message': 'Firmware {{version}} identified correctly.',
-    'unidentified_hardware_title': 'Unidentified Hardware',
-    'unidentified_hardware_message': 'Cannot validate FEC code compatibility without identifying hardware.',
-    'unidentified_firmware_title': 'Unidentified Firmware',
-    'unidentified_firmware_message': 'Cannot guarantee injection method will work with this firmware.',
-    'fec_validation_title': 'FEC Injection Validation',
-    'fec_validation_message': 'FEC code injection bypasses VW AG digital firmware validation.',
-    'fec_technical_details': 'The patching method modifies the system binary to alter the signature verification routine.',
-    'rec_verify_part_number': 'Verify part number on unit label',
-    'rec_check_manual': 'Check vehicle manual to confirm version',
-    'rec_proceed_caution': 'Proceed with caution when applying modifications',
-    'rec_verify_firmware': 'Verify firmware version in system menu',
-    'rec_check_vw_docs': 'Check official VW documentation',
-    'rec_consider_update': 'Consider updating to a known version',
-    'rec_identify_hardware': 'Identify hardware part number',
-    'rec_verify_compatibility': 'Verify compatibility before injecting codes',
-    'rec_identify_firmware': 'Identify firmware version',
-    'rec_verify_toolbox': 'Verify MIB2 Toolbox is installed',
-    'rec_backup_first': 'Backup before proceeding',
-    'rec_ensure_toolbox': 'Ensure MIB2 Toolbox is installed',
-    'rec_verify_patch': 'Verify system is patched (tsd.mibstd2.system.swap)',
-    'rec_create_exception_list': 'Create ExceptionList.txt with selected codes',
-    'rec_full_backup': 'Perform full backup before proceeding',
-    'xds_strong_title': '⚠️ CRITICAL WARNING: XDS+ in "Strong" Mode',
-    'xds_strong_message': 'DO NOT configure XDS+ in "Strong" (Stark) mode. This setting causes parasitic brake wear and thermal stress without tangible benefits.',
-    'xds_temp_warning': 'Disc temperatures can exceed 600°C-700°C',
-    'xds_brake_fluid_warning': 'Brake fluid can reach boiling point (vapor lock)',
-    'xds_wear_warning': 'Wear accelerates exponentially',
-    'xds_pads_warning': 'A set of pads can be destroyed in a single track session',
-    'xds_vaq_conflict': 'In vehicles with VAQ, creates a conflicting control loop',
-    'xds_technical': 'Recommended setting: "Standard". XDS+ should act only as a last resort safety net.',
-    'vaq_traction_title': 'Recommendation: VAQ Increased Traction',
-    'vaq_traction_message': 'To maximize traction, adjust VAQ to "Increased Traction" instead of modifying XDS+.',
-    'vaq_aggressive_lock': 'Allows more aggressive and faster clutch disc locking',
-    'vaq_acoustic_tradeoff': 'Sacrifices acoustic smoothness for better performance',
-    'vaq_mechanical_superior': 'VAQ is mechanically superior and thermally efficient',
-    'vaq_noise_warning': 'Creaking or tire dragging may be heard in tight low-speed turns',
-    'vaq_technical': 'VAQ (Vorderachsquersperre) is the electrohydraulic limited-slip differential.',
-    'vista_sport_title': 'Limitation: Vista Sport',
-    'vista_sport_message': 'Vista Sport is only available on 790 B+ hardware units.',
-    'vista_verify_hardware': 'Verify hardware part number before attempting activation',
-    'vista_not_available': 'On 790, 790A or 790B units without "+" suffix, Vista Sport will not be available',
-    'vista_consider_upgrade': 'Consider hardware upgrade if this feature is required',
-    'vista_technical': 'Vista Sport is a hardware feature requiring the specific B+ revision digital cluster.',
-    'emmc_access_title': '⚠️ CRITICAL WARNING: Direct eMMC Access',
-    'emmc_access_message': 'Direct eMMC chip access is an advanced method that can permanently damage the unit.',
-    'emmc_microsolder_required': 'Requires advanced microsoldering skills',
-    'emmc_warranty_void': 'May void warranty',
-    'emmc_brick_risk': 'Risk of permanently bricking the unit',
-    'emmc_expert_only': 'Only for users with electronics experience',
-    'emmc_last_resort': 'Last resort when other methods fail',
-    'emmc_technical': 'This method involves direct soldering to eMMC chip pins to access non-volatile memory.',
-    'report_header': 'Configuration Validation Report',
-    'report_summary': 'Validation summary',
-    'conclusion_all_pass': 'All validations passed correctly.',
-    'conclusion_critical': 'Critical issues or errors found. Review recommendations before proceeding.',
-    'conclusion_warnings': 'Warnings found. Proceed with caution.',
-}
-
-safety_de = {
-    'hw_790_desc': 'MIB2 STD2 Basis (ohne Buchstabe)',
-    'hw_790a_desc': 'MIB2 STD2 Revision A',
-    'hw_790b_desc': 'MIB2 STD2 Revision B',
-    'hw_790b_plus_desc': 'MIB2 STD2 Revision B+ (Vista Sport)',
-    'cap_basic_digital': 'Einfaches digitales Kombiinstrument',
-    'cap_carbon_skin_v2': 'Kompatibel mit Carbon-Skin (Variante 2)',
-    'cap_vcds_standard': 'Standard-VCDS-Modifikationen unterstützt',
-    'cap_improved_digital': 'Verbessertes digitales Kombiinstrument',
-    'cap_vcds_full': 'Volle VCDS-Unterstützung',
-    'cap_advanced_digital': 'Erweitertes digitales Kombiinstrument',
-    'cap_carbon_cupra_skins': 'Kompatibel mit Carbon- und Cupra-Skins (Varianten 2 und 3)',
-    'cap_vista_sport_digital': 'Digitales Kombiinstrument mit Vista Sport',
-    'cap_all_skins': 'Kompatibel mit allen Skins',
-    'cap_native_perf_monitor': 'Nativer Performance Monitor',
-    'feat_toolbox_support': 'MIB2 Toolbox-Unterstützung',
-    'feat_fec_compatible': 'FEC-Codes kompatibel',
-    'feat_vcds_standard': 'Standard-VCDS-Modifikationen',
-    'feat_toolbox_improved': 'Verbesserte MIB2 Toolbox-Unterstützung',
-    'feat_vcds_full': 'Vollständige VCDS-Modifikationen',
-    'feat_latest_stable': 'Neueste stabile Version',
-    'feat_toolbox_full': 'Vollständige MIB2 Toolbox-Unterstützung',
-    'issue_1sd_no_signature': 'Einige 1-SD-Einheiten haben keine Signaturvalidierungsroutinen',
-    'unknown_hardware_title': 'Unbekannte Hardware',
-    'unknown_hardware_message': 'Teilenummer "{{partNumber}}" ist nicht in der bekannten Hardware-Datenbank.',
-    'unknown_hardware_details': 'Modifikationen können funktionieren, aber volle Kompatibilität ist nicht garantiert.',
-    'limited_hardware_title': 'Hardware mit Einschränkungen',
-    'limited_hardware_message': 'Hardware {{description}} mit bekannten Einschränkungen identifiziert.',
-    'hardware_capabilities': 'Hardware-Fähigkeiten',
-    'compatible_hardware_title': 'Kompatible Hardware',
-    'compatible_hardware_message': 'Hardware {{description}} korrekt identifiziert.',
-    'unknown_firmware_title': 'Unbekannte Firmware',
-    'unknown_firmware_message': 'Firmware-Version "{{version}}" ist nicht in der Datenbank.',
-    'firmware_issues_title': 'Firmware mit bekannten Problemen',
-    'firmware_issues_message': 'Firmware {{version}} hat bekannte Probleme.',
-    'firmware_features': 'Firmware-Funktionen',
-    'compatible_firmware_title': 'Kompatible Firmware',
-    'compatible_firmware_message': 'Firmware {{version}} korrekt identifiziert.',
-    'unidentified_hardware_title': 'Nicht identifizierte Hardware',
-    'unidentified_hardware_message': 'FEC-Code-Kompatibilität kann ohne Hardware-Identifikation nicht validiert werden.',
-    'unidentified_firmware_title': 'Nicht identifizierte Firmware',
-    'unidentified_firmware_message': 'Kann nicht garantieren, dass die Injektionsmethode mit dieser Firmware funktioniert.',
-    'fec_validation_title': 'FEC-Injektionsvalidierung',
-    'fec_validation_message': 'FEC-Code-Injektion umgeht die digitale VW AG Firmware-Validierung.',
-    'fec_technical_details': 'Die Patching-Methode modifiziert die Systembinärdatei, um die Signaturprüfungsroutine zu ändern.',
-    'rec_verify_part_number': 'Teilenummer auf dem Geräteetikett überprüfen',
-    'rec_check_manual': 'Fahrzeughandbuch zur Versionsbestätigung prüfen',
-    'rec_proceed_caution': 'Bei Modifikationen mit Vorsicht vorgehen',
-    'rec_verify_firmware': 'Firmware-Version im Systemmenü überprüfen',
-    'rec_check_vw_docs': 'Offizielle VW-Dokumentation prüfen',
-    'rec_consider_update': 'Update auf bekannte Version erwägen',
-    'rec_identify_hardware': 'Hardware-Teilenummer identifizieren',
-    'rec_verify_compatibility': 'Kompatibilität vor Code-Injektion überprüfen',
-    'rec_identify_firmware': 'Firmware-Version identifizieren',
-    'rec_verify_toolbox': 'MIB2 Toolbox-Installation überprüfen',
-    'rec_backup_first': 'Backup vor dem Fortfahren erstellen',
-    'rec_ensure_toolbox': 'Sicherstellen, dass MIB2 Toolbox installiert ist',
-    'rec_verify_patch': 'System-Patch überprüfen (tsd.mibstd2.system.swap)',
-    'rec_create_exception_list': 'ExceptionList.txt mit ausgewählten Codes erstellen',
-    'rec_full_backup': 'Vollständiges Backup vor dem Fortfahren erstellen',
-    'xds_strong_title': '⚠️ KRITISCHE WARNUNG: XDS+ im "Strong"-Modus',
-    'xds_strong_message': 'XDS+ NICHT im "Strong" (Stark)-Modus konfigurieren. Diese Einstellung verursacht parasitären Bremsverschleiß und thermischen Stress ohne greifbare Vorteile.',
-    'xds_temp_warning': 'Scheibentemperaturen können 600°C-700°C überschreiten',
-    'xds_brake_fluid_warning': 'Bremsflüssigkeit kann Siedepunkt erreichen (Vapor Lock)',
-    'xds_wear_warning': 'Verschleiß beschleunigt sich exponentiell',
-    'xds_pads_warning': 'Ein Belagsatz kann in einer einzigen Rennstrecken-Session zerstört werden',
-    'xds_vaq_conflict': 'Bei Fahrzeugen mit VAQ entsteht eine konfliktäre Regelschleife',
-    'xds_technical': 'Empfohlene Einstellung: "Standard". XDS+ sollte nur als letztes Sicherheitsnetz fungieren.',
-    'vaq_traction_title': 'Empfehlung: VAQ Erhöhte Traktion',
-    'vaq_traction_message': 'Für maximale Traktion VAQ auf "Erhöhte Traktion" einstellen statt XDS+ zu modifizieren.',
-    'vaq_aggressive_lock': 'Ermöglicht aggressivere und schnellere Kupplungsscheiben-Sperrung',
-    'vaq_acoustic_tradeoff': 'Opfert akustische Laufruhe für bessere Leistung',
-    'vaq_mechanical_superior': 'VAQ ist mechanisch überlegen und thermisch effizient',
-    'vaq_noise_warning': 'Knarren oder Reifenschleifen kann bei engen Kurven bei niedriger Geschwindigkeit hörbar sein',
-    'vaq_technical': 'VAQ (Vorderachsquersperre) ist das elektrohydraulische Sperrdifferential.',
-    'vista_sport_title': 'Einschränkung: Vista Sport',
-    'vista_sport_message': 'Vista Sport ist nur auf 790 B+ Hardware-Einheiten verfügbar.',
-    'vista_verify_hardware': 'Hardware-Teilenummer vor Aktivierungsversuch überprüfen',
-    'vista_not_available': 'Auf 790, 790A oder 790B Einheiten ohne "+"-Suffix ist Vista Sport nicht verfügbar',
-    'vista_consider_upgrade': 'Hardware-Upgrade erwägen, wenn diese Funktion benötigt wird',
-    'vista_technical': 'Vista Sport ist eine Hardware-Funktion, die das spezifische B+ Revision digitale Kombiinstrument erfordert.',
-    'emmc_access_title': '⚠️ KRITISCHE WARNUNG: Direkter eMMC-Zugriff',
-    'emmc_access_message': 'Direkter eMMC-Chip-Zugriff ist eine fortgeschrittene Methode, die das Gerät dauerhaft beschädigen kann.',
-    'emmc_microsolder_required': 'Erfordert fortgeschrittene Mikrolöt-Fähigkeiten',
-    'emmc_warranty_void': 'Kann Garantie ungültig machen',
-    'emmc_brick_risk': 'Risiko, das Gerät dauerhaft zu "bricken"',
-    'emmc_expert_only': 'Nur für Benutzer mit Elektronik-Erfahrung',
-    'emmc_last_resort': 'Letzter Ausweg, wenn andere Methoden fehlschlagen',
-    'emmc_technical': 'Diese Methode beinhaltet direktes Löten an eMMC-Chip-Pins für Zugriff auf nichtflüchtigen Speicher.',
-    'report_header': 'Konfigurationsvalidierungsbericht',
-    'report_summary': 'Validierungszusammenfassung',
-    'conclusion_all_pass': 'Alle Validierungen erfolgreich bestanden.',
-    'conclusion_critical': 'Kritische Probleme oder Fehler gefunden. Empfehlungen vor dem Fortfahren prüfen.',
-    'conclusion_warnings': 'Warnungen gefunden. Mit Vorsicht fortfahren.',
-}
-
-# Agregar sección safety
-if 'safety' not in es:
-    es['safety'] = {}
-if 'safety' not in en:
-    en['safety'] = {}
-if 'safety' not in de:
-    de['safety'] = {}
-
-es['safety'].update(safety_es)
-en['safety'].update(safety_en)
-de['safety'].update(safety_de)
-
-# Guardar
-with open('locales/es.json', 'w') as f:
-    json.dump(es, f, ensure_ascii=False, indent=2)
-with open('locales/en.json', 'w') as f:
-    json.dump(en, f, ensure_ascii=False, indent=2)
-with open('locales/de.json', 'w') as f:
-    json.dump(de, f, ensure_ascii=False, indent=2)
-
-print(f"Traducciones de safety agregadas: {len(safety_es)} claves")
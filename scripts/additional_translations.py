@@ -5,6 +5,8 @@ Traducciones adicionales para comandos MIB2 y textos técnicos
 import json
 from pathlib import Path
 
+from locale_store import write_locale
+
 PROJECT_ROOT = Path('/home/ubuntu/mib2_controller')
 LOCALES_DIR = PROJECT_ROOT / 'locales'
 
@@ -175,8 +177,7 @@ def apply_translations(locale_file, translations, target_lang):
     
     translate_recursive(data, es_data)
     
-    with open(locale_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_locale(locale_file, data)
     
     return data
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Aplica todos los parches de translation_patches/ a los locales en una sola pasada
+"""
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from pathlib import Path
+
+from locale_store import LANGUAGES, PROJECT_ROOT, LocaleStore, dotted, flatten_paths, unflatten_paths
+
+PATCHES_DIR = PROJECT_ROOT / 'scripts' / 'translation_patches'
+
+def patch_section(patch_path):
+    """Sección de un parche: auto_spoof.json y auto_spoof.pin.json -> auto_spoof"""
+    return patch_path.name.split('.', 1)[0]
+
+def load_section(section, patch_paths, languages=LANGUAGES):
+    """Carga los parches de una sección y los combina.
+
+    Cada parche es {idioma: subárbol de la sección}. Devuelve (sección,
+    {idioma: {ruta: valor}}, conflictos), donde un conflicto es
+    (idioma, ruta, [(parche, valor), ...]) para una misma clave con
+    valores distintos en distintos parches. Las secciones son
+    independientes, así que esta función corre en paralelo, una sección
+    por tarea.
+    """
+    updates = {lang: {} for lang in languages}
+    origins = {}
+    conflicts = defaultdict(list)
+    for patch_path in patch_paths:
+        with open(patch_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        unknown = set(data) - set(languages)
+        if unknown:
+            raise ValueError(f"{patch_path.name}: idiomas desconocidos {sorted(unknown)}")
+
+        for lang, tree in data.items():
+            for path, value in flatten_paths(tree, (section,)).items():
+                previous = updates[lang].get(path)
+                if previous is None:
+                    updates[lang][path] = value
+                    origins[lang, path] = patch_path.name
+                elif previous != value:
+                    if not conflicts[lang, path]:
+                        conflicts[lang, path].append((origins[lang, path], previous))
+                    conflicts[lang, path].append((patch_path.name, value))
+
+    return section, updates, [
+        (lang, path, values) for (lang, path), values in conflicts.items()
+    ]
+
+def group_by_section(patch_paths):
+    """{sección: [parches]} en orden alfabético de sección y de archivo"""
+    sections = defaultdict(list)
+    for patch_path in sorted(patch_paths):
+        sections[patch_section(patch_path)].append(patch_path)
+    return dict(sorted(sections.items()))
+
+def load_all(sections, jobs=1):
+    """Resultados de load_section() de todas las secciones, en orden"""
+    if jobs > 1 and len(sections) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(load_section, sections, sections.values()))
+    return [load_section(section, paths) for section, paths in sections.items()]
+
+def apply_sections(store, loaded):
+    """Una sola pasada de fusión; devuelve {sección: {idioma: ChangeSet}}"""
+    return {
+        section: {lang: store.apply(lang, unflatten_paths(flat))
+                  for lang, flat in updates.items() if lang in store.flat}
+        for section, updates, _ in loaded
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        'patches', nargs='*', type=Path, metavar='PARCHE',
+        help=f'archivos de parche (por defecto todos los de {PATCHES_DIR.name}/)'
+    )
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1, metavar='N',
+        help='procesos para cargar secciones en paralelo (0 = uno por CPU)'
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help='mostrar los cambios sin escribir los locales'
+    )
+    parser.add_argument(
+        '--changes', type=Path, metavar='JSON',
+        help='guardar las claves agregadas/modificadas/eliminadas por idioma, '
+             'para que los pasos siguientes procesen solo eso'
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error('--jobs debe ser >= 0')
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    if not args.patches:
+        args.patches = sorted(PATCHES_DIR.glob('*.json'))
+    return args
+
+def main():
+    args = parse_args()
+    sections = group_by_section(args.patches)
+    loaded = load_all(sections, args.jobs)
+
+    conflicts = [conflict for _, _, found in loaded for conflict in found]
+    if conflicts:
+        print(f"❌ {len(conflicts)} claves con valores distintos en distintos parches:")
+        for lang, path, values in conflicts:
+            print(f"   - [{lang}] {dotted(path)}")
+            for patch_name, value in values:
+                print(f"      {patch_name}: {value!r}")
+        print("\nNo se escribió ningún locale.")
+        sys.exit(1)
+
+    store = LocaleStore()
+    changes = apply_sections(store, loaded)
+
+    total_keys = sum(len(flat) for _, updates, _ in loaded for flat in updates.values())
+    print(f"✅ {len(args.patches)} parches, {len(sections)} secciones, {total_keys} claves")
+    for section, change_sets in changes.items():
+        if any(change_sets.values()):
+            print(f"   - {section}: "
+                  + ', '.join(f"{lang} {len(change_set)}" for lang, change_set in change_sets.items()))
+
+    for lang, change_set in store.changes.items():
+        if change_set:
+            print(f"   - {lang}.json: {len(change_set.added)} agregadas, "
+                  f"{len(change_set.modified)} modificadas, {len(change_set.removed)} eliminadas")
+    if args.changes:
+        with open(args.changes, 'w', encoding='utf-8') as f:
+            json.dump({lang: change_set.to_dict() for lang, change_set in store.changes.items()},
+                      f, indent=2, ensure_ascii=False)
+        print(f"   - Cambios guardados en: {args.changes}")
+
+    if args.dry_run:
+        return
+    written = store.save()
+    for path in written:
+        print(f"   - Guardado: {path}")
+    if not written:
+        print("   - Los locales ya estaban al día")
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,8 @@ Usa traducciones predefinidas para términos técnicos y contexto de MIB2
 import json
 from pathlib import Path
 
+from locale_store import write_locale
+
 PROJECT_ROOT = Path('/home/ubuntu/mib2_controller')
 LOCALES_DIR = PROJECT_ROOT / 'locales'
 
@@ -145,14 +147,12 @@ def main():
     # Traducir a inglés
     en_data = translate_nested_dict(es_data, 'en')
     en_file = LOCALES_DIR / 'en.json'
-    with open(en_file, 'w', encoding='utf-8') as f:
-        json.dump(en_data, f, indent=2, ensure_ascii=False)
+    write_locale(en_file, en_data)
     
     # Traducir a alemán
     de_data = translate_nested_dict(es_data, 'de')
     de_file = LOCALES_DIR / 'de.json'
-    with open(de_file, 'w', encoding='utf-8') as f:
-        json.dump(de_data, f, indent=2, ensure_ascii=False)
+    write_locale(de_file, de_data)
     
     # Contar traducciones pendientes
     en_todos = str(en_data).count('[TODO:')
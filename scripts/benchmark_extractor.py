@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks del extractor de strings hardcodeados sobre el árbol real
+"""
+import re
+import sys
+import time
+
+from extract_hardcoded_strings import (
+    PATTERNS, PROJECT_ROOT, SCAN_DIRS, LineIndex, find_candidates,
+    find_candidates_lexer, iter_source_files,
+)
+from language_classifier import CLASSIFIER
+from locale_store import flatten_paths, load_locales
+
+REPEAT = 5
+
+# Cualquier literal de string: densidad de candidatos de un archivo grande
+STRING_LITERAL = re.compile(r'''(["'`])(?:\\.|(?!\1)[^\\])*\1''')
+
+def load_sources(dir_name):
+    """Carga el contenido de todos los .ts/.tsx de un directorio"""
+    sources = []
+    for file_path in sorted((PROJECT_ROOT / dir_name).rglob('*.ts*')):
+        if file_path.suffix in ('.ts', '.tsx'):
+            sources.append(file_path.read_text(encoding='utf-8'))
+    return sources
+
+def collect_offsets(sources):
+    """Offsets de todas las coincidencias de PATTERNS, por archivo"""
+    return [
+        [m.start() for pattern in PATTERNS
+         for m in re.finditer(pattern, content, re.MULTILINE)]
+        for content in sources
+    ]
+
+def collect_literal_offsets(sources):
+    """Offsets de todos los literales de string, por archivo"""
+    return [[m.start() for m in STRING_LITERAL.finditer(content)]
+            for content in sources]
+
+def best_of(func):
+    """Mejor tiempo (en ms) de REPEAT ejecuciones"""
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def bench_line_numbers(sources, offsets):
+    """Conteo de prefijo por coincidencia vs. índice de líneas + bisect"""
+    def prefix_count():
+        for content, starts in zip(sources, offsets):
+            for offset in starts:
+                content[:offset].count('\n') + 1
+
+    def line_index():
+        for content, starts in zip(sources, offsets):
+            index = LineIndex(content)
+            for offset in starts:
+                index.locate(offset)
+
+    # Ambos métodos deben dar la misma línea
+    for content, starts in zip(sources, offsets):
+        index = LineIndex(content)
+        for offset in starts:
+            assert index.locate(offset)[0] == content[:offset].count('\n') + 1
+
+    return prefix_count, line_index
+
+def bench_alternation(sources):
+    """Cinco regex precompiladas vs. una sola alternancia con grupos nombrados"""
+    alternation = re.compile(
+        '|'.join(f'(?=(?P<p{i}>{pattern}))' for i, pattern in enumerate(PATTERNS)),
+        re.MULTILINE,
+    )
+
+    def five_passes():
+        for content in sources:
+            find_candidates(content)
+
+    def single_pass():
+        for content in sources:
+            for match in alternation.finditer(content):
+                match.lastgroup
+
+    return five_passes, single_pass
+
+def bench_walk():
+    """Dos rglob por directorio vs. un solo recorrido podado con os.scandir"""
+    def double_rglob():
+        files = []
+        for dir_name in SCAN_DIRS:
+            dir_path = PROJECT_ROOT / dir_name
+            files.extend(dir_path.rglob('*.tsx'))
+            files.extend(f for f in dir_path.rglob('*.ts')
+                         if 'node_modules' not in str(f))
+        return files
+
+    def pruned_walk():
+        return list(iter_source_files())
+
+    assert set(double_rglob()) == set(pruned_walk())
+    return double_rglob, pruned_walk
+
+def legacy_is_spanish_text(text):
+    """is_spanish_text original: lista reconstruida y recorrida en cada llamada"""
+    text = text.strip()
+    if not text or len(text) < 3:
+        return False
+    spanish_words = [
+        'el', 'la', 'los', 'las', 'un', 'una', 'de', 'del', 'al',
+        'con', 'sin', 'por', 'para', 'en', 'es', 'está', 'son',
+        'configuración', 'conexión', 'dispositivo', 'error', 'éxito',
+        'conectar', 'desconectar', 'escanear', 'guardar', 'cancelar',
+        'aceptar', 'continuar', 'sí', 'no', 'advertencia', 'información'
+    ]
+    if any(c in text.lower() for c in 'áéíóúñ¿¡'):
+        return True
+    words = text.lower().split()
+    return any(word in spanish_words for word in words)
+
+def bench_spanish_detection():
+    """is_spanish_text string a string vs. el clasificador por lotes"""
+    texts = [value for tree in load_locales().values()
+             for value in flatten_paths(tree).values() if isinstance(value, str)]
+    assert [legacy_is_spanish_text(t) for t in texts] == CLASSIFIER.is_spanish_batch(texts)
+
+    def per_string():
+        for text in texts:
+            legacy_is_spanish_text(text)
+
+    def batch():
+        CLASSIFIER.is_spanish_batch(texts)
+
+    return len(texts), per_string, batch
+
+def bench_lexer(dir_names=('app', 'components')):
+    """Heurísticas regex vs. el lexer TS/TSX (candidatos y tiempo)"""
+    sources = []
+    for dir_name in dir_names:
+        for file_path in sorted((PROJECT_ROOT / dir_name).rglob('*.ts*')):
+            if file_path.suffix in ('.ts', '.tsx'):
+                sources.append((file_path.read_text(encoding='utf-8'),
+                                file_path.suffix == '.tsx'))
+
+    def regex():
+        return [find_candidates(content, jsx) for content, jsx in sources]
+
+    def lexer():
+        return [find_candidates_lexer(content, jsx) for content, jsx in sources]
+
+    def findings(candidates):
+        texts = [text for per_file in candidates for _, _, text in per_file]
+        return len(texts), sum(CLASSIFIER.is_spanish_batch(texts))
+
+    counts = {'regex': findings(regex()), 'lexer': findings(lexer())}
+    return len(sources), counts, regex, lexer
+
+def report(title, legacy, optimized):
+    legacy_ms = best_of(legacy)
+    optimized_ms = best_of(optimized)
+    speedup = legacy_ms / optimized_ms if optimized_ms else float('inf')
+    print(f"\n⏱️  {title}")
+    print(f"   - Antes:   {legacy_ms:8.2f} ms")
+    print(f"   - Después: {optimized_ms:8.2f} ms")
+    print(f"   - Mejora:  {speedup:8.1f}x")
+
+def main():
+    dir_name = sys.argv[1] if len(sys.argv) > 1 else 'app'
+    sources = load_sources(dir_name)
+    offsets = collect_offsets(sources)
+    literal_offsets = collect_literal_offsets(sources)
+    total_lines = sum(content.count('\n') + 1 for content in sources)
+
+    print(f"📂 {dir_name}/: {len(sources)} archivos, {total_lines} líneas")
+
+    report(f"Números de línea ({sum(map(len, offsets))} coincidencias de PATTERNS)",
+           *bench_line_numbers(sources, offsets))
+    report(f"Números de línea ({sum(map(len, literal_offsets))} literales de string)",
+           *bench_line_numbers(sources, literal_offsets))
+    report('Alternancia única (descartada)', *bench_alternation(sources))
+    report(f"Recorrido de {', '.join(SCAN_DIRS)}", *bench_walk())
+    total_leaves, *detection = bench_spanish_detection()
+    report(f"Detección de español ({total_leaves} hojas de locales)", *detection)
+
+    total_files, counts, *finders = bench_lexer()
+    report(f"Regex vs. lexer TS/TSX ({total_files} archivos de app/ y components/)",
+           *finders)
+    for name, (candidates, spanish) in counts.items():
+        print(f"   - {name}: {candidates} candidatos, {spanish} en español")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+const fs = require('fs');
+const path = require('path');
+
+// Compara la búsqueda anidada que hacía getTranslation (split('.') y
+// recorrido del objeto) con las tablas planas de locales/sections/
+// sobre todas las claves usadas por el código, y la interpolación con
+// regex con la unión de partes precompiladas
+
+const ROOT = path.join(__dirname, '..');
+const SECTIONS_DIR = path.join(ROOT, 'locales', 'sections');
+const ITERATIONS = 200;
+const REPEAT = 5;
+
+const { usedKeys } = require('./translation-check-results.json');
+
+// Búsqueda original sobre el locale anidado completo
+function nestedLookup(translations, key) {
+  const keys = key.split('.');
+  let value = translations;
+  for (const k of keys) {
+    value = value?.[k];
+    if (value === undefined) {
+      return key;
+    }
+  }
+  return value?.toString() || key;
+}
+
+// Interpolación original: regex sobre el texto en cada llamada
+function regexInterpolate(value, params) {
+  return value.replace(/\{\{(\w+)\}\}/g, (match, paramKey) => {
+    return params[paramKey]?.toString() || match;
+  });
+}
+
+// Interpolación actual: unir las partes precompiladas
+function interpolate(parts, params) {
+  let result = parts[0];
+  for (let i = 1; i < parts.length; i += 2) {
+    const name = parts[i];
+    result += (params?.[name]?.toString() || `{{${name}}}`) + parts[i + 1];
+  }
+  return result;
+}
+
+// Búsqueda actual: sección por el primer segmento y una sola consulta
+function flatLookup(sections, key) {
+  const dot = key.indexOf('.');
+  const value = dot === -1 ? undefined : sections[key.slice(0, dot)]?.[key.slice(dot + 1)];
+  if (value === undefined) {
+    return key;
+  }
+  return typeof value === 'string' ? value || key : interpolate(value);
+}
+
+// Tablas de un idioma con los índices de la tabla de strings resueltos,
+// como las deja lib/locale-loader.ts
+function loadTables(lang) {
+  const strings = require(path.join(SECTIONS_DIR, `${lang}.strings.json`));
+  const tables = {};
+  for (const file of fs.readdirSync(path.join(SECTIONS_DIR, lang))) {
+    const raw = require(path.join(SECTIONS_DIR, lang, file));
+    const table = {};
+    for (const key in raw) {
+      table[key] = typeof raw[key] === 'number' ? strings[raw[key]] : raw[key];
+    }
+    tables[path.basename(file, '.json')] = table;
+  }
+  return tables;
+}
+
+// Mejor tiempo de REPEAT ejecuciones, en nanosegundos por llamada
+function bestOf(func, data, items = usedKeys) {
+  let best = Infinity;
+  for (let r = 0; r < REPEAT; r++) {
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < ITERATIONS; i++) {
+      for (const item of items) {
+        func(data, item);
+      }
+    }
+    const elapsed = Number(process.hrtime.bigint() - start);
+    best = Math.min(best, elapsed / (ITERATIONS * items.length));
+  }
+  return best;
+}
+
+// Textos con {{var}} de un idioma: [texto original, partes, parámetros]
+function templates(nested, flat) {
+  const found = [];
+  for (const [section, table] of Object.entries(flat)) {
+    for (const [key, parts] of Object.entries(table)) {
+      if (typeof parts === 'string') {
+        continue;
+      }
+      const params = {};
+      for (let i = 1; i < parts.length; i += 2) {
+        params[parts[i]] = 42;
+      }
+      const text = `${section}.${key}`.split('.').reduce((node, k) => node?.[k], nested);
+      found.push([text, parts, params]);
+    }
+  }
+  return found;
+}
+
+function report(title, before, after, unit) {
+  console.log(`\n⏱️  ${title}`);
+  console.log(`   - Antes:   ${before.toFixed(1).padStart(8)} ns/${unit}`);
+  console.log(`   - Después: ${after.toFixed(1).padStart(8)} ns/${unit}`);
+  console.log(`   - Mejora:  ${(before / after).toFixed(1).padStart(8)}x`);
+}
+
+console.log(`📊 ${usedKeys.length} claves usadas x ${ITERATIONS} pasadas`);
+for (const lang of ['es', 'en', 'de']) {
+  const nested = require(`../locales/${lang}.json`);
+  const flat = loadTables(lang);
+
+  // Ambas búsquedas deben devolver lo mismo (salvo claves que son una
+  // sección entera: la anidada devolvía "[object Object]")
+  const different = usedKeys.filter(key => {
+    const expected = nestedLookup(nested, key);
+    return expected !== '[object Object]' && expected !== flatLookup(flat, key);
+  });
+  if (different.length > 0) {
+    console.log(`❌ ${lang}: ${different.length} claves difieren, por ejemplo ${different[0]}`);
+  }
+
+  report(`${lang}: búsqueda anidada vs. tabla plana`,
+         bestOf(nestedLookup, nested), bestOf(flatLookup, flat), 'búsqueda');
+
+  const found = templates(nested, flat);
+  const wrong = found.filter(([text, parts, params]) =>
+    regexInterpolate(text, params) !== interpolate(parts, params));
+  if (wrong.length > 0) {
+    console.log(`❌ ${lang}: ${wrong.length} templates interpolan distinto, por ejemplo ${wrong[0][0]}`);
+  }
+  report(`${lang}: interpolación con regex vs. partes (${found.length} textos con {{var}})`,
+         bestOf((_, [text, , params]) => regexInterpolate(text, params), null, found),
+         bestOf((_, [, parts, params]) => interpolate(parts, params), null, found),
+         'llamada');
+}
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Parte los locales por idioma y por sección de primer nivel, como tablas
+planas clave con puntos -> texto, para que la app cargue solo el idioma
+activo y las secciones que usa, a demanda; los textos repetidos entre
+secciones van una sola vez a una tabla de strings por idioma
+"""
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+
+from locale_store import (
+    INTERPOLATION, LANGUAGES, LOCALES_DIR, PROJECT_ROOT, dotted, flatten_paths, load_locales,
+    write_if_changed,
+)
+from prune_locale_keys import (
+    REPORT_FILE, KeyUsage, collect_references, print_report, prune_locales, serialize_report,
+)
+
+SECTIONS_DIR = LOCALES_DIR / 'sections'
+MANIFEST_FILE = SECTIONS_DIR / 'manifest.json'
+STRINGS_FILE = '{lang}.strings.json'
+LOADERS_FILE = PROJECT_ROOT / 'lib' / 'locale-sections.ts'
+
+def serialize_section(table):
+    """JSON compacto de una sección: lo parsea la app, no una persona"""
+    return json.dumps(table, ensure_ascii=False, separators=(',', ':'))
+
+def section_table(tree):
+    """{clave con puntos dentro de la sección: texto}.
+
+    La app busca el resto de la clave que recibe t() (lo que sigue a
+    "seccion.") con una sola consulta, sin partirla ni recorrer objetos
+    anidados. No se repite el nombre de la sección en cada clave para
+    no agrandar el JSON.
+    """
+    if not isinstance(tree, dict):
+        return {'': tree}
+    return {dotted(path): value for path, value in flatten_paths(tree).items()}
+
+def compile_template(value):
+    """Partes de un texto con {{var}}: [texto, var, texto, ..., texto].
+
+    Las posiciones impares son nombres de placeholder; en la app
+    interpolar es unir las partes, sin regex. Un texto sin placeholders
+    queda como string.
+    """
+    if '{{' not in value:
+        return value
+    parts = INTERPOLATION.split(value)
+    return parts if len(parts) > 1 else value
+
+def compile_table(table):
+    return {key: compile_template(value) if isinstance(value, str) else value
+            for key, value in table.items()}
+
+def template_placeholders(value):
+    """Nombres de los placeholders de un valor compilado"""
+    return frozenset(value[1::2]) if isinstance(value, list) else frozenset()
+
+def placeholder_mismatches(tables, source='es', languages=LANGUAGES):
+    """Claves cuyos placeholders difieren entre idiomas.
+
+    Devuelve [(sección, clave, {idioma: [placeholders]})] comparando cada
+    idioma con el español.
+    """
+    mismatches = []
+    for section, source_table in tables[source].items():
+        for key, source_value in source_table.items():
+            expected = template_placeholders(source_value)
+            found = {lang: template_placeholders(tables[lang].get(section, {}).get(key))
+                     for lang in languages if key in tables[lang].get(section, {})}
+            if any(names != expected for names in found.values()):
+                mismatches.append((section, key, {lang: sorted(names)
+                                                  for lang, names in found.items()}))
+    return mismatches
+
+def encoded_size(value):
+    return len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+def intern_strings(per_section):
+    """(tablas con índices, tabla de strings) de un idioma.
+
+    Un texto que aparece más de una vez entre todas las secciones va
+    una sola vez a la tabla de strings y las secciones guardan su
+    índice. Los más frecuentes quedan primero, con los índices más
+    cortos, y solo entra un texto si las referencias ahorran más bytes
+    de los que ocupa en la tabla.
+    """
+    counts = Counter(value for table in per_section.values()
+                     for value in table.values() if isinstance(value, str))
+    shared = []
+    for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        if count < 2:
+            break
+        size = encoded_size(value)
+        if count * (size - len(str(len(shared)))) > size + 1:
+            shared.append(value)
+
+    index_of = {value: index for index, value in enumerate(shared)}
+    interned = {
+        section: {key: index_of.get(value, value) if isinstance(value, str) else value
+                  for key, value in table.items()}
+        for section, table in per_section.items()
+    }
+    return interned, shared
+
+def parse_time(texts, repeat=20):
+    """Mejor tiempo (en ms) de parsear todos los textos JSON"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            json.loads(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def interning_report(tables, files, strings, languages=LANGUAGES):
+    """{idioma: bytes y tiempo de parseo sin y con la tabla de strings}"""
+    report = {}
+    for lang in languages:
+        plain = [serialize_section(table) for table in tables[lang].values()]
+        interned = list(files[lang].values()) + [strings[lang]]
+        report[lang] = {
+            'bytesBefore': sum(len(text.encode('utf-8')) for text in plain),
+            'bytesAfter': sum(len(text.encode('utf-8')) for text in interned),
+            'parseBefore': parse_time(plain),
+            'parseAfter': parse_time(interned),
+        }
+    return report
+
+def section_order(locales, languages=LANGUAGES):
+    """Secciones de todos los idiomas, en el orden del primero que las tiene"""
+    sections = {}
+    for lang in languages:
+        for section in locales[lang]:
+            sections.setdefault(section, None)
+    return list(sections)
+
+def split_sections(locales, languages=LANGUAGES):
+    """{idioma: {sección: tabla plana con los templates compilados}}"""
+    return {
+        lang: {section: compile_table(section_table(tree))
+               for section, tree in locales[lang].items()}
+        for lang in languages
+    }
+
+def build_manifest(tables, files, sections, strings, languages=LANGUAGES, pruned=False,
+                   mismatches=()):
+    """Secciones, y por idioma el archivo, los bytes y las claves de cada una"""
+    return {
+        'languages': list(languages),
+        'pruned': pruned,
+        'strings': {
+            lang: {
+                'file': STRINGS_FILE.format(lang=lang),
+                'bytes': len(strings[lang].encode('utf-8')),
+            }
+            for lang in languages
+        },
+        'placeholderMismatches': [
+            {'key': f'{section}.{key}', 'placeholders': found}
+            for section, key, found in mismatches
+        ],
+        'sections': {
+            section: {
+                lang: {
+                    'file': f'{lang}/{section}.json',
+                    'bytes': len(files[lang][section].encode('utf-8')),
+                    'keys': len(tables[lang][section]),
+                }
+                for lang in languages if section in files[lang]
+            }
+            for section in sections
+        },
+    }
+
+def render_loaders(sections, files, languages=LANGUAGES, loaders_file=LOADERS_FILE,
+                   sections_dir=SECTIONS_DIR):
+    """Módulo TS con un require() diferido por idioma y sección.
+
+    Metro solo admite require() con rutas literales, así que cada archivo
+    necesita su propia función; el JSON se evalúa recién cuando se llama.
+    """
+    relative = Path('..') / sections_dir.relative_to(PROJECT_ROOT)
+    lines = [
+        '/**',
+        ' * Generado por scripts/build_locale_bundles.py: no editar a mano.',
+        ' * Un require() diferido por idioma y sección de locales/sections/.',
+        ' */',
+        '',
+        "export type SectionLanguage = " + ' | '.join(f"'{lang}'" for lang in languages) + ';',
+        '',
+        'export const LOCALE_SECTIONS = [',
+        *(f"  '{section}'," for section in sections),
+        '] as const;',
+        '',
+        'export type LocaleSection = (typeof LOCALE_SECTIONS)[number];',
+        '',
+        '// Texto, o partes [texto, placeholder, texto, ...] si tiene {{var}}',
+        'export type SectionValue = string | string[];',
+        '',
+        'export type SectionTable = Record<string, SectionValue>;',
+        '',
+        '// Tal como está en el JSON: un número es un índice de la tabla de strings',
+        'export type RawSectionTable = Record<string, SectionValue | number>;',
+        '',
+        'export const STRING_TABLES: Record<SectionLanguage, () => string[]> = {',
+        *(f"  {lang}: () => require('{(relative / STRINGS_FILE.format(lang=lang)).as_posix()}'),"
+          for lang in languages),
+        '};',
+        '',
+        'export const SECTION_LOADERS: Record<SectionLanguage, '
+        'Partial<Record<LocaleSection, () => RawSectionTable>>> = {',
+    ]
+    for lang in languages:
+        lines.append(f'  {lang}: {{')
+        for section in sections:
+            if section in files[lang]:
+                path = (relative / lang / f'{section}.json').as_posix()
+                lines.append(f"    {section}: () => require('{path}'),")
+        lines.append('  },')
+    lines.append('};')
+    return '\n'.join(lines) + '\n'
+
+def remove_stale(files, sections_dir=SECTIONS_DIR):
+    """Borra los JSON de secciones que ya no existen; devuelve las rutas borradas"""
+    removed = []
+    for path in sorted(Path(sections_dir).glob('*/*.json')):
+        lang, section = path.parent.name, path.stem
+        if section not in files.get(lang, {}):
+            path.unlink()
+            removed.append(path)
+    return removed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--check', action='store_true',
+        help='no escribir nada; salir con 1 si los archivos generados están desactualizados'
+    )
+    parser.add_argument(
+        '--prune', action='store_true',
+        help='dejar fuera las claves que el código no referencia '
+             f'(ver prune_locale_keys.py) y guardar el informe en {REPORT_FILE.name}'
+    )
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1, metavar='N',
+        help='procesos para analizar el código con --prune'
+    )
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    locales = load_locales()
+    report = None
+    if args.prune:
+        usage = KeyUsage(*collect_references(jobs=args.jobs))
+        locales, report = prune_locales(locales, usage)
+    sections = section_order(locales)
+    tables = split_sections(locales)
+    files = {}
+    strings = {}
+    for lang, per_section in tables.items():
+        interned, shared = intern_strings(per_section)
+        files[lang] = {section: serialize_section(table) for section, table in interned.items()}
+        strings[lang] = serialize_section(shared)
+    mismatches = placeholder_mismatches(tables)
+    manifest = build_manifest(tables, files, sections, strings, pruned=args.prune,
+                              mismatches=mismatches)
+
+    outputs = {SECTIONS_DIR / lang / f'{section}.json': text
+               for lang, per_section in files.items() for section, text in per_section.items()}
+    for lang, text in strings.items():
+        outputs[SECTIONS_DIR / STRINGS_FILE.format(lang=lang)] = text
+    outputs[MANIFEST_FILE] = json.dumps(manifest, ensure_ascii=False, indent=2) + '\n'
+    outputs[LOADERS_FILE] = render_loaders(sections, files)
+    if report:
+        outputs[REPORT_FILE] = serialize_report(report)
+
+    if args.check:
+        stale = [path for path, text in outputs.items()
+                 if not path.exists() or path.read_text(encoding='utf-8') != text]
+        for path in stale:
+            print(f"❌ Desactualizado: {path.relative_to(PROJECT_ROOT)}")
+        if not stale:
+            print("✅ Los archivos generados están al día")
+        sys.exit(1 if stale else 0)
+
+    written = []
+    for path, text in outputs.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if write_if_changed(path, text):
+            written.append(path)
+    removed = remove_stale(files)
+    elapsed = (time.perf_counter() - start) * 1000
+    interning = interning_report(tables, files, strings)
+
+    print(f"✅ {len(sections)} secciones x {len(LANGUAGES)} idiomas en {elapsed:.0f} ms")
+    for lang in LANGUAGES:
+        full = sum(info[lang]['bytes'] for info in manifest['sections'].values() if lang in info)
+        largest = max((info[lang]['bytes'], section)
+                      for section, info in manifest['sections'].items() if lang in info)
+        print(f"   - {lang}: {full / 1024:.0f} KB en total, la mayor es "
+              f"{largest[1]} ({largest[0] / 1024:.1f} KB)")
+    for lang, info in interning.items():
+        shared = len(json.loads(strings[lang]))
+        print(f"   - {lang}: {shared} textos compartidos, "
+              f"{info['bytesBefore'] / 1024:.1f} KB -> {info['bytesAfter'] / 1024:.1f} KB "
+              f"({info['bytesAfter'] - info['bytesBefore']:+d} bytes), parseo "
+              f"{info['parseBefore']:.2f} ms -> {info['parseAfter']:.2f} ms")
+    templates = sum(isinstance(value, list) for per_section in tables.values()
+                    for table in per_section.values() for value in table.values())
+    print(f"   - {templates} textos con {{{{var}}}} precompilados")
+    for section, key, found in mismatches:
+        print(f"⚠️  Placeholders distintos en {section}.{key}: "
+              + ', '.join(f"{lang} {names}" for lang, names in found.items()))
+    if report:
+        print_report(report)
+    for path in written:
+        print(f"   - Guardado: {path.relative_to(PROJECT_ROOT)}")
+    for path in removed:
+        print(f"   - Borrado: {path.relative_to(PROJECT_ROOT)}")
+
+if __name__ == '__main__':
+    main()
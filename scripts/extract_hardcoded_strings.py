@@ -2,14 +2,43 @@
 """
 Extrae todos los strings hardcodeados en español de los archivos TSX/TS
 """
+import os
 import re
+import sys
 import json
+import hashlib
+import mmap
+import argparse
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
+from bisect import bisect_right
 from pathlib import Path
 from collections import defaultdict
 
+from language_classifier import CLASSIFIER
+from locale_store import LANGUAGES, LOCALES_DIR, PROJECT_ROOT, load_locales, write_if_changed
+from tsx_lexer import tokenize
+
 # Directorios a escanear
 SCAN_DIRS = ['app', 'components', 'lib']
-PROJECT_ROOT = Path('/home/ubuntu/mib2_controller')
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+JSONL_FILE = PROJECT_ROOT / 'scripts' / 'hardcoded_strings.jsonl'
+TRANSLATION_RESULTS_FILE = PROJECT_ROOT / 'scripts' / 'translation-check-results.json'
+CACHE_FILE = PROJECT_ROOT / 'scripts' / '.hardcoded_strings_cache.json'
+# Módulos de los que dependen los resultados cacheados: el clasificador
+# decide qué es español y el lexer encuentra los literales con --lexer
+CACHE_DEPENDENCIES = ('extract_hardcoded_strings.py', 'language_classifier.py', 'tsx_lexer.py')
+SOURCE_EXTENSIONS = ('.ts', '.tsx')
+MMAP_THRESHOLD = 256 * 1024
+
+# Directorios en los que no se desciende (además de los que empiezan con '.')
+IGNORED_DIRS = frozenset({
+    'node_modules', 'build', 'dist', 'dist-android', 'coverage',
+    'android', 'ios', '__generated__',
+})
 
 # Patrones para detectar strings en español
 PATTERNS = [
@@ -25,97 +54,994 @@ PATTERNS = [
     r'showAlert\(["\']([^"\']+)["\']',
 ]
 
+# Nombre de cada patrón, en el mismo orden que PATTERNS
+PATTERN_NAMES = ['jsx_text', 'text_prop', 'object_prop', 'alert', 'show_alert']
+# Patrones que solo pueden coincidir en JSX: en un .ts no se buscan
+JSX_PATTERNS = frozenset({0, 1})
+
+# Compilados una sola vez al importar. Cada patrón conserva su regex propia:
+# en el motor re de CPython una alternancia única de los cinco pierde la
+# búsqueda rápida por prefijo literal ('<Text', 'Alert.alert(', ...) y
+# resulta varias veces más lenta que cinco re.finditer precompilados
+# (ver scripts/benchmark_extractor.py).
+COMPILED_PATTERNS = [re.compile(pattern, re.MULTILINE) for pattern in PATTERNS]
+PATTERN_LABELS = [pattern[:30] for pattern in PATTERNS]
+
+# Props JSX y claves de objeto que PATTERNS considera texto de UI
+TEXT_PROPS = ('text', 'title', 'label', 'placeholder', 'description')
+TEXT_KEYS = ('text', 'title', 'label', 'message', 'description')
+
+# Tokens sin los cuales ningún patrón de PATTERNS puede coincidir: cada
+# patrón exige '<Text', 'Alert.alert(', 'showAlert(' o una de sus palabras
+# clave seguida directamente de '=' o ':'.
+PREFILTER_TOKENS = (
+    b'<Text', b'Alert.alert(', b'showAlert(',
+    b'text=', b'title=', b'label=', b'placeholder=', b'description=',
+    b'text:', b'title:', b'label:', b'message:', b'description:',
+)
+
+# Llamadas t('clave'), t("clave") o t(`clave`) sin interpolación. El
+# lookbehind descarta métodos y funciones que terminan en "t" (split(',')
+# o text('user_id'), por ejemplo), que check-translations.js confundía
+# con claves.
+TRANSLATION_CALL = re.compile(
+    r"""(?<![\w$.])t\(\s*(?:'([^'\n]+)'|"([^"\n]+)"|`([^`$\n]+)`)\s*[,)]"""
+)
+# Prefiltro de TRANSLATION_CALL sobre los bytes crudos: t( con el mismo
+# lookbehind, pero sin la comilla, porque TRANSLATION_CALL admite espacios
+# y saltos de línea entre el paréntesis y la clave. Un b't(' a secas
+# también coincide con split(, set(, get(... y casi ningún archivo se descarta
+KEY_PREFILTER = re.compile(rb'(?<![\w$.])t\(')
+
+# Forma de una clave real: segmentos separados por puntos que empiezan
+# con letra o '_' (descarta ',', 'Set-Cookie', '192.168.1.4'...)
+TRANSLATION_KEY = re.compile(r'[^\W\d][\w]*(?:\.[^\W\d][\w]*)*')
+
 def is_spanish_text(text):
     """Detecta si un texto está en español"""
-    text = text.strip()
-    if not text or len(text) < 3:
-        return False
-    
-    # Palabras comunes en español
-    spanish_words = [
-        'el', 'la', 'los', 'las', 'un', 'una', 'de', 'del', 'al',
-        'con', 'sin', 'por', 'para', 'en', 'es', 'está', 'son',
-        'configuración', 'conexión', 'dispositivo', 'error', 'éxito',
-        'conectar', 'desconectar', 'escanear', 'guardar', 'cancelar',
-        'aceptar', 'continuar', 'sí', 'no', 'advertencia', 'información'
+    return CLASSIFIER.is_spanish(text)
+
+class LineIndex:
+    """Índice de inicios de línea de un archivo.
+
+    Se construye una sola vez por archivo y convierte offsets en
+    (línea, columna) con búsqueda binaria, en lugar de recontar los
+    saltos de línea del prefijo en cada coincidencia.
+    """
+
+    def __init__(self, content):
+        self.starts = [0] + [m.end() for m in re.finditer('\n', content)]
+
+    def locate(self, offset):
+        """Devuelve (línea, columna), ambas desde 1"""
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+def find_candidates(content, jsx=True):
+    """Candidatos del contenido como (índice de patrón, offset, texto).
+
+    El orden es el histórico del extractor: primero por patrón y luego
+    por posición. PATTERN_NAMES[índice] indica qué patrón los encontró.
+    Con jsx=False (archivos .ts) se omiten los patrones de JSX_PATTERNS.
+    """
+    return [
+        (index, match.start(), match.group(1))
+        for index, regex in enumerate(COMPILED_PATTERNS)
+        if jsx or index not in JSX_PATTERNS
+        for match in regex.finditer(content)
     ]
-    
-    # Caracteres españoles
-    if any(c in text.lower() for c in 'áéíóúñ¿¡'):
-        return True
-    
-    # Palabras españolas
-    words = text.lower().split()
-    if any(word in spanish_words for word in words):
-        return True
-    
-    return False
 
-def extract_strings_from_file(file_path):
-    """Extrae strings hardcodeados de un archivo"""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-    except:
-        return []
-    
+def find_candidates_legacy(content, jsx=True):
+    """re.finditer sobre los PATTERNS sin compilar (referencia de paridad)"""
+    return [
+        (index, match.start(), match.group(1))
+        for index, pattern in enumerate(PATTERNS)
+        if jsx or index not in JSX_PATTERNS
+        for match in re.finditer(pattern, content, re.MULTILINE)
+    ]
+
+def lexer_pattern_index(literal):
+    """Patrón de PATTERNS equivalente a un Literal del lexer, o None.
+
+    Reproduce los contextos que buscan las regex (texto JSX, props y
+    claves de texto, Alert.alert, showAlert), pero con los límites
+    exactos de cada literal.
+    """
+    owner = (literal.owner or '').lower()
+    if literal.kind == 'jsx_text':
+        return 0
+    if literal.role == 'attr' and owner.endswith(TEXT_PROPS):
+        return 1
+    if literal.role == 'key' and owner.endswith(TEXT_KEYS):
+        return 2
+    if literal.role == 'call' and owner.endswith('alert.alert'):
+        return 3
+    if literal.role == 'call' and owner.endswith('showalert'):
+        return 4
+    return None
+
+def find_candidates_lexer(content, jsx=True):
+    """Candidatos obtenidos con tsx_lexer en lugar de las regex.
+
+    A diferencia de PATTERNS, encuentra textos JSX de varias líneas o
+    partidos por expresiones {...}, fragmentos de template literals y
+    todos los argumentos de Alert.alert/showAlert. El offset es el del
+    literal y el orden es el de aparición en el archivo.
+    """
+    candidates = []
+    for literal in tokenize(content, jsx=jsx):
+        index = lexer_pattern_index(literal)
+        if index is not None:
+            candidates.append((index, literal.start, literal.value))
+    return candidates
+
+# Finders disponibles desde la línea de comandos
+FINDERS = {'regex': find_candidates, 'lexer': find_candidates_lexer}
+
+def extract_strings_from_content(content, finder=find_candidates, jsx=True):
+    """Extrae strings hardcodeados del contenido de un archivo"""
     found_strings = []
-    
-    for pattern in PATTERNS:
-        matches = re.finditer(pattern, content, re.MULTILINE)
-        for match in matches:
-            text = match.group(1).strip()
-            if is_spanish_text(text):
-                line_num = content[:match.start()].count('\n') + 1
-                found_strings.append({
-                    'text': text,
-                    'line': line_num,
-                    'pattern': pattern[:30]
-                })
-    
+    line_index = LineIndex(content)
+    candidates = finder(content, jsx=jsx)
+    texts = [raw_text.strip() for _, _, raw_text in candidates]
+
+    for (index, offset, _), text, spanish in zip(
+            candidates, texts, CLASSIFIER.is_spanish_batch(texts)):
+        if spanish:
+            line_num, column = line_index.locate(offset)
+            found_strings.append({
+                'text': text,
+                'line': line_num,
+                'column': column,
+                'pattern': PATTERN_LABELS[index]
+            })
+
     return found_strings
 
-def main():
-    all_strings = defaultdict(list)
-    
+def has_trigger_tokens(data, tokens=PREFILTER_TOKENS):
+    """Prefiltro sobre los bytes crudos: ¿aparece alguno de los tokens?"""
+    return any(token in data for token in tokens)
+
+def extract_keys_from_content(content):
+    """Claves de traducción usadas en t() dentro del contenido, ordenadas"""
+    keys = set()
+    for match in TRANSLATION_CALL.finditer(content):
+        key = match.group(1) or match.group(2) or match.group(3)
+        if TRANSLATION_KEY.fullmatch(key):
+            keys.add(key)
+    return sorted(keys)
+
+def read_source_bytes(file_path):
+    """(bytes, (mtime_ns, tamaño)) del archivo; los grandes se leen con mmap.
+
+    El stat se toma antes de leer: si el archivo cambia durante la
+    lectura, la caché queda con el mtime viejo y la próxima pasada lo
+    vuelve a verificar, en vez de guardar resultados viejos con el mtime
+    nuevo.
+    """
+    with open(file_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stat.st_size < MMAP_THRESHOLD:
+            return f.read(), stamp
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:], stamp
+
+def extract_file(file_path, finder=find_candidates, prefilter=True, source=None,
+                 check_keys=False):
+    """Extrae un archivo con una sola lectura.
+
+    Del mismo contenido decodificado salen los strings hardcodeados y,
+    con check_keys, las claves usadas en t() (si no, claves es None para
+    que la caché no las dé por vacías). source es el (bytes, (mtime_ns,
+    tamaño)) de read_source_bytes() si el archivo ya se leyó
+    (ExtractionCache.lookup() lo lee para comparar el hash); si no, se
+    lee acá. Devuelve (sha256 del
+    contenido, strings, claves, descartado, (mtime_ns, tamaño) previo a la
+    lectura), donde descartado indica que el prefiltro evitó decodificar
+    el archivo y pasarle las regex.
+    """
+    if source is None:
+        try:
+            source = read_source_bytes(file_path)
+        except OSError:
+            return None, [], [], False, None
+    data, stamp = source
+
+    digest = hashlib.sha256(data).hexdigest()
+    # Los tokens del prefiltro solo cubren los contextos de PATTERNS
+    wants_strings = (not prefilter or finder is find_candidates_lexer
+                     or has_trigger_tokens(data))
+    wants_keys = check_keys and (not prefilter or KEY_PREFILTER.search(data) is not None)
+    keys = [] if check_keys else None
+    if not wants_strings and not wants_keys:
+        return digest, [], keys, True, stamp
+
+    try:
+        # Mismos saltos de línea que read_text() (modo universal)
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    except UnicodeDecodeError:
+        return digest, [], keys, False, stamp
+
+    jsx = file_path.suffix == '.tsx'
+    strings = (extract_strings_from_content(content, finder, jsx)
+               if wants_strings else [])
+    if wants_keys:
+        keys = extract_keys_from_content(content)
+    return digest, strings, keys, False, stamp
+
+def extract_strings_from_file(file_path, finder=find_candidates, prefilter=True):
+    """Extrae strings hardcodeados de un archivo"""
+    return extract_file(file_path, finder, prefilter)[1]
+
+class ExtractionCache:
+    """Caché persistente de resultados por archivo.
+
+    Cada entrada guarda mtime, tamaño, sha256 del contenido, los strings
+    encontrados y las claves usadas en t(). Si mtime y tamaño no
+    cambiaron, el archivo ni se lee; si cambiaron pero el hash es el
+    mismo, se reutilizan los resultados. La caché completa se invalida
+    cuando cambia este script, alguno de los módulos de los que dependen
+    los resultados (CACHE_DEPENDENCIES) o la variante (el finder usado).
+    """
+
+    def __init__(self, path, variant=''):
+        self.path = path
+        scripts_dir = Path(__file__).resolve().parent
+        digest = hashlib.sha256()
+        for name in CACHE_DEPENDENCIES:
+            digest.update(hashlib.sha256((scripts_dir / name).read_bytes()).digest())
+        self.version = f'{digest.hexdigest()}:{variant}'
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.version:
+            self.entries = data.get('files', {})
+
+    def lookup(self, key, file_path, check_keys=False):
+        """(cacheado, leído) de un archivo.
+
+        cacheado es (strings, claves), o None si hay que extraerlo (también
+        si se piden claves y la entrada se guardó sin ellas). leído
+        es el resultado de read_source_bytes() cuando hubo que leer el
+        archivo para comparar el hash y no coincidió: se pasa como source
+        a extract_file() para no volver a leerlo.
+        """
+        entry = self.entries.get(key)
+        if entry is None or (check_keys and entry['keys'] is None):
+            self.misses += 1
+            return None, None
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            self.misses += 1
+            return None, None
+
+        if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            try:
+                source = read_source_bytes(file_path)
+            except OSError:
+                self.misses += 1
+                return None, None
+            data, stamp = source
+            if hashlib.sha256(data).hexdigest() != entry['sha256']:
+                self.misses += 1
+                return None, source
+            entry['mtime_ns'], entry['size'] = stamp
+
+        self.hits += 1
+        return (entry['strings'], entry['keys']), None
+
+    def store(self, key, stamp, digest, strings, keys):
+        """Guarda los resultados con el (mtime_ns, tamaño) tomado antes de leer"""
+        if digest is None or stamp is None:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = {
+            'mtime_ns': stamp[0],
+            'size': stamp[1],
+            'sha256': digest,
+            'strings': strings,
+            'keys': keys,
+        }
+
+    def evict_missing(self, live_keys):
+        """Elimina las entradas de archivos que ya no existen"""
+        for key in set(self.entries) - set(live_keys):
+            del self.entries[key]
+            self.evicted += 1
+
+    def save(self):
+        write_if_changed(self.path, json.dumps(
+            {'version': self.version, 'files': self.entries},
+            ensure_ascii=False, separators=(',', ':')))
+
+def is_ignored_dir(name, ignored=IGNORED_DIRS):
+    return name.startswith('.') or name in ignored
+
+def walk_source_files(dir_path, ignored=IGNORED_DIRS):
+    """Recorre dir_path una sola vez con os.scandir.
+
+    Los directorios ignorados se podan antes de descender en ellos, y se
+    devuelven los .ts y .tsx de la misma pasada, ordenados por nombre
+    para que el resultado no dependa del sistema de archivos.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if not is_ignored_dir(entry.name, ignored):
+                yield from walk_source_files(entry.path, ignored)
+        elif entry.name.endswith(SOURCE_EXTENSIONS) and entry.is_file():
+            yield Path(entry.path)
+
+def iter_source_files(ignored=IGNORED_DIRS):
+    """Archivos .tsx y .ts de SCAN_DIRS"""
     for dir_name in SCAN_DIRS:
-        dir_path = PROJECT_ROOT / dir_name
-        if not dir_path.exists():
+        yield from walk_source_files(PROJECT_ROOT / dir_name, ignored)
+
+def is_scanned_path(relative_path, ignored=IGNORED_DIRS):
+    """Indica si una ruta relativa entra en el escaneo de SCAN_DIRS"""
+    parts = Path(relative_path).parts
+    return (
+        len(parts) > 1
+        and parts[0] in SCAN_DIRS
+        and not any(is_ignored_dir(part, ignored) for part in parts[1:-1])
+        and parts[-1].endswith(SOURCE_EXTENSIONS)
+    )
+
+def git_changed_files(ref, ignored=IGNORED_DIRS):
+    """Rutas (relativas a PROJECT_ROOT) modificadas respecto a ref.
+
+    Incluye cambios sin commitear y archivos nuevos sin trackear.
+    Devuelve (existentes, eliminados).
+    """
+    def git(*args):
+        result = subprocess.run(
+            ['git', *args], cwd=PROJECT_ROOT, capture_output=True,
+            text=True, check=True,
+        )
+        return [line for line in result.stdout.splitlines() if line]
+
+    # --no-renames: un archivo renombrado aparece como borrado (ruta
+    # vieja) más agregado (ruta nueva); si no, la ruta vieja nunca sale
+    # de hardcoded_strings.json
+    changed = git('diff', '--name-only', '--no-renames', '--relative', ref, '--', *SCAN_DIRS)
+    changed += git('ls-files', '--others', '--exclude-standard', '--', *SCAN_DIRS)
+
+    existing, deleted = [], []
+    for relative_path in dict.fromkeys(changed):
+        if not is_scanned_path(relative_path, ignored):
             continue
-        
-        # Buscar archivos .tsx y .ts
-        for file_path in dir_path.rglob('*.tsx'):
-            relative_path = file_path.relative_to(PROJECT_ROOT)
-            strings = extract_strings_from_file(file_path)
-            if strings:
-                all_strings[str(relative_path)] = strings
-        
-        for file_path in dir_path.rglob('*.ts'):
-            if 'node_modules' in str(file_path):
+        if (PROJECT_ROOT / relative_path).exists():
+            existing.append(relative_path)
+        else:
+            deleted.append(relative_path)
+    return existing, deleted
+
+def merge_changed(output_file, ref, finder=find_candidates, jobs=1, cache=None,
+                  ignored=IGNORED_DIRS, stats=None, prefilter=True):
+    """Escanea solo lo modificado respecto a ref y lo fusiona en output_file.
+
+    Las entradas de archivos sin cambios se conservan tal cual; las de
+    archivos modificados se reemplazan y las de archivos eliminados o ya
+    sin strings se quitan. Devuelve (resultados fusionados, strings
+    nuevos por archivo).
+    """
+    existing, deleted = git_changed_files(ref, ignored)
+
+    all_strings = {}
+    if output_file.exists():
+        with open(output_file, 'r', encoding='utf-8') as f:
+            all_strings = json.load(f)
+
+    changed = scan(finder=finder, jobs=jobs, cache=cache, stats=stats,
+                   prefilter=prefilter,
+                   files=[PROJECT_ROOT / path for path in existing])
+
+    new_strings = {}
+    for relative_path in existing:
+        key = str(Path(relative_path))
+        previous = {item['text'] for item in all_strings.get(key, [])}
+        strings = changed.get(key)
+        if strings:
+            all_strings[key] = strings
+            added = [item for item in strings if item['text'] not in previous]
+            if added:
+                new_strings[key] = added
+        else:
+            all_strings.pop(key, None)
+
+    for relative_path in deleted:
+        all_strings.pop(str(Path(relative_path)), None)
+
+    return all_strings, new_strings
+
+def iter_scan(finder=find_candidates, jobs=1, cache=None, files=None,
+              ignored=IGNORED_DIRS, stats=None, prefilter=True, check_keys=False):
+    """Escanea SCAN_DIRS y va devolviendo (ruta relativa, strings, claves).
+
+    claves son las usadas en t() en el archivo, solo con check_keys (si
+    no, siempre []). Cada archivo con strings
+    o claves se entrega apenas se procesa, en el orden de
+    iter_source_files(), sin acumular los resultados. Con jobs > 1 los
+    archivos se reparten en un pool de procesos y se recogen en ese mismo
+    orden, así que la salida es idéntica a la del escaneo secuencial. Con
+    una ExtractionCache solo se extraen los archivos que cambiaron. files
+    restringe el escaneo a esos archivos. Si se pasa stats, al terminar
+    se anotan en él los segundos del recorrido ('walk') y de la
+    extracción ('extract'), más el número de archivos ('files') y de
+    archivos descartados por el prefiltro ('skipped').
+    """
+    started = time.perf_counter()
+    full_scan = files is None
+    if full_scan:
+        files = list(iter_source_files(ignored))
+    walked = time.perf_counter()
+    keys = [str(file_path.relative_to(PROJECT_ROOT)) for file_path in files]
+
+    lookups = [
+        (key, file_path,
+         *(cache.lookup(key, file_path, check_keys) if cache else (None, None)))
+        for key, file_path in zip(keys, files)
+    ]
+    pending = [(file_path, source) for _, file_path, cached, source in lookups
+               if cached is None]
+    pending_files = [file_path for file_path, _ in pending]
+    pending_sources = [source for _, source in pending]
+
+    skipped = 0
+    with ExitStack() as stack:
+        if jobs > 1 and len(pending_files) > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+            chunksize = max(1, len(pending_files) // (jobs * 4))
+            extracted = pool.map(extract_file, pending_files, repeat(finder),
+                                 repeat(prefilter), pending_sources, repeat(check_keys),
+                                 chunksize=chunksize)
+        else:
+            extracted = (extract_file(file_path, finder, prefilter, source, check_keys)
+                         for file_path, source in pending)
+
+        for key, file_path, cached, _ in lookups:
+            if cached is None:
+                digest, strings, used_keys, prefiltered, stamp = next(extracted)
+                skipped += prefiltered
+                if cache:
+                    cache.store(key, stamp, digest, strings, used_keys)
+            else:
+                strings, used_keys = cached
+            used_keys = used_keys if check_keys else []
+            if strings or used_keys:
+                yield key, strings, used_keys
+
+    if cache and full_scan:
+        cache.evict_missing(keys)
+
+    if stats is not None:
+        stats['walk'] = walked - started
+        stats['extract'] = time.perf_counter() - walked
+        stats['files'] = len(files)
+        stats['skipped'] = skipped
+
+def scan_with_keys(**kwargs):
+    """Escanea SCAN_DIRS y devuelve ({ruta relativa: strings}, claves de t()).
+
+    Acepta los mismos argumentos que iter_scan().
+    """
+    all_strings = defaultdict(list)
+    used_keys = set()
+    for key, strings, keys in iter_scan(**kwargs):
+        if strings:
+            all_strings[key] = strings
+        used_keys.update(keys)
+    return all_strings, used_keys
+
+def scan(**kwargs):
+    """Escanea SCAN_DIRS y devuelve {ruta relativa: strings}"""
+    return scan_with_keys(**kwargs)[0]
+
+def key_exists(translations, key):
+    """Misma regla que check-translations.js: la ruta existe en el locale"""
+    current = translations
+    for part in key.split('.'):
+        if not isinstance(current, dict) or part not in current:
+            return False
+        current = current[part]
+    return True
+
+def translation_check_results(used_keys, locales=None):
+    """Resultados con la forma de translation-check-results.json.
+
+    locales es el resultado de load_locales(); si no se pasa, se leen
+    los archivos.
+    """
+    if locales is None:
+        locales = load_locales()
+    results = {
+        'totalUsedKeys': len(used_keys),
+        'usedKeys': sorted(used_keys),
+    }
+    for lang in LANGUAGES:
+        translations = locales[lang]
+        results[f'missingIn{lang.capitalize()}'] = sorted(
+            key for key in used_keys if not key_exists(translations, key)
+        )
+    return results
+
+def write_jsonl(results, jsonl_file):
+    """Escribe un objeto JSON por string encontrado, archivo a archivo.
+
+    Cada línea es {"file": ruta, "text", "line", "column", "pattern"} y se
+    vuelca al disco en cuanto termina cada archivo, para que otras
+    herramientas puedan leerla mientras el escaneo sigue. Devuelve
+    ({ruta: cantidad}, {etiqueta de patrón: cantidad}).
+    """
+    file_counts = {}
+    pattern_counts = defaultdict(int)
+    with open(jsonl_file, 'w', encoding='utf-8') as f:
+        for key, strings in results:
+            for item in strings:
+                f.write(json.dumps({'file': key, **item}, ensure_ascii=False))
+                f.write('\n')
+                pattern_counts[item['pattern']] += 1
+            f.flush()
+            file_counts[key] = len(strings)
+    return file_counts, pattern_counts
+
+def iter_jsonl(jsonl_file):
+    """Lee un JSONL de write_jsonl() línea a línea"""
+    with open(jsonl_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def compact_jsonl(jsonl_file):
+    """Agrupa un JSONL de write_jsonl() en el formato de hardcoded_strings.json"""
+    all_strings = defaultdict(list)
+    for record in iter_jsonl(jsonl_file):
+        key = record.pop('file')
+        all_strings[key].append(record)
+    return all_strings
+
+def serialize_results(all_strings):
+    """Texto exacto que se guarda en hardcoded_strings.json"""
+    return json.dumps(all_strings, indent=2, ensure_ascii=False)
+
+def check_parity(output_file):
+    """Compara el extractor actual con el escaneo original.
+
+    El escaneo original (PATTERNS sin compilar y sin prefiltro) y el
+    actual deben producir byte a byte el mismo hardcoded_strings.json, y
+    las etiquetas de patrón del archivo guardado deben seguir siendo las
+    que emite el extractor.
+    """
+    compiled = serialize_results(scan(finder=find_candidates))
+    legacy = serialize_results(scan(finder=find_candidates_legacy, prefilter=False))
+    ok = compiled == legacy
+
+    if ok:
+        print("✅ Paridad: el extractor coincide con el escaneo original")
+    else:
+        print("❌ Paridad: el extractor difiere del escaneo original")
+
+    if output_file.exists():
+        with open(output_file, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        labels = {item['pattern'] for strings in saved.values() for item in strings}
+        unknown = labels - set(PATTERN_LABELS)
+        if unknown:
+            ok = False
+            print(f"❌ Etiquetas de patrón desconocidas en {output_file}: {sorted(unknown)}")
+        else:
+            print(f"✅ Etiquetas de patrón de {output_file} reconocidas")
+
+    return ok
+
+def file_stamp(file_path):
+    """(mtime_ns, tamaño) de un archivo, o None si ya no existe"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class SourceWatcher:
+    """Proceso residente que mantiene hardcoded_strings.json al día.
+
+    Guarda en memoria los resultados de cada archivo y, por sondeo de
+    mtime y tamaño, detecta qué archivos de SCAN_DIRS cambiaron,
+    aparecieron o se borraron. Los cambios se agrupan hasta que pasan
+    debounce segundos sin novedades; entonces solo esos archivos se
+    vuelven a extraer y las salidas se reescriben de forma atómica, y
+    solo si su contenido cambió. Con check_keys también mantiene
+    translation-check-results.json, y vuelve a leer los locales solo
+    cuando cambian.
+    """
+
+    def __init__(self, output_file, finder=find_candidates, jobs=1, cache=None,
+                 ignored=IGNORED_DIRS, prefilter=True, check_keys=False):
+        self.output_file = output_file
+        self.finder = finder
+        self.jobs = jobs
+        self.cache = cache
+        self.ignored = ignored
+        self.prefilter = prefilter
+        self.check_keys = check_keys
+        # {ruta relativa: (strings, claves)}
+        self.results = {}
+        # {ruta relativa: (Path, sello)} de los archivos ya extraídos
+        self.sources = {}
+        self.locale_stamps = None
+        self.locales = None
+        self.key_results = None
+        self.written = {}
+
+    def poll_sources(self):
+        """{ruta relativa: (Path, sello)} de SCAN_DIRS, en orden de recorrido"""
+        sources = {}
+        for file_path in iter_source_files(self.ignored):
+            stamp = file_stamp(file_path)
+            if stamp is not None:
+                sources[str(file_path.relative_to(PROJECT_ROOT))] = (file_path, stamp)
+        return sources
+
+    def poll_locales(self):
+        if not self.check_keys:
+            return None
+        return tuple(file_stamp(LOCALES_DIR / f'{lang}.json') for lang in LANGUAGES)
+
+    def poll(self):
+        return self.poll_sources(), self.poll_locales()
+
+    def start(self):
+        """Escaneo completo inicial; devuelve lo mismo que refresh()"""
+        started = time.perf_counter()
+        sources, locale_stamps = self.poll()
+        self.results = {
+            key: (strings, keys)
+            for key, strings, keys in iter_scan(
+                finder=self.finder, jobs=self.jobs, cache=self.cache,
+                ignored=self.ignored, prefilter=self.prefilter, check_keys=self.check_keys)
+        }
+        self.sources = sources
+        if locale_stamps != self.locale_stamps:
+            self.locale_stamps = locale_stamps
+            self.locales = load_locales() if self.check_keys else None
+        written = self.write()
+        return list(sources), [], {}, written, time.perf_counter() - started
+
+    def refresh(self, sources, locale_stamps):
+        """Vuelve a extraer solo lo que cambió respecto al último lote.
+
+        Devuelve (rutas reextraídas, rutas eliminadas, {ruta: strings
+        nuevos}, salidas reescritas, segundos).
+        """
+        started = time.perf_counter()
+        changed = [
+            key for key, (_, stamp) in sources.items()
+            if key not in self.sources or self.sources[key][1] != stamp
+        ]
+        removed = [key for key in self.sources if key not in sources]
+
+        previous = {}
+        for key in changed + removed:
+            strings, _ = self.results.pop(key, ([], []))
+            previous[key] = {item['text'] for item in strings}
+
+        files = [sources[key][0] for key in changed]
+        # Un pool solo compensa con muchos archivos (un checkout, un rebase)
+        jobs = self.jobs if len(files) > self.jobs * 4 else 1
+        new_strings = {}
+        for key, strings, keys in iter_scan(
+                finder=self.finder, jobs=jobs, cache=self.cache, files=files,
+                ignored=self.ignored, prefilter=self.prefilter, check_keys=self.check_keys):
+            self.results[key] = (strings, keys)
+            added = [item for item in strings if item['text'] not in previous[key]]
+            if added:
+                new_strings[key] = added
+
+        self.sources = sources
+        if locale_stamps != self.locale_stamps:
+            self.locale_stamps = locale_stamps
+            self.locales = load_locales()
+        written = self.write()
+        return changed, removed, new_strings, written, time.perf_counter() - started
+
+    def all_strings(self):
+        """Resultados con el orden y la forma de scan()"""
+        return {
+            key: self.results[key][0]
+            for key in self.sources
+            if key in self.results and self.results[key][0]
+        }
+
+    def used_keys(self):
+        return {key for _, keys in self.results.values() for key in keys}
+
+    def write(self):
+        """Reescribe las salidas cuyo contenido cambió; devuelve sus rutas"""
+        outputs = {self.output_file: serialize_results(self.all_strings())}
+        if self.check_keys:
+            self.key_results = translation_check_results(self.used_keys(), self.locales)
+            outputs[TRANSLATION_RESULTS_FILE] = json.dumps(
+                self.key_results, indent=2, ensure_ascii=False)
+
+        written = []
+        for path, text in outputs.items():
+            if self.written.get(path) != text:
+                self.written[path] = text
+                if write_if_changed(path, text):
+                    written.append(path)
+        return written
+
+    def run(self, interval=0.05, debounce=0.05, on_batch=None):
+        """Sondea cada interval segundos hasta que se interrumpa.
+
+        Un lote se procesa cuando el árbol lleva debounce segundos sin
+        cambios, así que guardar varios archivos seguidos (o un checkout)
+        produce una sola reescritura. on_batch recibe lo que devuelve
+        refresh().
+        """
+        observed = (self.sources, self.locale_stamps)
+        changed_at = None
+        while True:
+            time.sleep(interval)
+            current = self.poll()
+            if current != observed:
+                observed = current
+                changed_at = time.monotonic()
                 continue
-            relative_path = file_path.relative_to(PROJECT_ROOT)
-            strings = extract_strings_from_file(file_path)
-            if strings:
-                all_strings[str(relative_path)] = strings
+            if changed_at is not None and time.monotonic() - changed_at >= debounce:
+                changed_at = None
+                batch = self.refresh(*current)
+                if on_batch:
+                    on_batch(*batch)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--check-parity', action='store_true',
+        help='verificar que el extractor produce lo mismo que el escaneo original'
+    )
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1, metavar='N',
+        help='procesos en paralelo para el escaneo (0 = uno por CPU)'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help=f'ignorar y no actualizar la caché incremental ({CACHE_FILE.name})'
+    )
+    parser.add_argument(
+        '--since', metavar='REF',
+        help='escanear solo los archivos modificados respecto a REF y '
+             'fusionarlos en el hardcoded_strings.json existente'
+    )
+    parser.add_argument(
+        '--ignore', action='append', default=[], metavar='DIR',
+        help='nombre de directorio adicional a no recorrer (repetible); '
+             f'por defecto: {", ".join(sorted(IGNORED_DIRS))} y los que empiezan con "."'
+    )
+    parser.add_argument(
+        '--no-prefilter', action='store_true',
+        help='pasar las regex por todos los archivos, aunque no contengan '
+             'ningún token disparador'
+    )
+    parser.add_argument(
+        '--stream', nargs='?', const=JSONL_FILE, type=Path, metavar='JSONL',
+        help='escribir un objeto JSON por string a medida que se procesa cada '
+             f'archivo (por defecto en {JSONL_FILE.name}) en lugar de '
+             'acumular todo en memoria'
+    )
+    parser.add_argument(
+        '--compact', action='store_true',
+        help='convertir el JSONL de --stream al formato de hardcoded_strings.json '
+             '(sin --stream, convierte el JSONL existente y termina)'
+    )
+    parser.add_argument(
+        '--check-keys', action='store_true',
+        help='en la misma pasada, recolectar las claves usadas en t() y escribir '
+             f'{TRANSLATION_RESULTS_FILE.name} (reemplaza check-translations.js)'
+    )
+    parser.add_argument(
+        '--lexer', action='store_const', const='lexer', default='regex',
+        dest='finder',
+        help='usar el lexer de TS/TSX (tsx_lexer.py) en lugar de las regex de PATTERNS'
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help='quedarse corriendo y volver a extraer solo los archivos que '
+             'cambian, reescribiendo las salidas tras cada lote de cambios'
+    )
+    parser.add_argument(
+        '--interval', type=float, default=0.05, metavar='SEGUNDOS',
+        help='con --watch, cada cuánto se sondean los archivos (por defecto 0.05)'
+    )
+    parser.add_argument(
+        '--debounce', type=float, default=0.05, metavar='SEGUNDOS',
+        help='con --watch, tiempo sin cambios antes de procesar un lote '
+             '(por defecto 0.05)'
+    )
+    args = parser.parse_args(argv)
+    if args.watch and (args.since or args.stream or args.compact or args.check_parity):
+        parser.error('--watch no se puede combinar con --since, --stream, '
+                     '--compact ni --check-parity')
+    if args.interval <= 0 or args.debounce < 0:
+        parser.error('--interval debe ser > 0 y --debounce >= 0')
+    if args.stream and args.since:
+        parser.error('--stream no se puede combinar con --since')
+    if args.check_keys and args.since:
+        parser.error('--check-keys necesita el escaneo completo; no se puede '
+                     'combinar con --since')
+    args.ignore = IGNORED_DIRS | set(args.ignore)
+    if args.jobs < 0:
+        parser.error('--jobs debe ser >= 0')
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+def count_results(all_strings):
+    """({ruta: cantidad}, {etiqueta de patrón: cantidad}) de unos resultados"""
+    file_counts = {key: len(strings) for key, strings in all_strings.items()}
+    pattern_counts = defaultdict(int)
+    for strings in all_strings.values():
+        for item in strings:
+            pattern_counts[item['pattern']] += 1
+    return file_counts, pattern_counts
+
+def watch(args, output_file, cache):
+    """Modo --watch: escaneo inicial y luego un lote por cada tanda de cambios"""
+    watcher = SourceWatcher(
+        output_file, finder=FINDERS[args.finder], jobs=args.jobs, cache=cache,
+        ignored=args.ignore, prefilter=not args.no_prefilter,
+        check_keys=args.check_keys,
+    )
+
+    def report(changed, removed, new_strings, written, elapsed):
+        all_strings = watcher.all_strings()
+        total_strings = sum(len(strings) for strings in all_strings.values())
+        print(f"🔄 [{time.strftime('%H:%M:%S')}] {len(changed)} reextraídos, "
+              f"{len(removed)} eliminados en {elapsed * 1000:.1f} ms: "
+              f"{total_strings} strings en {len(all_strings)} archivos")
+        for path in written:
+            print(f"   - Guardado: {path}")
+        for file_path, strings in new_strings.items():
+            for item in strings:
+                print(f"   🆕 {file_path}:{item['line']}:{item['column']}: {item['text']}")
+        if watcher.check_keys and written:
+            for lang in LANGUAGES:
+                count = len(watcher.key_results[f'missingIn{lang.capitalize()}'])
+                if count:
+                    print(f"   ❌ Claves faltantes en {lang}.json: {count}")
+        sys.stdout.flush()
+
+    report(*watcher.start())
+    if cache:
+        cache.save()
+    print(f"👀 Observando {', '.join(SCAN_DIRS)} (Ctrl+C para salir)")
+    sys.stdout.flush()
+    try:
+        watcher.run(args.interval, args.debounce, on_batch=report)
+    except KeyboardInterrupt:
+        print("\n👋 Watch detenido")
+    finally:
+        if cache:
+            cache.save()
+
+def main():
+    args = parse_args()
+    output_file = PROJECT_ROOT / 'scripts' / 'hardcoded_strings.json'
+
+    if args.check_parity:
+        sys.exit(0 if check_parity(output_file) else 1)
+
+    if args.compact and not args.stream:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(serialize_results(compact_jsonl(JSONL_FILE)))
+        print(f"✅ {JSONL_FILE} compactado en {output_file}")
+        return
+
+    cache = None if args.no_cache else ExtractionCache(CACHE_FILE, args.finder)
+
+    if args.watch:
+        watch(args, output_file, cache)
+        return
+    new_strings = None
+    used_keys = set()
+    stats = {}
+    scan_options = dict(finder=FINDERS[args.finder], jobs=args.jobs, cache=cache, ignored=args.ignore,
+                        stats=stats, prefilter=not args.no_prefilter)
+    if args.since:
+        try:
+            all_strings, new_strings = merge_changed(
+                output_file, args.since, **scan_options)
+        except subprocess.CalledProcessError as e:
+            print(f"❌ git falló con la referencia {args.since!r}: {e.stderr.strip()}")
+            sys.exit(2)
+    elif args.stream:
+        def collect_keys(results):
+            for key, strings, keys in results:
+                used_keys.update(keys)
+                if strings:
+                    yield key, strings
+
+        file_counts, pattern_counts = write_jsonl(
+            collect_keys(iter_scan(**scan_options, check_keys=args.check_keys)), args.stream)
+    else:
+        all_strings, used_keys = scan_with_keys(**scan_options, check_keys=args.check_keys)
+    if cache:
+        cache.save()
     
     # Guardar resultados
-    output_file = PROJECT_ROOT / 'scripts' / 'hardcoded_strings.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_strings, f, indent=2, ensure_ascii=False)
+    if args.stream:
+        saved_to = args.stream
+        if args.compact:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(serialize_results(compact_jsonl(args.stream)))
+            saved_to = f"{args.stream} y {output_file}"
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(serialize_results(all_strings))
+        saved_to = output_file
+        file_counts, pattern_counts = count_results(all_strings)
     
     # Resumen
-    total_files = len(all_strings)
-    total_strings = sum(len(strings) for strings in all_strings.values())
+    total_files = len(file_counts)
+    total_strings = sum(file_counts.values())
     
     print(f"✅ Análisis completado:")
     print(f"   - Archivos con strings hardcodeados: {total_files}")
     print(f"   - Total de strings encontrados: {total_strings}")
-    print(f"   - Resultados guardados en: {output_file}")
+    print(f"   - Resultados guardados en: {saved_to}")
+    if cache:
+        print(f"   - Caché: {cache.hits} reutilizados, {cache.misses} escaneados, "
+              f"{cache.evicted} eliminados")
+    print(f"   - Tiempos: recorrido {stats['walk'] * 1000:.1f} ms, "
+          f"extracción {stats['extract'] * 1000:.1f} ms "
+          f"({stats['files']} archivos)")
+    print(f"   - Prefiltro: {stats['skipped']} archivos descartados sin "
+          f"decodificar ni aplicar regex")
     
     # Mostrar top 10 archivos con más strings
     print(f"\n📊 Top 10 archivos con más strings:")
-    sorted_files = sorted(all_strings.items(), key=lambda x: len(x[1]), reverse=True)
-    for file_path, strings in sorted_files[:10]:
-        print(f"   - {file_path}: {len(strings)} strings")
+    sorted_files = sorted(file_counts.items(), key=lambda x: x[1], reverse=True)
+    for file_path, count in sorted_files[:10]:
+        print(f"   - {file_path}: {count} strings")
+
+    # Qué patrón encontró cada string
+    print(f"\n📐 Strings por patrón:")
+    for name, label in zip(PATTERN_NAMES, PATTERN_LABELS):
+        print(f"   - {name}: {pattern_counts[label]}")
+
+    if args.check_keys:
+        results = translation_check_results(used_keys)
+        with open(TRANSLATION_RESULTS_FILE, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(results, indent=2, ensure_ascii=False))
+        print(f"\n🔑 Claves usadas en t(): {results['totalUsedKeys']}")
+        for lang in LANGUAGES:
+            missing = results[f'missingIn{lang.capitalize()}']
+            print(f"   - Faltantes en {lang}.json: {len(missing)}")
+            for key in missing:
+                print(f"      ❌ {key}")
+        print(f"   - Resultados guardados en: {TRANSLATION_RESULTS_FILE}")
+
+    if new_strings is not None:
+        total_new = sum(len(strings) for strings in new_strings.values())
+        print(f"\n🆕 Strings nuevos desde {args.since}: {total_new}")
+        for file_path, strings in new_strings.items():
+            for item in strings:
+                print(f"   - {file_path}:{item['line']}:{item['column']}: {item['text']}")
 
 if __name__ == '__main__':
     main()
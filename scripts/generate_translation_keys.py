@@ -4,29 +4,88 @@ Genera claves de traducción organizadas para todos los strings hardcodeados
 """
 import json
 import re
+import sys
+import hashlib
 from pathlib import Path
 from collections import defaultdict
 
-PROJECT_ROOT = Path('/home/ubuntu/mib2_controller')
+from extract_hardcoded_strings import compact_jsonl
+from locale_store import dotted, flatten_paths, write_locale
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 HARDCODED_FILE = PROJECT_ROOT / 'scripts' / 'hardcoded_strings.json'
+MAPPING_FILE = PROJECT_ROOT / 'scripts' / 'text_to_key_mapping.json'
 LOCALES_DIR = PROJECT_ROOT / 'locales'
 
+MAX_KEY_LENGTH = 50
+# Dígitos del sha1 del texto que desambiguan una clave ya ocupada
+HASH_LENGTH = 6
+
+# Quitar signos y acentos en una sola pasada de str.translate
+KEY_TRANSLATION = str.maketrans(
+    {'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u', 'ñ': 'n',
+     **dict.fromkeys('¿¡?!.,;:()-')}
+)
+
 def normalize_key(text):
     """Convierte texto a clave válida"""
-    # Remover caracteres especiales
-    key = re.sub(r'[¿¡?!.,;:()\-]', '', text.lower())
-    # Reemplazar espacios por guiones bajos
-    key = re.sub(r'\s+', '_', key)
-    # Remover acentos
-    replacements = {
-        'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u', 'ñ': 'n'
-    }
-    for old, new in replacements.items():
-        key = key.replace(old, new)
-    # Limitar longitud
-    if len(key) > 50:
-        key = key[:50]
-    return key
+    key = re.sub(r'\s+', '_', text.lower().translate(KEY_TRANSLATION))
+    return key[:MAX_KEY_LENGTH]
+
+class KeyAllocator:
+    """Asigna claves deterministas y sin colisiones a textos.
+
+    El índice de claves existentes (el locale español aplanado y el
+    mapeo texto → clave ya publicado) se construye una sola vez. Un
+    texto que ya tiene clave la conserva, esté en la sección que esté;
+    uno nuevo recibe categoría.normalize_key(texto) y, si esa clave ya
+    pertenece a otro texto, el sufijo _<sha1 del texto>. Como el sufijo
+    depende solo del texto, volver a ejecutar el script nunca cambia
+    las claves ya asignadas.
+    """
+
+    def __init__(self, locale, mapping=None):
+        # {clave completa: texto} de todas las hojas del locale
+        self.taken = {dotted(path): value for path, value in flatten_paths(locale).items()}
+        # Prefijos de sección: una clave nueva no puede pisar un subárbol
+        self.sections = {
+            key.rsplit('.', depth)[0]
+            for key in self.taken
+            for depth in range(1, key.count('.') + 1)
+        }
+        self.by_text = {}
+        for key, text in self.taken.items():
+            if isinstance(text, str):
+                self.by_text.setdefault(text, key)
+        for text, key in (mapping or {}).items():
+            if key not in self.sections:
+                self.by_text[text] = key
+
+    def is_free(self, key, text):
+        return key not in self.sections and self.taken.get(key, text) == text
+
+    def allocate(self, text, category):
+        """(clave completa, creada) para text; creada indica que no estaba en el locale"""
+        key = self.by_text.get(text)
+        if key is None:
+            key = f"{category}.{normalize_key(text) or 'text'}"
+            if not self.is_free(key, text):
+                digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+                length = HASH_LENGTH
+                while not self.is_free(f"{key}_{digest[:length]}", text):
+                    length += 2
+                key = f"{key}_{digest[:length]}"
+            self.by_text[text] = key
+        created = key not in self.taken
+        self.taken[key] = text
+        return key, created
+
+def set_nested(data, dotted_key, value):
+    """Asigna value en data siguiendo una clave con puntos"""
+    *parents, leaf = dotted_key.split('.')
+    for part in parents:
+        data = data.setdefault(part, {})
+    data[leaf] = value
 
 def categorize_by_file(file_path):
     """Determina la categoría basada en el archivo"""
@@ -58,37 +117,28 @@ def is_common_text(text):
     ]
     return any(word in text.lower() for word in common_words)
 
+def load_hardcoded(path):
+    """Carga hardcoded_strings.json o el JSONL de extract_hardcoded_strings.py --stream"""
+    if path.suffix == '.jsonl':
+        return compact_jsonl(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def main():
     # Cargar strings hardcodeados
-    with open(HARDCODED_FILE, 'r', encoding='utf-8') as f:
-        hardcoded_data = json.load(f)
-    
-    # Organizar por categoría
-    translations = defaultdict(dict)
-    key_counter = defaultdict(int)
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else HARDCODED_FILE
+    hardcoded_data = load_hardcoded(source)
     
+    # Categorías en las que aparece cada texto distinto
+    text_categories = defaultdict(set)
     for file_path, strings in hardcoded_data.items():
-        category = categorize_by_file(file_path)
-        
+        file_category = categorize_by_file(file_path)
         for item in strings:
             text = item['text']
-            
-            # Determinar si es común
-            if is_common_text(text):
-                category = 'common'
-            
-            # Generar clave única
-            base_key = normalize_key(text)
-            key = base_key
-            counter = key_counter[f"{category}.{base_key}"]
-            if counter > 0:
-                key = f"{base_key}_{counter}"
-            key_counter[f"{category}.{base_key}"] += 1
-            
-            full_key = f"{category}.{key}"
-            translations[category][key] = text
+            category = 'common' if is_common_text(text) else file_category
+            text_categories[text].add(category)
     
-    # Cargar locales existentes
+    # Cargar locales existentes y el mapeo ya publicado
     es_file = LOCALES_DIR / 'es.json'
     en_file = LOCALES_DIR / 'en.json'
     de_file = LOCALES_DIR / 'de.json'
@@ -98,22 +148,45 @@ def main():
         with open(es_file, 'r', encoding='utf-8') as f:
             existing_es = json.load(f)
     
-    # Merge con existentes
-    for category, strings in translations.items():
-        if category not in existing_es:
-            existing_es[category] = {}
-        existing_es[category].update(strings)
+    mapping = {}
+    if MAPPING_FILE.exists():
+        with open(MAPPING_FILE, 'r', encoding='utf-8') as f:
+            mapping = json.load(f)
     
-    # Guardar español (ya tenemos las traducciones)
-    with open(es_file, 'w', encoding='utf-8') as f:
-        json.dump(existing_es, f, indent=2, ensure_ascii=False)
+    # Un texto repetido en varias categorías va a 'common'. Se recorre en
+    # orden alfabético para que el resultado no dependa del orden de los
+    # archivos.
+    allocator = KeyAllocator(existing_es, mapping)
+    translations = defaultdict(dict)
+    reused = 0
+    for text in sorted(text_categories):
+        categories = text_categories[text]
+        category = next(iter(categories)) if len(categories) == 1 else 'common'
+        full_key, created = allocator.allocate(text, category)
+        mapping[text] = full_key
+        if created:
+            set_nested(existing_es, full_key, text)
+            translations[full_key.split('.', 1)[0]][full_key] = text
+        else:
+            reused += 1
+    
+    # Guardar español (ya tenemos las traducciones) y el mapeo
+    updated = []
+    for path, data in ((es_file, existing_es), (MAPPING_FILE, dict(sorted(mapping.items())))):
+        if write_locale(path, data):
+            updated.append(path)
     
     print(f"✅ Claves de traducción generadas:")
-    for category, strings in translations.items():
-        print(f"   - {category}: {len(strings)} claves")
+    for category, strings in sorted(translations.items()):
+        print(f"   - {category}: {len(strings)} claves nuevas")
+    print(f"   - Textos que ya tenían clave: {reused}")
     
-    print(f"\n📝 Archivos actualizados:")
-    print(f"   - {es_file}")
+    if updated:
+        print(f"\n📝 Archivos actualizados:")
+        for path in updated:
+            print(f"   - {path}")
+    else:
+        print(f"\n📝 Sin cambios en {es_file} ni en {MAPPING_FILE}")
     print(f"\n⚠️  NOTA: Necesitas traducir manualmente a inglés y alemán")
     print(f"   - Edita {en_file} y {de_file}")
 
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Clasificador de idioma (es/en/de) por lotes para strings de UI y locales
+"""
+import re
+import json
+import argparse
+
+from locale_store import PROJECT_ROOT, dotted, flatten_paths, load_locales
+
+HARDCODED_FILE = PROJECT_ROOT / 'scripts' / 'hardcoded_strings.json'
+
+# Regla histórica de extract_hardcoded_strings.is_spanish_text
+LEGACY_SPANISH_WORDS = frozenset({
+    'el', 'la', 'los', 'las', 'un', 'una', 'de', 'del', 'al',
+    'con', 'sin', 'por', 'para', 'en', 'es', 'está', 'son',
+    'configuración', 'conexión', 'dispositivo', 'error', 'éxito',
+    'conectar', 'desconectar', 'escanear', 'guardar', 'cancelar',
+    'aceptar', 'continuar', 'sí', 'no', 'advertencia', 'información'
+})
+LEGACY_SPANISH_CHARS = 'áéíóúñ¿¡'
+
+# Palabras frecuentes y exclusivas (o casi) de cada idioma
+LANGUAGE_WORDS = {
+    'es': (
+        'el', 'la', 'los', 'las', 'un', 'una', 'unos', 'del', 'al', 'y',
+        'con', 'sin', 'por', 'para', 'es', 'está', 'son', 'que', 'se',
+        'su', 'sus', 'sí', 'este', 'esta', 'como', 'pero', 'más',
+        'antes', 'después', 'puede', 'debe', 'hay', 'desde', 'hasta',
+        'configuración', 'conexión', 'dispositivo', 'dispositivos', 'éxito',
+        'conectar', 'desconectar', 'escanear', 'guardar', 'cancelar',
+        'aceptar', 'continuar', 'advertencia', 'información', 'adaptador',
+        'código', 'códigos', 'archivo', 'copia', 'seguridad', 'ayuda',
+        'ver', 'usar', 'volver', 'cerrar', 'iniciar', 'detener', 'estado',
+    ),
+    'en': (
+        'the', 'an', 'of', 'and', 'or', 'to', 'with', 'without', 'for',
+        'is', 'are', 'was', 'be', 'this', 'that', 'it', 'your', 'you',
+        'not', 'yes', 'on', 'from', 'before', 'after', 'can', 'must',
+        'should', 'will', 'please', 'all', 'if', 'by', 'at',
+        'settings', 'connection', 'device', 'devices', 'success',
+        'disconnect', 'save', 'cancel', 'accept', 'available',
+        'continue', 'warning', 'file', 'help', 'view',
+        'use', 'back', 'close', 'found', 'empty', 'just', 'press', 'yet',
+        'only', 'when', 'which', 'there', 'been', 'has', 'have', 'my',
+    ),
+    'de': (
+        'der', 'die', 'das', 'den', 'dem', 'des', 'ein', 'eine', 'einen',
+        'und', 'oder', 'mit', 'ohne', 'für', 'ist', 'sind', 'wird',
+        'werden', 'nicht', 'ja', 'nein', 'auf', 'von', 'vor', 'nach',
+        'kann', 'muss', 'bitte', 'alle', 'wenn', 'zu', 'im', 'bei', 'aus',
+        'sie', 'ihr', 'ihre', 'einstellungen', 'verbindung', 'gerät',
+        'geräte', 'erfolg', 'verbinden', 'trennen', 'scannen', 'speichern',
+        'abbrechen', 'akzeptieren', 'fortfahren', 'warnung', 'datei',
+        'hilfe', 'anzeigen', 'zurück', 'schließen', 'starten', 'stoppen',
+    ),
+}
+
+# Caracteres propios de cada idioma
+LANGUAGE_CHARS = {
+    'es': 'ñ¿¡áíóú',
+    'en': '',
+    'de': 'äöüß',
+}
+
+# Trigramas de caracteres característicos (sobre la palabra con espacios)
+LANGUAGE_NGRAMS = {
+    'es': ('ión', 'ció', 'ado ', 'ada ', 'ndo ', 'ía ', 'que', 'ñ'),
+    'en': ('th', 'ed ', ' wh', 'ght', 'ly ', 'ould', 'ew '),
+    'de': ('sch', 'cht', 'ung ', 'eit ', 'ige', 'tz', 'äh', 'ß'),
+}
+
+# Puntuación por señal
+WORD_WEIGHT = 2
+CHAR_WEIGHT = 3
+NGRAM_WEIGHT = 1
+
+TOKEN_RE = re.compile(r"[^\W\d_]+")
+
+class LanguageClassifier:
+    """Clasificador es/en/de construido una sola vez.
+
+    Los conjuntos de palabras son frozensets y la puntuación de cada
+    palabra distinta se calcula una sola vez y se guarda, de modo que un
+    lote grande (todas las hojas de un locale, por ejemplo) cuesta una
+    tokenización del lote completo más una búsqueda en diccionario por
+    palabra.
+    """
+
+    def __init__(self, words=LANGUAGE_WORDS, chars=LANGUAGE_CHARS,
+                 ngrams=LANGUAGE_NGRAMS):
+        self.languages = tuple(words)
+        self.words = {lang: frozenset(words[lang]) for lang in self.languages}
+        self.chars = {lang: frozenset(chars.get(lang, '')) for lang in self.languages}
+        self.ngrams = {lang: tuple(ngrams.get(lang, ())) for lang in self.languages}
+        self._token_scores = {}
+
+    def _score_token(self, token):
+        scores = self._token_scores.get(token)
+        if scores is None:
+            padded = f' {token} '
+            scores = tuple(
+                WORD_WEIGHT * (token in self.words[lang])
+                + CHAR_WEIGHT * any(c in self.chars[lang] for c in token)
+                + NGRAM_WEIGHT * sum(gram in padded for gram in self.ngrams[lang])
+                for lang in self.languages
+            )
+            self._token_scores[token] = scores
+        return scores
+
+    def score_batch(self, texts):
+        """Puntuación por idioma de cada texto: lista de {idioma: puntos}.
+
+        Todo el lote se tokeniza con una sola pasada de TOKEN_RE.
+        """
+        texts = list(texts)
+        joined = '\n'.join(text.lower().replace('\n', ' ') for text in texts)
+        lines = joined.split('\n') if texts else []
+        results = []
+        zero = (0,) * len(self.languages)
+        for line in lines:
+            totals = zero
+            for token in TOKEN_RE.findall(line):
+                totals = tuple(map(int.__add__, totals, self._score_token(token)))
+            results.append(dict(zip(self.languages, totals)))
+        return results
+
+    def classify_batch(self, texts, min_score=2):
+        """Idioma más probable de cada texto, o None si no hay señal clara.
+
+        Se exige al menos min_score puntos y ventaja sobre el segundo.
+        """
+        labels = []
+        for scores in self.score_batch(texts):
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+            (best, best_score), (_, second_score) = ranked[0], ranked[1]
+            if best_score >= min_score and best_score > second_score:
+                labels.append(best)
+            else:
+                labels.append(None)
+        return labels
+
+    def is_spanish(self, text):
+        return self.is_spanish_batch([text])[0]
+
+    def is_spanish_batch(self, texts):
+        """Regla histórica del extractor, aplicada a un lote de textos.
+
+        Un texto (sin espacios en los extremos) de 3 o más caracteres es
+        español si contiene algún carácter de LEGACY_SPANISH_CHARS o
+        alguna de LEGACY_SPANISH_WORDS como palabra separada por espacios.
+        """
+        results = []
+        for text in texts:
+            stripped = text.strip()
+            lowered = stripped.lower()
+            results.append(
+                len(stripped) >= 3 and (
+                    any(c in lowered for c in LEGACY_SPANISH_CHARS)
+                    or not LEGACY_SPANISH_WORDS.isdisjoint(lowered.split())
+                )
+            )
+        return results
+
+CLASSIFIER = LanguageClassifier()
+
+def find_locale_leftovers(classifier=CLASSIFIER):
+    """Hojas de cada locale clasificadas en otro idioma.
+
+    Devuelve {idioma del archivo: [(clave, idioma detectado, valor)]}.
+    """
+    leftovers = {}
+    for lang, tree in load_locales().items():
+        flat = {dotted(path): value for path, value in flatten_paths(tree).items()}
+        keys = [key for key, value in flat.items() if isinstance(value, str)]
+        labels = classifier.classify_batch(flat[key] for key in keys)
+        leftovers[lang] = [
+            (key, label, flat[key])
+            for key, label in zip(keys, labels)
+            if label is not None and label != lang
+        ]
+    return leftovers
+
+def classify_findings(classifier=CLASSIFIER):
+    """Idioma detectado de cada string de hardcoded_strings.json"""
+    if not HARDCODED_FILE.exists():
+        return []
+    with open(HARDCODED_FILE, 'r', encoding='utf-8') as f:
+        findings = json.load(f)
+    items = [(path, item) for path, strings in findings.items() for item in strings]
+    labels = classifier.classify_batch(item['text'] for _, item in items)
+    return [(path, item, label) for (path, item), label in zip(items, labels)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--json', action='store_true',
+                        help='imprimir el reporte como JSON')
+    args = parser.parse_args()
+
+    leftovers = find_locale_leftovers()
+    findings = classify_findings()
+
+    if args.json:
+        print(json.dumps({
+            'locales': {
+                lang: [{'key': key, 'detected': label, 'value': value}
+                       for key, label, value in items]
+                for lang, items in leftovers.items()
+            },
+            'findings': [
+                {'file': path, 'line': item['line'], 'text': item['text'],
+                 'detected': label}
+                for path, item, label in findings
+            ],
+        }, indent=2, ensure_ascii=False))
+        return
+
+    for lang, items in leftovers.items():
+        print(f"\n🌐 {lang}.json: {len(items)} valores detectados en otro idioma")
+        for key, label, value in items:
+            print(f"   - [{label}] {key}: {value[:70]}")
+
+    by_label = {}
+    for _, _, label in findings:
+        by_label[label] = by_label.get(label, 0) + 1
+    print(f"\n📄 {HARDCODED_FILE.name}: {len(findings)} strings")
+    for label, count in sorted(by_label.items(), key=lambda item: str(item[0])):
+        print(f"   - {label or 'sin señal clara'}: {count}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Carga es/en/de una sola vez, aplica muchos parches de traducción y guarda
+cada locale como mucho una vez
+"""
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOCALES_DIR = PROJECT_ROOT / 'locales'
+
+LANGUAGES = ('es', 'en', 'de')
+# Idioma del que se traducen los demás
+SOURCE_LANGUAGE = 'es'
+
+# Archivo de cada idioma en locales/, por bundle
+BUNDLES = {
+    'app': '{lang}.json',
+    'installation_guide': 'installation_guide_{lang}.json',
+}
+
+# Placeholder {{var}} tal como lo interpola la app: sin espacios adentro
+INTERPOLATION = re.compile(r'\{\{(\w+)\}\}')
+
+def serialize_locale(data):
+    """Texto de un locale: indent=2, sin escapar acentos y con salto final"""
+    return json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+def write_locale(path, data):
+    """Escribe un locale solo si su contenido cambió.
+
+    Se serializa en memoria y se compara el sha256 con el del archivo en
+    disco: si coinciden no se toca el archivo (ni su mtime, así Metro no
+    invalida la caché de lib/i18n.ts y lib/simple-i18n.ts). Si no, se
+    escribe un temporal en el mismo directorio y se renombra encima, de
+    modo que nunca queda un locale a medio escribir. Devuelve True si
+    escribió.
+    """
+    return write_if_changed(path, serialize_locale(data))
+
+def write_if_changed(path, text):
+    """Escritura atómica de write_locale() para cualquier texto ya serializado"""
+    path = Path(path)
+    encoded = text.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(encoded).digest():
+                return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(encoded)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return True
+
+def load_locales(locales_dir=LOCALES_DIR, languages=LANGUAGES):
+    """{idioma: árbol} de locales/<idioma>.json"""
+    locales = {}
+    for lang in languages:
+        with open(Path(locales_dir) / f'{lang}.json', 'r', encoding='utf-8') as f:
+            locales[lang] = json.load(f)
+    return locales
+
+def flatten_paths(data, prefix=()):
+    """{(sección, ..., clave): valor} de un locale anidado.
+
+    Las rutas son tuplas y no strings con puntos porque algunas claves
+    (home["error.navigation_unit_not_supported"], por ejemplo) contienen
+    puntos. Un dict vacío se conserva como valor de hoja.
+    """
+    flat = {}
+    for key, value in data.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            flat.update(flatten_paths(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+def unflatten_paths(flat):
+    """Inversa de flatten_paths(); conserva el orden de las claves"""
+    root = {}
+    for path, value in flat.items():
+        node = root
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = value
+    return root
+
+def as_path(key):
+    """Ruta de una clave: tupla tal cual o string separado por puntos"""
+    return key if isinstance(key, tuple) else tuple(key.split('.'))
+
+def dotted(path):
+    return '.'.join(path)
+
+class ChangeSet:
+    """Rutas agregadas, modificadas y eliminadas, en orden de aparición.
+
+    Una ruta agregada y luego modificada sigue contando como agregada, y
+    una agregada y luego eliminada desaparece del todo; una eliminada y
+    vuelta a agregar cuenta como modificada.
+    """
+
+    def __init__(self):
+        self.added = {}
+        self.modified = {}
+        self.removed = {}
+
+    def record_added(self, path):
+        if self.removed.pop(path, False):
+            self.modified[path] = True
+        else:
+            self.added[path] = True
+
+    def record_modified(self, path):
+        if path not in self.added:
+            self.modified[path] = True
+
+    def record_removed(self, path):
+        if self.added.pop(path, False):
+            return
+        self.modified.pop(path, None)
+        self.removed[path] = True
+
+    def update(self, other):
+        """Suma un ChangeSet posterior a este, como si se hubiera registrado acá"""
+        for path in other.removed:
+            self.record_removed(path)
+        for path in other.added:
+            self.record_added(path)
+        for path in other.modified:
+            self.record_modified(path)
+
+    def __bool__(self):
+        return bool(self.added or self.modified or self.removed)
+
+    def __len__(self):
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+    def to_dict(self):
+        """{'added': [...], 'modified': [...], 'removed': [...]} con claves con puntos"""
+        return {
+            'added': [dotted(path) for path in self.added],
+            'modified': [dotted(path) for path in self.modified],
+            'removed': [dotted(path) for path in self.removed],
+        }
+
+def split_by_language(translations, languages=LANGUAGES):
+    """{idioma: árbol} a partir de cualquiera de los formatos de parche.
+
+    Acepta los tres formatos que usaban los scripts add_*:
+      {idioma: árbol}
+      {sección: {idioma: árbol}}
+      {sección: {clave: {idioma: valor}}}
+    """
+    langs = set(languages)
+
+    def is_by_language(node):
+        return isinstance(node, dict) and node and set(node) <= langs
+
+    if is_by_language(translations):
+        return {lang: tree for lang, tree in translations.items()}
+
+    by_language = {lang: {} for lang in languages}
+
+    def walk(node, path):
+        for key, value in node.items():
+            if is_by_language(value):
+                for lang, tree in value.items():
+                    target = by_language[lang]
+                    for part in path:
+                        target = target.setdefault(part, {})
+                    target[key] = tree
+            elif isinstance(value, dict):
+                walk(value, path + (key,))
+
+    walk(translations, ())
+    return {lang: tree for lang, tree in by_language.items() if tree}
+
+class LocaleStore:
+    """Locales es/en/de como mapas planos {ruta: valor}.
+
+    Cada archivo se lee y se parsea una sola vez al construir el store.
+    Los parches se fusionan como el deep_merge que copiaban los scripts
+    (un dict se fusiona con la sección existente y cualquier otro valor
+    reemplaza lo que hubiera en su ruta), cada idioma acumula en changes
+    el ChangeSet de lo modificado, apply() devuelve además el de cada
+    llamada y save() escribe solo los idiomas que cambiaron, una vez cada
+    uno.
+    """
+
+    def __init__(self, locales_dir=LOCALES_DIR, languages=LANGUAGES):
+        self.locales_dir = Path(locales_dir)
+        self.languages = tuple(languages)
+        self.flat = {}
+        # Rutas que son secciones (prefijos de alguna hoja), por idioma
+        self.sections = {}
+        # Qué cambió en cada idioma desde que se cargó
+        self.changes = {lang: ChangeSet() for lang in self.languages}
+        self.dirty = set()
+        for lang in self.languages:
+            with open(self.path(lang), 'r', encoding='utf-8') as f:
+                self.flat[lang] = flatten_paths(json.load(f))
+            self.sections[lang] = {
+                path[:depth] for path in self.flat[lang] for depth in range(1, len(path))
+            }
+
+    def path(self, lang):
+        return self.locales_dir / f'{lang}.json'
+
+    def get(self, lang, key, default=None):
+        return self.flat[lang].get(as_path(key), default)
+
+    def keys(self, lang):
+        return self.flat[lang].keys()
+
+    def set(self, lang, key, value, changes=None):
+        """Asigna una hoja; devuelve True si el locale cambió.
+
+        Registra el cambio en changes si se pasa un ChangeSet y si no en
+        self.changes[lang].
+        """
+        path = as_path(key)
+        flat = self.flat[lang]
+        if changes is None:
+            changes = self.changes[lang]
+        if isinstance(value, dict) and value:
+            changed = False
+            for sub_path, sub_value in flatten_paths(value, path).items():
+                changed |= self.set(lang, sub_path, sub_value, changes)
+            return changed
+
+        if flat.get(path, self) == value:
+            return False
+
+        # Una hoja reemplaza al subárbol que hubiera en su ruta, y una
+        # hoja en el camino (una sección que era un string) desaparece
+        if path in flat:
+            changes.record_modified(path)
+        else:
+            sections = self.sections[lang]
+            for depth in range(1, len(path)):
+                if flat.pop(path[:depth], self) is not self:
+                    changes.record_removed(path[:depth])
+                sections.add(path[:depth])
+            if path in sections:
+                size = len(path)
+                nested = [p for p in flat if len(p) > size and p[:size] == path]
+                for nested_path in nested:
+                    del flat[nested_path]
+                    changes.record_removed(nested_path)
+                sections.discard(path)
+            changes.record_added(path)
+
+        flat[path] = value
+        self.dirty.add(lang)
+        return True
+
+    def apply(self, lang, tree):
+        """Fusiona un árbol anidado en un idioma; devuelve su ChangeSet.
+
+        Lo devuelto es solo lo que cambió esta llamada; también se suma a
+        self.changes[lang].
+        """
+        changes = ChangeSet()
+        for path, value in flatten_paths(tree).items():
+            self.set(lang, path, value, changes)
+        self.changes[lang].update(changes)
+        return changes
+
+    def apply_patch(self, translations):
+        """Aplica un parche en cualquiera de los formatos de split_by_language().
+
+        Devuelve {idioma: ChangeSet de este parche}.
+        """
+        return {
+            lang: self.apply(lang, tree)
+            for lang, tree in split_by_language(translations, self.languages).items()
+            if lang in self.flat
+        }
+
+    def to_dict(self, lang):
+        return unflatten_paths(self.flat[lang])
+
+    def save(self):
+        """Escribe los idiomas modificados; devuelve las rutas escritas"""
+        written = []
+        for lang in self.languages:
+            if lang not in self.dirty:
+                continue
+            if write_locale(self.path(lang), self.to_dict(lang)):
+                written.append(self.path(lang))
+        self.dirty.clear()
+        return written
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Claves de los locales que el código nunca referencia: las quita de los
+bundles de la app e informa las claves muertas y los bytes ahorrados
+"""
+import re
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from extract_hardcoded_strings import (
+    PROJECT_ROOT, TRANSLATION_KEY, TRANSLATION_RESULTS_FILE, extract_keys_from_content,
+    iter_source_files,
+)
+from locale_store import (
+    LANGUAGES, dotted, flatten_paths, load_locales, unflatten_paths, write_if_changed,
+)
+from tsx_lexer import tokenize
+
+REPORT_FILE = PROJECT_ROOT / 'scripts' / 'dead-keys-report.json'
+
+# Prefijos de claves que se arman en tiempo de ejecución de una forma que
+# el análisis estático no ve (por ejemplo, una clave que llega del
+# servidor o se concatena con una variable sin literal 'seccion.')
+DYNAMIC_KEY_PREFIXES = ()
+
+# Literal que es un prefijo de clave: 'mib2_state.' en t(`mib2_state.${reason}`)
+KEY_PREFIX = re.compile(r'[^\W\d][\w]*(?:\.[^\W\d][\w]*)*\.')
+
+def file_references(file_path):
+    """(claves, prefijos) que aparecen en un archivo fuente.
+
+    Claves son las de t('...') y cualquier literal de string con forma
+    de clave, porque muchas pantallas guardan las claves en datos
+    (titleKey: 'installation_guide.phase1_title') y las traducen después.
+    Prefijos son los literales y fragmentos de template que terminan en
+    punto, el comienzo de una clave dinámica.
+    """
+    content = Path(file_path).read_text(encoding='utf-8')
+    keys = set(extract_keys_from_content(content))
+    prefixes = set()
+    for literal in tokenize(content, jsx=str(file_path).endswith('.tsx')):
+        value = literal.value.strip()
+        if '.' not in value:
+            continue
+        if TRANSLATION_KEY.fullmatch(value):
+            keys.add(value)
+        elif literal.kind == 'template':
+            # `seccion.${x}` y `seccion.${x}_short`: el primer fragmento
+            match = KEY_PREFIX.match(value)
+            if match and literal.end < len(content) and content[literal.end] == '$':
+                prefixes.add(match.group())
+        elif KEY_PREFIX.fullmatch(value):
+            prefixes.add(value)
+    return keys, prefixes
+
+def collect_references(files=None, jobs=1, results_file=TRANSLATION_RESULTS_FILE):
+    """(claves, prefijos) de todo el código, más las usedKeys ya guardadas"""
+    files = list(files if files is not None else iter_source_files())
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            found = list(pool.map(file_references, files, chunksize=8))
+    else:
+        found = [file_references(file_path) for file_path in files]
+
+    keys = set()
+    prefixes = set(DYNAMIC_KEY_PREFIXES)
+    for file_keys, file_prefixes in found:
+        keys |= file_keys
+        prefixes |= file_prefixes
+    if results_file and Path(results_file).exists():
+        with open(results_file, 'r', encoding='utf-8') as f:
+            keys.update(json.load(f).get('usedKeys', []))
+    return keys, prefixes
+
+class KeyUsage:
+    """Decide si una ruta de un locale está en uso"""
+
+    def __init__(self, keys, prefixes):
+        self.keys = frozenset(keys)
+        # Una clave usada que es una sección entera (t('tabs') devuelve
+        # el objeto) mantiene todo lo que tiene debajo
+        self.prefixes = tuple(sorted(set(prefixes) | {f'{key}.' for key in keys}))
+
+    def is_used(self, path):
+        key = dotted(path)
+        return key in self.keys or key.startswith(self.prefixes)
+
+def prune_locale(tree, usage):
+    """(árbol solo con las claves usadas, rutas muertas)"""
+    kept = {}
+    dead = []
+    for path, value in flatten_paths(tree).items():
+        if usage.is_used(path):
+            kept[path] = value
+        else:
+            dead.append(path)
+    return unflatten_paths(kept), dead
+
+def serialized_size(tree):
+    """Bytes del JSON compacto que se empaqueta en la app"""
+    return len(json.dumps(tree, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+def prune_locales(locales, usage, languages=LANGUAGES):
+    """({idioma: árbol podado}, informe)"""
+    pruned = {}
+    report = {
+        'usedKeys': len(usage.keys),
+        'dynamicPrefixes': sorted(prefix for prefix in usage.prefixes
+                                  if prefix[:-1] not in usage.keys),
+        'languages': {},
+    }
+    for lang in languages:
+        pruned[lang], dead = prune_locale(locales[lang], usage)
+        before, after = serialized_size(locales[lang]), serialized_size(pruned[lang])
+        report['languages'][lang] = {
+            'keys': len(flatten_paths(locales[lang])),
+            'kept': len(flatten_paths(pruned[lang])) if pruned[lang] else 0,
+            'dead': len(dead),
+            'bytesBefore': before,
+            'bytesAfter': after,
+            'bytesSaved': before - after,
+        }
+    # Las claves muertas de todos los idiomas, una sola vez
+    dead_keys = {}
+    for lang in languages:
+        for path in flatten_paths(locales[lang]):
+            if not usage.is_used(path):
+                dead_keys.setdefault(dotted(path), None)
+    report['deadKeys'] = sorted(dead_keys)
+    return pruned, report
+
+def serialize_report(report):
+    return json.dumps(report, indent=2, ensure_ascii=False) + '\n'
+
+def print_report(report, report_file=None):
+    print(f"✅ {report['usedKeys']} claves referenciadas, "
+          f"{len(report['dynamicPrefixes'])} prefijos dinámicos")
+    for lang, info in report['languages'].items():
+        print(f"   - {lang}: {info['kept']}/{info['keys']} claves en uso, {info['dead']} muertas, "
+              f"{info['bytesBefore'] / 1024:.0f} KB -> {info['bytesAfter'] / 1024:.0f} KB "
+              f"(-{info['bytesSaved'] / 1024:.0f} KB)")
+    if report_file:
+        print(f"   - Informe guardado en: {report_file}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1, metavar='N',
+        help='procesos para analizar los archivos fuente en paralelo'
+    )
+    parser.add_argument(
+        '--report', type=Path, default=REPORT_FILE, metavar='JSON',
+        help=f'informe de claves muertas (por defecto {REPORT_FILE.name})'
+    )
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    usage = KeyUsage(*collect_references(jobs=args.jobs))
+    _, report = prune_locales(load_locales(), usage)
+    write_if_changed(args.report, serialize_report(report))
+    print_report(report, args.report)
+    print("\n💡 build_locale_bundles.py --prune genera los bundles podados de la app")
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,8 @@ Este script lee es.json y genera traducciones reales en inglés y alemán
 
 import json
 
+from locale_store import write_locale
+
 # Leer es.json
 with open('locales/es.json', 'r', encoding='utf-8') as f:
     es = json.load(f)
@@ -143,13 +145,11 @@ def translate_dict(obj, translations_dict):
 
 # Generar en.json
 en = translate_dict(es, es_to_en)
-with open('locales/en.json', 'w', encoding='utf-8') as f:
-    json.dump(en, f, ensure_ascii=False, indent=2)
+write_locale('locales/en.json', en)
 
 # Generar de.json
 de = translate_dict(es, es_to_de)
-with open('locales/de.json', 'w', encoding='utf-8') as f:
-    json.dump(de, f, ensure_ascii=False, indent=2)
+write_locale('locales/de.json', de)
 
 print("✅ Traducciones regeneradas correctamente")
 print(f"   - en.json: {len(json.dumps(en))} bytes")
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Reemplaza los strings hardcodeados por llamadas a t() en los archivos TSX/TS.
+Requiere node y el paquete typescript de las devDependencies de
+package.json (pnpm install): tsx_scopes.js lo usa para analizar los
+ámbitos de cada literal y verificar la sintaxis de los archivos reescritos
+"""
+import re
+import sys
+import json
+import argparse
+import subprocess
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+
+from extract_hardcoded_strings import PROJECT_ROOT, TRANSLATION_CALL, TRANSLATION_KEY, LineIndex
+from tsx_lexer import normalize_jsx_text, tokenize
+
+HARDCODED_FILE = PROJECT_ROOT / 'scripts' / 'hardcoded_strings.json'
+MAPPING_FILE = PROJECT_ROOT / 'scripts' / 'text_to_key_mapping.json'
+
+# t reactiva: const t = useTranslation() dentro de cada componente. La t
+# de @/lib/i18n no se vuelve a renderizar al cambiar el idioma
+HOOK_MODULE = '@/lib/language-context'
+
+# Análisis de ámbitos y verificación con el parser de TypeScript
+TS_HELPER = PROJECT_ROOT / 'scripts' / 'tsx_scopes.js'
+
+# El selector de idioma muestra cada idioma con su propio nombre
+LANGUAGE_NAMES = frozenset({'Español', 'English', 'Deutsch'})
+
+# Distancia máxima (en caracteres) entre el inicio de la coincidencia
+# registrada en hardcoded_strings.json y el literal que la contiene
+MAX_LITERAL_DISTANCE = 2000
+
+# Última declaración import del encabezado (también las de varias líneas)
+IMPORT_STATEMENT = re.compile(
+    r'''^import\b[\s\S]*?(['"])[^'"\n]*\1;?[ \t]*$''', re.MULTILINE
+)
+# Comentario de cabecera (/** ... */) al inicio de un archivo sin import
+LEADING_COMMENT = re.compile(r'\s*/\*[\s\S]*?\*/[ \t]*\n?')
+# import { ... } from '@/lib/language-context' (no los import type)
+HOOK_IMPORT = re.compile(
+    r'''\bimport\s*\{([^}]*)\}\s*from\s*(['"])''' + re.escape(HOOK_MODULE) + r'\2'
+)
+# Sangría de la primera línea del cuerpo de un componente
+BODY_INDENT = re.compile(r'([ \t]*(?://[^\n]*)?)\n([ \t]*)\S')
+
+def module_quote(content):
+    """Comilla que usa el archivo en sus import (simple por defecto)"""
+    match = IMPORT_STATEMENT.search(content)
+    return match.group(1) if match else "'"
+
+def call_quote(content):
+    """Comilla de los t() que ya tiene el archivo; si no hay, la de los import"""
+    match = TRANSLATION_CALL.search(content)
+    if match and match.group(3) is None:
+        return "'" if match.group(1) is not None else '"'
+    return module_quote(content)
+
+def is_translation_key(text):
+    """El extractor también encuentra claves ya pasadas a showAlert()"""
+    return '.' in text and TRANSLATION_KEY.fullmatch(text) is not None
+
+def quote_key(key, quote="'"):
+    """Literal JS con la clave"""
+    escaped = key.replace('\\', '\\\\').replace(quote, '\\' + quote)
+    return f"{quote}{escaped}{quote}"
+
+def literal_text(literal):
+    """Texto de un Literal tal como lo guarda el extractor"""
+    if literal.kind == 'jsx_text':
+        return literal.value
+    return literal.value.strip()
+
+def find_literal(literals, starts, offset, text):
+    """Primer literal desde offset cuyo texto es text, o None"""
+    wanted = normalize_jsx_text(text)
+    for position in range(bisect_left(starts, offset), len(literals)):
+        literal = literals[position]
+        if literal.start - offset > MAX_LITERAL_DISTANCE:
+            break
+        value = literal_text(literal)
+        if value == text or (literal.kind == 'jsx_text' and value == wanted):
+            return literal
+    return None
+
+def replacement_for(literal, key, quote):
+    """Código que reemplaza al literal, o None si no se puede reemplazar"""
+    call = f"t({quote_key(key, quote)})"
+    if literal.kind in ('jsx_text', 'jsx_attr'):
+        return '{' + call + '}'
+    if literal.kind == 'string':
+        return call
+    # Fragmento de template literal: habría que partir el template
+    return None
+
+def import_edit(content, quote):
+    """(inicio, fin, texto) que importa useTranslation, o None si ya está.
+
+    Si el archivo ya importa algo de @/lib/language-context se agrega a
+    ese import; si no, se agrega un import después del último.
+    """
+    existing = HOOK_IMPORT.search(content)
+    if existing:
+        names = existing.group(1)
+        if re.search(r'\buseTranslation\b', names):
+            return None
+        offset = existing.start(1) + len(names.rstrip().rstrip(','))
+        return offset, offset, ', useTranslation'
+
+    statement = f"import {{ useTranslation }} from {quote}{HOOK_MODULE}{quote};"
+    last_import = None
+    for match in IMPORT_STATEMENT.finditer(content):
+        last_import = match
+    if last_import is None:
+        header = LEADING_COMMENT.match(content)
+        offset = header.end() if header else 0
+        return offset, offset, ('\n' if header else '') + statement + '\n'
+    return last_import.end(), last_import.end(), '\n' + statement
+
+def hook_edit(content, body):
+    """(inicio, fin, texto) que declara t al principio del cuerpo de un componente"""
+    match = BODY_INDENT.match(content, body)
+    if match is None:
+        return body, body, "\n  const t = useTranslation();"
+    # Después de un comentario en la línea de la llave, no antes
+    offset = match.end(1)
+    return offset, offset, f"\n{match.group(2)}const t = useTranslation();"
+
+def apply_edits(content, edits):
+    """Aplica ediciones (inicio, fin, texto) que no se solapan.
+
+    Se ordenan por offset descendente, se verifica que no se solapen y
+    el archivo nuevo se arma con un solo join, sin recopiar el contenido
+    por cada reemplazo.
+    """
+    edits = sorted(edits, key=lambda edit: (edit[0], edit[1]), reverse=True)
+    pieces = []
+    end_of_next = len(content)
+    for start, end, text in edits:
+        if end > end_of_next:
+            raise ValueError(f"ediciones solapadas en el offset {start}")
+        pieces.append(content[end:end_of_next])
+        pieces.append(text)
+        end_of_next = start
+    pieces.append(content[:end_of_next])
+    return ''.join(reversed(pieces))
+
+def locate_literals(content, strings, mapping, jsx=True):
+    """Literales a reemplazar; devuelve ([(string, clave, Literal)], omitidos).
+
+    omitidos es una lista de (string, motivo).
+    """
+    literals = list(tokenize(content, jsx))
+    starts = [literal.start for literal in literals]
+    line_index = LineIndex(content)
+
+    seen = set()
+    found = []
+    skipped = []
+    for item in strings:
+        if is_translation_key(item['text']):
+            skipped.append((item, 'ya es una clave de traducción'))
+            continue
+        if item['text'] in LANGUAGE_NAMES:
+            skipped.append((item, 'nombre de un idioma en su propio idioma'))
+            continue
+        key = mapping.get(item['text'])
+        if key is None:
+            skipped.append((item, 'sin clave en el mapeo'))
+            continue
+        line, column = item['line'], item['column']
+        if line > len(line_index.starts):
+            skipped.append((item, 'la línea ya no existe'))
+            continue
+        offset = line_index.starts[line - 1] + column - 1
+        literal = find_literal(literals, starts, offset, item['text'])
+        if literal is None:
+            skipped.append((item, 'literal no encontrado (¿archivo modificado?)'))
+            continue
+        if literal.start in seen:
+            # Dos patrones encontraron el mismo literal
+            continue
+        if literal.kind == 'template':
+            # Habría que partir el template
+            skipped.append((item, 'fragmento de template literal'))
+            continue
+        seen.add(literal.start)
+        found.append((item, key, literal))
+    return found, skipped
+
+def rewrite_content(content, found, analysis):
+    """Reescribe un archivo; devuelve (contenido nuevo, reemplazados, omitidos).
+
+    analysis es el resultado de tsx_scopes.js para los offsets de found:
+    cada literal se reemplaza por t() solo si está dentro de un componente
+    (o hook) donde t puede ser const t = useTranslation(), y cada
+    componente que todavía no la declara recibe la declaración al
+    principio de su cuerpo.
+    """
+    quote = call_quote(content)
+    edits = []
+    hooks = set()
+    replaced = []
+    skipped = []
+    for item, key, literal in found:
+        info = analysis[str(literal.start)]
+        if info['skip']:
+            skipped.append((item, info['skip']))
+            continue
+        if not info['hasHook']:
+            hooks.add(info['body'])
+        edits.append((literal.start, literal.end, replacement_for(literal, key, quote)))
+        replaced.append((item, key))
+
+    if not replaced:
+        return content, [], skipped
+
+    edits.extend(hook_edit(content, body) for body in hooks)
+    extra = import_edit(content, module_quote(content))
+    if extra:
+        edits.append(extra)
+    return apply_edits(content, edits), replaced, skipped
+
+def keys_in_calls(content, keys, jsx=True):
+    """Cada clave quedó como argumento de un t()"""
+    found = defaultdict(int)
+    for literal in tokenize(content, jsx):
+        if literal.kind == 'string' and literal.role == 'call' and literal.owner == 't':
+            found[literal.value] += 1
+    expected = defaultdict(int)
+    for key in keys:
+        expected[key] += 1
+    return all(found[key] >= count for key, count in expected.items())
+
+def run_ts_helper(mode, files):
+    """Resultados de tsx_scopes.js para [(ruta, contenido, offsets)], en orden"""
+    if not files:
+        return []
+    request = {
+        'mode': mode,
+        'files': [{'path': path, 'content': content, 'offsets': offsets}
+                  for path, content, offsets in files],
+    }
+    try:
+        result = subprocess.run(
+            ['node', str(TS_HELPER)], input=json.dumps(request), capture_output=True,
+            text=True, encoding='utf-8', check=True,
+        )
+    except FileNotFoundError:
+        print("❌ Se necesita node (y pnpm install para el paquete typescript) "
+              "para analizar los archivos con TypeScript")
+        sys.exit(2)
+    except subprocess.CalledProcessError as e:
+        print(e.stderr.strip() or f"❌ {TS_HELPER.name} terminó con código {e.returncode}")
+        sys.exit(2)
+    return json.loads(result.stdout)
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--strings', type=Path, default=HARDCODED_FILE, metavar='JSON',
+        help=f'resultados del extractor (por defecto {HARDCODED_FILE.name})'
+    )
+    parser.add_argument(
+        '--mapping', type=Path, default=MAPPING_FILE, metavar='JSON',
+        help=f'mapeo texto → clave (por defecto {MAPPING_FILE.name})'
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help='mostrar qué se reemplazaría sin escribir los archivos'
+    )
+    parser.add_argument(
+        'files', nargs='*', metavar='ARCHIVO',
+        help='limitar a estas rutas relativas (por defecto todas las de --strings)'
+    )
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    hardcoded_data = load_json(args.strings)
+    mapping = load_json(args.mapping)
+
+    if args.files:
+        wanted = {str(Path(path)) for path in args.files}
+        hardcoded_data = {path: strings for path, strings in hardcoded_data.items()
+                          if path in wanted}
+
+    all_skipped = []
+    located = []
+    for relative_path, strings in hardcoded_data.items():
+        file_path = PROJECT_ROOT / relative_path
+        if not file_path.exists():
+            all_skipped.extend((relative_path, item, 'el archivo ya no existe')
+                               for item in strings)
+            continue
+        content = file_path.read_text(encoding='utf-8')
+        jsx = file_path.suffix == '.tsx'
+        found, skipped = locate_literals(content, strings, mapping, jsx)
+        all_skipped.extend((relative_path, item, reason) for item, reason in skipped)
+        if found:
+            located.append((relative_path, content, jsx, found))
+
+    # Un solo proceso de node analiza todos los originales y otro
+    # verifica todos los reescritos
+    analyses = run_ts_helper('analyze', [
+        (relative_path, content, [literal.start for _, _, literal in found])
+        for relative_path, content, _, found in located
+    ])
+    rewritten = []
+    for (relative_path, content, jsx, found), analysis in zip(located, analyses):
+        if analysis['diagnostics']:
+            reason = f"TypeScript no parsea el original ({analysis['diagnostics'][0]})"
+            all_skipped.extend((relative_path, item, reason) for item, _, _ in found)
+            continue
+        new_content, replaced, skipped = rewrite_content(content, found, analysis['literals'])
+        all_skipped.extend((relative_path, item, reason) for item, reason in skipped)
+        if replaced:
+            rewritten.append((relative_path, new_content, jsx, replaced))
+
+    checks = run_ts_helper('check', [
+        (relative_path, new_content, []) for relative_path, new_content, _, _ in rewritten
+    ])
+    total_replaced = 0
+    changed_files = []
+    for (relative_path, new_content, jsx, replaced), check in zip(rewritten, checks):
+        if check['diagnostics']:
+            reason = f"TypeScript no parsea el archivo reescrito ({check['diagnostics'][0]})"
+        elif not keys_in_calls(new_content, [key for _, key in replaced], jsx):
+            reason = 'alguna clave no quedó dentro de un t()'
+        else:
+            reason = None
+        if reason:
+            all_skipped.extend((relative_path, item, reason) for item, _ in replaced)
+            continue
+
+        total_replaced += len(replaced)
+        changed_files.append((relative_path, len(replaced)))
+        if not args.dry_run:
+            (PROJECT_ROOT / relative_path).write_text(new_content, encoding='utf-8')
+
+    action = 'se reemplazarían' if args.dry_run else 'reemplazados'
+    print(f"✅ Strings {action}: {total_replaced} en {len(changed_files)} archivos")
+    for relative_path, count in changed_files:
+        print(f"   - {relative_path}: {count}")
+
+    if all_skipped:
+        print(f"\n⚠️  Strings omitidos: {len(all_skipped)}")
+        for relative_path, item, reason in all_skipped:
+            print(f"   - {relative_path}:{item['line']}: {item['text'][:50]} ({reason})")
+
+if __name__ == '__main__':
+    main()
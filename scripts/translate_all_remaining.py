@@ -7,6 +7,8 @@ import json
 import re
 from pathlib import Path
 
+from locale_store import write_locale
+
 PROJECT_ROOT = Path('/home/ubuntu/mib2_controller')
 LOCALES_DIR = PROJECT_ROOT / 'locales'
 
@@ -175,15 +177,13 @@ def main():
     # Traducir a inglés
     en_data = translate_dict(es_data, 'en')
     en_file = LOCALES_DIR / 'en.json'
-    with open(en_file, 'w', encoding='utf-8') as f:
-        json.dump(en_data, f, indent=2, ensure_ascii=False)
+    write_locale(en_file, en_data)
     print(f"✅ Generado: {en_file}")
     
     # Traducir a alemán
     de_data = translate_dict(es_data, 'de')
     de_file = LOCALES_DIR / 'de.json'
-    with open(de_file, 'w', encoding='utf-8') as f:
-        json.dump(de_data, f, indent=2, ensure_ascii=False)
+    write_locale(de_file, de_data)
     print(f"✅ Generado: {de_file}")
     
     # Contar traducciones
@@ -2,6 +2,8 @@
 import json
 import re
 
+from locale_store import write_locale
+
 # Cargar es.json
 with open('locales/es.json', 'r', encoding='utf-8') as f:
     es_data = json.load(f)
@@ -196,7 +198,6 @@ def translate_dict(data):
 en_data = translate_dict(es_data)
 
 # Save
-with open('locales/en.json', 'w', encoding='utf-8') as f:
-    json.dump(en_data, f, ensure_ascii=False, indent=2)
+write_locale('locales/en.json', en_data)
 
 print("✅ en.json generated successfully")
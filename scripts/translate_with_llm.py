@@ -3,6 +3,8 @@ import json
 import requests
 import sys
 
+from locale_store import write_locale
+
 # Load Spanish JSON
 with open('locales/es.json', 'r', encoding='utf-8') as f:
     es_data = json.load(f)
@@ -87,7 +89,6 @@ def unflatten_dict(flat_dict, sep='.'):
 en_data = unflatten_dict(en_flat)
 
 # Save
-with open('locales/en.json', 'w', encoding='utf-8') as f:
-    json.dump(en_data, f, ensure_ascii=False, indent=2)
+write_locale('locales/en.json', en_data)
 
 print("\n✅ en.json generated successfully")
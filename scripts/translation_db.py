@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Tabla SQLite de traducciones (clave, idioma, valor, hash de origen, fecha)
+construida desde locales/*.json, con exportación de vuelta a los JSON
+"""
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+from locale_store import (
+    BUNDLES, LANGUAGES, LOCALES_DIR, PROJECT_ROOT, SOURCE_LANGUAGE, dotted, flatten_paths,
+    unflatten_paths, write_locale,
+)
+
+DB_FILE = PROJECT_ROOT / 'scripts' / 'translations.db'
+
+# path guarda la ruta como lista JSON porque algunas claves contienen
+# puntos y la clave con puntos no alcanza para reconstruir el árbol;
+# position conserva el orden de las claves del archivo original. kind es
+# 'string' para los textos y 'json' para las hojas que no son strings
+# (una sección vacía {}), guardadas en value como JSON: así un texto que
+# es literalmente "{}" no vuelve como sección al exportar
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS translations (
+    bundle      TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    lang        TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    kind        TEXT NOT NULL DEFAULT 'string',
+    source_hash TEXT,
+    updated_at  TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    position    INTEGER NOT NULL,
+    PRIMARY KEY (bundle, lang, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS translations_by_key ON translations (bundle, key, lang);
+CREATE INDEX IF NOT EXISTS translations_by_source ON translations (lang, source_hash);
+'''
+
+# En es el source_hash sale del propio valor. En en/de es el hash del
+# español del que se tradujo: solo se renueva cuando cambia la traducción
+# (o si la fila todavía no tenía), así stale sigue marcando las claves
+# después de reimportar un español editado
+UPSERT = '''
+INSERT INTO translations (bundle, key, lang, value, kind, source_hash, updated_at, path, position)
+VALUES (:bundle, :key, :lang, :value, :kind, :source_hash, :updated_at, :path, :position)
+ON CONFLICT (bundle, lang, key) DO UPDATE SET
+    value = excluded.value,
+    kind = excluded.kind,
+    source_hash = excluded.source_hash,
+    updated_at = excluded.updated_at
+WHERE value IS NOT excluded.value
+   OR kind IS NOT excluded.kind
+   OR (source_hash IS NULL AND excluded.source_hash IS NOT NULL)
+'''
+
+def now():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def source_hash(value):
+    """Hash del valor en español del que sale una traducción.
+
+    Si el texto en español cambia, las traducciones cuyo source_hash ya
+    no coincide con el de es quedaron desactualizadas.
+    """
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False)
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()[:12]
+
+def encode_value(value):
+    """(value, kind) de una hoja: los strings tal cual, lo demás (un {} vacío) como JSON"""
+    if isinstance(value, str):
+        return value, 'string'
+    return json.dumps(value, ensure_ascii=False), 'json'
+
+def decode_value(value, kind):
+    return json.loads(value) if kind == 'json' else value
+
+def prefix_range(prefix):
+    """(desde, hasta) de las claves que empiezan por prefix.
+
+    Un rango sobre la clave primaria usa el índice; un LIKE 'x.%' no,
+    porque LIKE no distingue mayúsculas por defecto.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+class TranslationDB:
+    """Conexión a la base de traducciones con las consultas habituales"""
+
+    def __init__(self, db_path=DB_FILE):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript(SCHEMA)
+        # Bases creadas antes de la columna kind: el próximo import corrige
+        # las filas de secciones vacías, que quedaron como 'string'
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(translations)')}
+        if 'kind' not in columns:
+            self.conn.execute(
+                "ALTER TABLE translations ADD COLUMN kind TEXT NOT NULL DEFAULT 'string'")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.conn.commit()
+        self.close()
+
+    def next_position(self, bundle, lang):
+        row = self.conn.execute(
+            'SELECT COALESCE(MAX(position), -1) + 1 FROM translations '
+            'WHERE bundle = ? AND lang = ?', (bundle, lang)
+        ).fetchone()
+        return row[0]
+
+    def source_hashes(self, bundle):
+        """{clave: hash} de los valores en español de un bundle"""
+        return dict(self.conn.execute(
+            'SELECT key, source_hash FROM translations WHERE bundle = ? AND lang = ?',
+            (bundle, SOURCE_LANGUAGE)
+        ))
+
+    def upsert_tree(self, bundle, lang, tree, timestamp=None):
+        """Inserta o actualiza las hojas de un árbol; devuelve las filas cambiadas.
+
+        Una fila cuyo valor no cambió conserva su updated_at. Las claves
+        nuevas van al final del orden del archivo.
+        """
+        timestamp = timestamp or now()
+        flat = flatten_paths(tree)
+        if lang == SOURCE_LANGUAGE:
+            hashes = {dotted(path): source_hash(value) for path, value in flat.items()}
+            hashes = {**self.source_hashes(bundle), **hashes}
+        else:
+            hashes = self.source_hashes(bundle)
+
+        existing = dict(self.conn.execute(
+            'SELECT key, position FROM translations WHERE bundle = ? AND lang = ?',
+            (bundle, lang)
+        ))
+        position = self.next_position(bundle, lang)
+        rows = []
+        for path, value in flat.items():
+            key = dotted(path)
+            if key in existing:
+                row_position = existing[key]
+            else:
+                row_position = position
+                position += 1
+            encoded, kind = encode_value(value)
+            rows.append({
+                'bundle': bundle, 'key': key, 'lang': lang,
+                'value': encoded, 'kind': kind, 'source_hash': hashes.get(key),
+                'updated_at': timestamp,
+                'path': json.dumps(list(path), ensure_ascii=False),
+                'position': row_position,
+            })
+        before = self.conn.total_changes
+        self.conn.executemany(UPSERT, rows)
+        return self.conn.total_changes - before
+
+    def upsert(self, bundle, lang, key, value):
+        """Asigna una sola clave con puntos (las add_* quedan en esto)"""
+        return self.upsert_tree(bundle, lang, unflatten_paths({tuple(key.split('.')): value}))
+
+    def import_files(self, locales_dir=LOCALES_DIR, languages=LANGUAGES):
+        """Carga todos los bundles; devuelve {(bundle, idioma): filas cambiadas}.
+
+        Primero el español, para que en/de tomen el source_hash actual.
+        Las claves que ya no están en los archivos se borran.
+        """
+        timestamp = now()
+        ordered = sorted(languages, key=lambda lang: lang != SOURCE_LANGUAGE)
+        changed = {}
+        for bundle, pattern in BUNDLES.items():
+            for lang in ordered:
+                file_path = Path(locales_dir) / pattern.format(lang=lang)
+                if not file_path.exists():
+                    continue
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    tree = json.load(f)
+                self.delete_missing(bundle, lang, {dotted(p) for p in flatten_paths(tree)})
+                changed[bundle, lang] = self.upsert_tree(bundle, lang, tree, timestamp)
+        self.conn.commit()
+        return changed
+
+    def delete_missing(self, bundle, lang, keys):
+        current = [key for (key,) in self.conn.execute(
+            'SELECT key FROM translations WHERE bundle = ? AND lang = ?', (bundle, lang)
+        ) if key not in keys]
+        self.conn.executemany(
+            'DELETE FROM translations WHERE bundle = ? AND lang = ? AND key = ?',
+            [(bundle, lang, key) for key in current]
+        )
+        return len(current)
+
+    def tree(self, bundle, lang):
+        """Árbol anidado de un bundle e idioma, en el orden original"""
+        flat = {}
+        for path, value, kind in self.conn.execute(
+            'SELECT path, value, kind FROM translations WHERE bundle = ? AND lang = ? '
+            'ORDER BY position', (bundle, lang)
+        ):
+            flat[tuple(json.loads(path))] = decode_value(value, kind)
+        return unflatten_paths(flat)
+
+    def export_files(self, locales_dir=LOCALES_DIR, languages=LANGUAGES):
+        """Regenera los JSON; devuelve las rutas que cambiaron"""
+        written = []
+        for bundle, pattern in BUNDLES.items():
+            for lang in languages:
+                tree = self.tree(bundle, lang)
+                if not tree:
+                    continue
+                file_path = Path(locales_dir) / pattern.format(lang=lang)
+                if write_locale(file_path, tree):
+                    written.append(file_path)
+        return written
+
+    # Consultas: todas recorren índices, sin cargar los árboles
+
+    def missing(self, lang, bundle='app'):
+        """Claves del español que faltan en lang"""
+        return [key for (key,) in self.conn.execute(
+            'SELECT s.key FROM translations s '
+            'LEFT JOIN translations t ON t.bundle = s.bundle AND t.lang = ? AND t.key = s.key '
+            'WHERE s.bundle = ? AND s.lang = ? AND t.key IS NULL ORDER BY s.position',
+            (lang, bundle, SOURCE_LANGUAGE)
+        )]
+
+    def identical(self, lang, bundle='app'):
+        """Claves de lang cuyo valor es igual al español (sin traducir)"""
+        return [key for (key,) in self.conn.execute(
+            'SELECT t.key FROM translations t '
+            'JOIN translations s ON s.bundle = t.bundle AND s.lang = ? AND s.key = t.key '
+            'WHERE t.bundle = ? AND t.lang = ? AND t.value = s.value AND t.kind = s.kind '
+            'ORDER BY t.position',
+            (SOURCE_LANGUAGE, bundle, lang)
+        )]
+
+    def stale(self, lang, bundle='app'):
+        """Claves de lang traducidas desde un español que después cambió"""
+        return [key for (key,) in self.conn.execute(
+            'SELECT t.key FROM translations t '
+            'JOIN translations s ON s.bundle = t.bundle AND s.lang = ? AND s.key = t.key '
+            'WHERE t.bundle = ? AND t.lang = ? AND t.source_hash IS NOT s.source_hash '
+            'ORDER BY t.position',
+            (SOURCE_LANGUAGE, bundle, lang)
+        )]
+
+    def under(self, prefix, lang, bundle='app'):
+        """{clave: valor} de las claves bajo prefix (por ejemplo 'auto_spoof.')"""
+        low, high = prefix_range(prefix)
+        return dict(self.conn.execute(
+            'SELECT key, value FROM translations '
+            'WHERE bundle = ? AND lang = ? AND key >= ? AND key < ? ORDER BY position',
+            (bundle, lang, low, high)
+        ))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--db', type=Path, default=DB_FILE, metavar='ARCHIVO',
+        help=f'base SQLite (por defecto {DB_FILE.relative_to(PROJECT_ROOT)})'
+    )
+    parser.add_argument('--bundle', choices=BUNDLES, default='app')
+    parser.add_argument('--json', action='store_true', help='resultado de las consultas en JSON')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('import', help='cargar locales/*.json en la base')
+    commands.add_parser('export', help='regenerar locales/*.json desde la base')
+
+    for name, help_text in (('missing', 'claves del español que faltan en un idioma'),
+                            ('identical', 'claves con el mismo valor que en español'),
+                            ('stale', 'traducciones de un español que cambió')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('lang', choices=[l for l in LANGUAGES if l != SOURCE_LANGUAGE])
+
+    command = commands.add_parser('under', help='claves bajo un prefijo')
+    command.add_argument('prefix', help="sección o prefijo, por ejemplo 'auto_spoof'")
+    command.add_argument('lang', nargs='?', choices=LANGUAGES, default=SOURCE_LANGUAGE)
+
+    command = commands.add_parser('set', help='asignar una clave en un idioma')
+    command.add_argument('lang', choices=LANGUAGES)
+    command.add_argument('key')
+    command.add_argument('value')
+    return parser.parse_args(argv)
+
+def print_keys(keys, as_json):
+    if as_json:
+        json.dump(keys, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+    items = keys.items() if isinstance(keys, dict) else ((key, None) for key in keys)
+    for key, value in items:
+        print(f"   - {key}" + (f": {value}" if value is not None else ''))
+    print(f"\n📊 Total: {len(keys)}")
+
+def main():
+    args = parse_args()
+    with TranslationDB(args.db) as db:
+        if args.command == 'import':
+            changed = db.import_files()
+            print(f"✅ Importado en {args.db}")
+            for (bundle, lang), count in changed.items():
+                print(f"   - {bundle}/{lang}: {count} filas cambiadas")
+        elif args.command == 'export':
+            written = db.export_files()
+            for path in written:
+                print(f"   - Guardado: {path}")
+            if not written:
+                print("✅ Los locales ya estaban al día")
+        elif args.command in ('missing', 'identical', 'stale'):
+            print_keys(getattr(db, args.command)(args.lang, args.bundle), args.json)
+        elif args.command == 'under':
+            prefix = args.prefix if args.prefix.endswith('.') else args.prefix + '.'
+            print_keys(db.under(prefix, args.lang, args.bundle), args.json)
+        elif args.command == 'set':
+            changed = db.upsert(args.bundle, args.lang, args.key, args.value)
+            print(f"✅ {args.key} [{args.lang}]: " + ('actualizada' if changed else 'sin cambios'))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Lexer de TS/TSX: recorre cada archivo una sola vez y entrega los literales
+de string, los fragmentos de template literals y los textos JSX con su
+posición exacta
+"""
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+# kind:  'string' | 'template' | 'jsx_text' | 'jsx_attr'
+# value: contenido sin comillas; en jsx_text, con los espacios normalizados
+#        como los normaliza JSX
+# start, end: offsets en el archivo (incluyen las comillas; en template,
+#        solo el fragmento entre backticks y ${...}; en jsx_text, del
+#        primer al último carácter visible)
+# owner: atributo JSX, clave de objeto, función llamada o elemento JSX
+#        al que pertenece el literal (o None)
+# role:  'attr' | 'key' | 'call' | 'element' | None
+Literal = namedtuple('Literal', 'kind value start end owner role')
+
+JS_TOKEN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<string>'(?:[^'\\\n]|\\[\s\S])*'?|"(?:[^"\\\n]|\\[\s\S])*"?)
+  | (?P<template>`)
+  | (?P<ident>[A-Za-z_$À-￿][\w$À-￿]*)
+  | (?P<number>\.?\d[\w.]*)
+  | (?P<punct>=>|\.\.\.|\?\?=?|\?\.|&&=?|\|\|=?|[-+*%&|^!=<>]=?=?|\S)
+''', re.VERBOSE)
+
+TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\[\s\S]|\$(?!\{))*')
+REGEX_LITERAL = re.compile(
+    r'/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*'
+)
+
+JSX_START = re.compile(r'<(?:[A-Za-z_$][\w$.:-]*)?(?=[\s/>{])')
+JSX_TAG_TOKEN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<close>/?>)
+  | (?P<brace>\{)
+  | (?P<name>[\w$.:-]+)
+  | (?P<eq>=)
+  | (?P<string>"[^"]*"?|'[^']*'?)
+  | (?P<other>[\s\S])
+''', re.VERBOSE)
+JSX_CLOSE_TAG = re.compile(r'</\s*[\w$.:-]*\s*>')
+JSX_TEXT = re.compile(r'[^<{]+')
+
+# Tokens tras los cuales '/' inicia una regex y '<' puede iniciar JSX
+EXPRESSION_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+})
+VALUE_END_PUNCT = frozenset({')', ']'})
+# Tras el ')' de su condición empieza una sentencia, no un valor:
+# en "if (ok) /a'b/.test(x)" la '/' abre una regex y no es una división
+CONDITION_KEYWORDS = frozenset({'if', 'while', 'for', 'with'})
+
+def _expression_allowed(prev_kind, prev_value):
+    if prev_kind in (None, 'condition'):
+        return True
+    if prev_kind == 'ident':
+        return prev_value in EXPRESSION_KEYWORDS
+    if prev_kind == 'punct':
+        return prev_value not in VALUE_END_PUNCT
+    return False
+
+def normalize_jsx_text(raw):
+    """Espacios de un texto JSX tal como los deja JSX al renderizar"""
+    return ' '.join(line.strip() for line in raw.splitlines() if line.strip())
+
+def tokenize(content, jsx=True):
+    """Genera los Literal de un archivo TS/TSX en orden de aparición.
+
+    Es un autómata con una pila de contextos: JS, template literal,
+    etiqueta JSX e hijos JSX. Cada carácter se visita una sola vez y un
+    archivo malformado nunca lanza excepción: lo que queda sin cerrar se
+    corta al final del archivo.
+    """
+    length = len(content)
+    pos = 0
+    mode = 'js'
+    # 'brace' | 'template' | 'attr' | 'child' | 'element'
+    stack = []
+
+    # Contexto de JS para distinguir regex/JSX y asignar owner
+    prev_kind = prev_value = None
+    chain = None
+    calls = []
+    # Por cada '(' abierto, si es el de la condición de un if/while/for
+    conditions = []
+    template_owners = []
+    # '?' de ternarios sin su ':' por nivel de anidamiento, para no
+    # confundir "a ? b : 'x'" con una clave de objeto
+    ternaries = [0]
+
+    # Contexto de JSX
+    element_names = []
+    tag_name = None
+    attr_name = None
+
+    def after_tag():
+        return 'children' if stack and stack[-1] == 'element' else 'js'
+
+    last_key = None
+
+    def js_owner():
+        if prev_kind == 'punct' and prev_value == ':' and last_key is not None:
+            return last_key, 'key'
+        if prev_kind == 'punct' and prev_value in ('(', ',') and calls and calls[-1]:
+            return calls[-1], 'call'
+        return None, None
+
+    while pos < length:
+        if mode == 'js':
+            char = content[pos]
+
+            if char == '/' and _expression_allowed(prev_kind, prev_value):
+                match = REGEX_LITERAL.match(content, pos)
+                if match:
+                    pos = match.end()
+                    prev_kind, prev_value = 'regex', None
+                    chain = None
+                    continue
+
+            if (char == '<' and jsx and _expression_allowed(prev_kind, prev_value)):
+                match = JSX_START.match(content, pos)
+                if match:
+                    tag_name = match.group()[1:]
+                    attr_name = None
+                    pos = match.end()
+                    mode = 'tag'
+                    continue
+
+            match = JS_TOKEN.match(content, pos)
+            kind = match.lastgroup
+            value = match.group()
+            start, pos = match.start(), match.end()
+
+            if kind in ('ws', 'comment'):
+                continue
+
+            if kind == 'string':
+                owner, role = js_owner()
+                yield Literal('string', value[1:-1] if len(value) > 1 and value[-1] == value[0]
+                              else value[1:], start, pos, owner, role)
+            elif kind == 'template':
+                template_owners.append(js_owner())
+                mode = 'template'
+            elif kind == 'ident':
+                if prev_kind == 'punct' and prev_value in ('.', '?.') and chain:
+                    chain = f'{chain}.{value}'
+                else:
+                    chain = value
+            elif kind == 'punct':
+                if value in ('{', '(', '['):
+                    ternaries.append(0)
+                elif value in ('}', ')', ']') and len(ternaries) > 1:
+                    ternaries.pop()
+
+                if value == '{':
+                    stack.append('brace')
+                elif value == '}':
+                    top = stack.pop() if stack and stack[-1] != 'element' else 'brace'
+                    if top == 'template':
+                        mode = 'template'
+                        continue
+                    if top == 'attr':
+                        mode = 'tag'
+                        continue
+                    if top == 'child':
+                        mode = 'children'
+                        continue
+                elif value == '(':
+                    calls.append(chain if prev_kind == 'ident' else None)
+                    conditions.append(prev_kind == 'ident' and chain in CONDITION_KEYWORDS)
+                elif value == ')':
+                    if calls:
+                        calls.pop()
+                    if conditions and conditions.pop():
+                        kind = 'condition'
+                elif value == '?':
+                    ternaries[-1] += 1
+                elif value == ':':
+                    if ternaries[-1]:
+                        ternaries[-1] -= 1
+                        last_key = None
+                    elif prev_kind == 'ident':
+                        last_key = prev_value
+                    elif prev_kind == 'string':
+                        last_key = prev_value[1:-1]
+                    else:
+                        last_key = None
+
+                if value not in ('.', '?.'):
+                    chain = None
+
+            prev_kind, prev_value = kind, value
+
+        elif mode == 'template':
+            match = TEMPLATE_CHUNK.match(content, pos)
+            chunk_end = match.end()
+            owner, role = template_owners[-1]
+            if chunk_end > pos:
+                yield Literal('template', match.group(), pos, chunk_end, owner, role)
+            pos = chunk_end
+            if pos >= length:
+                break
+            if content[pos] == '`':
+                pos += 1
+                template_owners.pop()
+                mode = 'js'
+                prev_kind, prev_value = 'template', None
+                chain = None
+            else:
+                # '${': expresión dentro del template
+                pos += 2
+                stack.append('template')
+                ternaries.append(0)
+                mode = 'js'
+                prev_kind, prev_value = 'punct', '${'
+                chain = None
+
+        elif mode == 'tag':
+            match = JSX_TAG_TOKEN.match(content, pos)
+            kind = match.lastgroup
+            value = match.group()
+            start, pos = match.start(), match.end()
+
+            if kind == 'name':
+                attr_name = value
+            elif kind == 'string':
+                inner = value[1:-1] if len(value) > 1 and value[-1] == value[0] else value[1:]
+                yield Literal('jsx_attr', inner, start, pos, attr_name, 'attr')
+                attr_name = None
+            elif kind == 'brace':
+                stack.append('attr')
+                ternaries.append(0)
+                mode = 'js'
+                prev_kind, prev_value = 'punct', '{'
+                chain = None
+            elif kind == 'close':
+                if value == '>':
+                    stack.append('element')
+                    element_names.append(tag_name)
+                    mode = 'children'
+                else:
+                    mode = after_tag()
+                    prev_kind, prev_value = 'jsx', None
+                    chain = None
+
+        else:  # children
+            char = content[pos]
+            if char == '{':
+                pos += 1
+                stack.append('child')
+                ternaries.append(0)
+                mode = 'js'
+                prev_kind, prev_value = 'punct', '{'
+                chain = None
+            elif char == '<':
+                match = JSX_CLOSE_TAG.match(content, pos)
+                if match:
+                    pos = match.end()
+                    if stack and stack[-1] == 'element':
+                        stack.pop()
+                    if element_names:
+                        element_names.pop()
+                    mode = after_tag()
+                    prev_kind, prev_value = 'jsx', None
+                    chain = None
+                    continue
+                match = JSX_START.match(content, pos)
+                if match:
+                    tag_name = match.group()[1:]
+                    attr_name = None
+                    pos = match.end()
+                    mode = 'tag'
+                else:
+                    pos += 1
+            else:
+                match = JSX_TEXT.match(content, pos)
+                raw = match.group()
+                stripped = raw.strip()
+                if stripped:
+                    start = pos + raw.index(stripped[0])
+                    end = pos + len(raw.rstrip())
+                    owner = element_names[-1] if element_names else None
+                    yield Literal('jsx_text', normalize_jsx_text(raw), start, end,
+                                  owner, 'element')
+                pos = match.end()
+
+def tokenize_file(file_path):
+    content = Path(file_path).read_text(encoding='utf-8')
+    return tokenize(content, jsx=str(file_path).endswith('.tsx'))
+
+def main():
+    for file_path in sys.argv[1:]:
+        for literal in tokenize_file(file_path):
+            print(f"{file_path}:{literal.start}-{literal.end} {literal.kind} "
+                  f"[{literal.role}:{literal.owner}] {literal.value!r}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+const fs = require('fs');
+
+// Análisis de archivos TS/TSX con el parser de TypeScript para
+// scripts/replace_hardcoded_strings.py. Lee de stdin
+//   {"mode": "analyze" | "check", "files": [{"path", "content", "offsets"}]}
+// y escribe en stdout, por archivo, {"diagnostics": [...]} con los errores
+// de sintaxis y, en modo analyze, "literals": {offset: info} con el
+// componente donde se puede declarar t para cada literal o el motivo
+// por el que no se debe traducir
+
+let ts;
+try {
+  ts = require('typescript');
+} catch (error) {
+  console.error('❌ No se encontró el paquete typescript (devDependency de package.json): ejecutar pnpm install');
+  process.exit(2);
+}
+
+// Claves de las tablas que ya traen un texto por idioma (termsOfUse)
+const LANGUAGE_CODES = new Set(['es', 'en', 'de']);
+
+// Componentes (PascalCase) y hooks (useAlgo): donde se puede llamar a useTranslation()
+const HOOK_SCOPE_NAME = /^(?:[A-Z]|use[A-Z])/;
+
+function describe(diagnostic) {
+  const message = ts.flattenDiagnosticMessageText(diagnostic.messageText, '\n');
+  if (diagnostic.file && diagnostic.start !== undefined) {
+    const { line, character } = diagnostic.file.getLineAndCharacterOfPosition(diagnostic.start);
+    return `${line + 1}:${character + 1} ${message}`;
+  }
+  return message;
+}
+
+// Errores de sintaxis: transpileModule solo informa los del parser
+function diagnostics(file) {
+  const { diagnostics: found = [] } = ts.transpileModule(file.content, {
+    fileName: file.path,
+    reportDiagnostics: true,
+    compilerOptions: { jsx: ts.JsxEmit.Preserve, target: ts.ScriptTarget.ESNext },
+  });
+  return found.map(describe);
+}
+
+function parse(file) {
+  const kind = file.path.endsWith('.tsx') ? ts.ScriptKind.TSX : ts.ScriptKind.TS;
+  return ts.createSourceFile(file.path, file.content, ts.ScriptTarget.Latest, true, kind);
+}
+
+// Nodo más interno que contiene el offset
+function nodeAt(sourceFile, offset) {
+  let node = sourceFile;
+  for (;;) {
+    const child = node.getChildren(sourceFile).find(
+      candidate => candidate.pos <= offset && offset < candidate.end
+    );
+    if (!child) {
+      return node;
+    }
+    node = child;
+  }
+}
+
+function propertyName(property) {
+  const name = property.name;
+  return name && (ts.isIdentifier(name) || ts.isStringLiteral(name)) ? name.text : undefined;
+}
+
+function isFunctionNode(node) {
+  return ts.isFunctionDeclaration(node) || ts.isFunctionExpression(node)
+    || ts.isArrowFunction(node) || ts.isMethodDeclaration(node)
+    || ts.isConstructorDeclaration(node) || ts.isGetAccessorDeclaration(node)
+    || ts.isSetAccessorDeclaration(node);
+}
+
+// Nombre de una función: el suyo o el de la variable a la que se asigna,
+// también a través de memo(), forwardRef() o paréntesis
+function functionName(fn) {
+  if ((ts.isFunctionDeclaration(fn) || ts.isFunctionExpression(fn)) && fn.name) {
+    return fn.name.text;
+  }
+  let node = fn.parent;
+  while (node && (ts.isCallExpression(node) || ts.isParenthesizedExpression(node)
+                  || ts.isAsExpression(node))) {
+    node = node.parent;
+  }
+  if (node && ts.isVariableDeclaration(node) && ts.isIdentifier(node.name)) {
+    return node.name.text;
+  }
+  return undefined;
+}
+
+function bindsT(name) {
+  if (ts.isIdentifier(name)) {
+    return name.text === 't';
+  }
+  return name.elements.some(element => !ts.isOmittedExpression(element) && bindsT(element.name));
+}
+
+function statementDeclaresT(statement) {
+  if (ts.isVariableStatement(statement)) {
+    return statement.declarationList.declarations.some(declaration => bindsT(declaration.name));
+  }
+  if (ts.isFunctionDeclaration(statement) || ts.isClassDeclaration(statement)) {
+    return statement.name?.text === 't';
+  }
+  return false;
+}
+
+// Si el nodo declara t para lo que contiene
+function declaresT(node) {
+  if (isFunctionNode(node)) {
+    return node.parameters.some(parameter => bindsT(parameter.name));
+  }
+  if (ts.isBlock(node) || ts.isCaseClause(node) || ts.isDefaultClause(node)) {
+    return node.statements.some(statementDeclaresT);
+  }
+  if ((ts.isForStatement(node) || ts.isForOfStatement(node) || ts.isForInStatement(node))
+      && node.initializer && ts.isVariableDeclarationList(node.initializer)) {
+    return node.initializer.declarations.some(declaration => bindsT(declaration.name));
+  }
+  if (ts.isCatchClause(node)) {
+    return Boolean(node.variableDeclaration) && bindsT(node.variableDeclaration.name);
+  }
+  return false;
+}
+
+// t en el cuerpo del componente: 'hook' si es const t = useTranslation(),
+// 'other' si es otra cosa, null si no está
+function componentBinding(body) {
+  const statement = body.statements.find(statementDeclaresT);
+  if (!statement) {
+    return null;
+  }
+  const declaration = ts.isVariableStatement(statement)
+    && statement.declarationList.declarations.find(candidate => bindsT(candidate.name));
+  const init = declaration && ts.isIdentifier(declaration.name) && declaration.initializer;
+  const isHook = init && ts.isCallExpression(init) && ts.isIdentifier(init.expression)
+    && init.expression.text === 'useTranslation';
+  return isHook ? 'hook' : 'other';
+}
+
+function skip(reason) {
+  return { skip: reason };
+}
+
+function analyzeLiteral(sourceFile, offset) {
+  const literal = nodeAt(sourceFile, offset);
+
+  const functions = [];
+  for (let node = literal.parent; node; node = node.parent) {
+    if (ts.isPropertyAssignment(node) && LANGUAGE_CODES.has(propertyName(node))) {
+      return skip(`tabla por idioma (${propertyName(node)})`);
+    }
+    if (isFunctionNode(node)) {
+      functions.push(node);
+    }
+  }
+
+  const owner = literal.parent;
+  if (owner && ts.isPropertyAssignment(owner) && owner.initializer === literal) {
+    const sibling = `${propertyName(owner)}Key`;
+    if (owner.parent.properties.some(property => propertyName(property) === sibling)) {
+      return skip(`ya tiene ${sibling}`);
+    }
+  }
+
+  if (!functions.length) {
+    return skip('ámbito de módulo');
+  }
+  const component = functions[functions.length - 1];
+  const name = functionName(component);
+  if (!name || !HOOK_SCOPE_NAME.test(name)) {
+    return skip(name ? `fuera de un componente (${name})` : 'fuera de un componente');
+  }
+  if (!component.body || !ts.isBlock(component.body)) {
+    return skip(`${name} no tiene cuerpo de bloque para declarar t`);
+  }
+  const bodyStart = component.body.getStart(sourceFile);
+  if (offset < bodyStart) {
+    return skip(`fuera del cuerpo de ${name}`);
+  }
+
+  for (let node = literal.parent; node !== component.body; node = node.parent) {
+    if (declaresT(node)) {
+      return skip(`t ya está definida dentro de ${name}`);
+    }
+  }
+  if (component.parameters.some(parameter => bindsT(parameter.name))) {
+    return skip(`t es un parámetro de ${name}`);
+  }
+  const binding = componentBinding(component.body);
+  if (binding === 'other') {
+    return skip(`t ya está definida en ${name}`);
+  }
+  return { skip: null, component: name, body: bodyStart + 1, hasHook: binding === 'hook' };
+}
+
+function main() {
+  const request = JSON.parse(fs.readFileSync(0, 'utf8'));
+  const results = request.files.map(file => {
+    const result = { diagnostics: diagnostics(file) };
+    if (request.mode === 'analyze') {
+      const sourceFile = parse(file);
+      result.literals = {};
+      for (const offset of file.offsets) {
+        result.literals[offset] = analyzeLiteral(sourceFile, offset);
+      }
+    }
+    return result;
+  });
+  process.stdout.write(JSON.stringify(results));
+}
+
+main();
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Valida en una sola pasada la paridad de es/en/de: claves faltantes y
+sobrantes, textos sin traducir, marcas [TODO: y placeholders {{var}}
+"""
+import re
+import sys
+import json
+import time
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+from locale_store import (
+    BUNDLES, INTERPOLATION, LANGUAGES, LOCALES_DIR, SOURCE_LANGUAGE, dotted, flatten_paths,
+)
+
+# {{...}} que la app no interpola ({{ count }}, por ejemplo): queda tal cual en pantalla
+MALFORMED_PLACEHOLDER = re.compile(r'\{\{(?!\w+\}\})[^{}]*\}\}')
+# Marca que dejan auto_translate.py y complete_translations.py
+TODO_MARKER = '[TODO:'
+# Un valor sin letras (números, símbolos, "—") no se traduce
+HAS_LETTERS = re.compile(r'[^\W\d_]')
+
+# kind -> severidad; los errores hacen fallar la validación
+CHECKS = {
+    'missing': 'error',
+    'extra': 'warning',
+    'todo': 'error',
+    'placeholders': 'error',
+    'placeholder_syntax': 'error',
+    'untranslated': 'warning',
+}
+
+def placeholders(value):
+    """Nombres de los {{var}} de un valor"""
+    if '{{' not in value:
+        return frozenset()
+    return frozenset(INTERPOLATION.findall(value))
+
+def load_bundle(pattern, locales_dir=LOCALES_DIR, languages=LANGUAGES):
+    """{idioma: {ruta: valor}} de un bundle; se omiten los idiomas sin archivo"""
+    flat = {}
+    for lang in languages:
+        file_path = Path(locales_dir) / pattern.format(lang=lang)
+        if file_path.exists():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                flat[lang] = flatten_paths(json.load(f))
+    return flat
+
+def validate(flat, bundle='app', source=SOURCE_LANGUAGE):
+    """Problemas de un bundle aplanado, en una sola pasada sobre sus claves.
+
+    Cada problema es un dict {bundle, lang, key, kind, severity, ...}.
+    Las claves del idioma fuente se recorren una vez y en cada una se
+    comparan todos los idiomas; después solo quedan las claves sobrantes.
+    """
+    issues = []
+    source_flat = flat[source]
+    targets = [(lang, flat[lang]) for lang in flat if lang != source]
+
+    def report(lang, path, kind, **details):
+        issues.append({'bundle': bundle, 'lang': lang, 'key': dotted(path),
+                       'kind': kind, 'severity': CHECKS[kind], **details})
+
+    for path, source_value in source_flat.items():
+        if not isinstance(source_value, str):
+            continue
+        source_vars = placeholders(source_value)
+        if TODO_MARKER in source_value:
+            report(source, path, 'todo', value=source_value)
+        if MALFORMED_PLACEHOLDER.search(source_value):
+            report(source, path, 'placeholder_syntax', value=source_value)
+        for lang, values in targets:
+            value = values.get(path)
+            if value is None:
+                report(lang, path, 'missing')
+                continue
+            if not isinstance(value, str):
+                continue
+            if MALFORMED_PLACEHOLDER.search(value) and value != source_value:
+                report(lang, path, 'placeholder_syntax', value=value)
+            if TODO_MARKER in value:
+                report(lang, path, 'todo', value=value)
+            elif value == source_value:
+                if HAS_LETTERS.search(value):
+                    report(lang, path, 'untranslated', value=value)
+                continue
+            target_vars = placeholders(value)
+            if target_vars != source_vars:
+                report(lang, path, 'placeholders',
+                       expected=sorted(source_vars), found=sorted(target_vars))
+
+    for lang, values in targets:
+        for path in values.keys() - source_flat.keys():
+            report(lang, path, 'extra')
+    return issues
+
+def summarize(issues):
+    """{idioma: {tipo: cantidad}}"""
+    counts = defaultdict(lambda: defaultdict(int))
+    for issue in issues:
+        counts[issue['lang']][issue['kind']] += 1
+    return {lang: dict(kinds) for lang, kinds in sorted(counts.items())}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--bundle', choices=BUNDLES, action='append',
+        help='validar solo este bundle (por defecto todos)'
+    )
+    parser.add_argument(
+        '--json', action='store_true',
+        help='escribir los problemas como JSON en la salida estándar'
+    )
+    parser.add_argument(
+        '--output', type=Path, metavar='JSON',
+        help='guardar además los problemas como JSON en este archivo'
+    )
+    parser.add_argument(
+        '--strict', action='store_true',
+        help='fallar también con advertencias (sobrantes y sin traducir)'
+    )
+    parser.add_argument(
+        '--limit', type=int, default=20, metavar='N',
+        help='problemas a mostrar por tipo e idioma (0 = todos)'
+    )
+    return parser.parse_args(argv)
+
+def print_issues(issues, limit):
+    grouped = defaultdict(list)
+    for issue in issues:
+        grouped[issue['lang'], issue['kind']].append(issue)
+    for (lang, kind), found in sorted(grouped.items()):
+        icon = '❌' if CHECKS[kind] == 'error' else '⚠️ '
+        print(f"\n{icon} [{lang}] {kind}: {len(found)}")
+        for issue in found[:limit or None]:
+            detail = ''
+            if kind == 'placeholders':
+                detail = f" (es {issue['expected']}, {lang} {issue['found']})"
+            elif 'value' in issue:
+                detail = f": {issue['value'][:60]}"
+            print(f"   - {issue['bundle']}:{issue['key']}{detail}")
+        if limit and len(found) > limit:
+            print(f"   ... y {len(found) - limit} más")
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    issues = []
+    leaves = 0
+    for bundle in args.bundle or BUNDLES:
+        flat = load_bundle(BUNDLES[bundle])
+        if SOURCE_LANGUAGE not in flat:
+            continue
+        leaves += len(flat[SOURCE_LANGUAGE])
+        issues.extend(validate(flat, bundle))
+    elapsed = (time.perf_counter() - start) * 1000
+
+    failing = {kind for kind, severity in CHECKS.items()
+               if severity == 'error' or args.strict}
+    ok = not any(issue['kind'] in failing for issue in issues)
+    result = {
+        'ok': ok,
+        'leaves': leaves,
+        'elapsed_ms': round(elapsed, 1),
+        'summary': summarize(issues),
+        'issues': issues,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        print_issues(issues, args.limit)
+        print(f"\n{'✅' if ok else '❌'} {leaves} claves en español validadas "
+              f"en {elapsed:.0f} ms: {len(issues)} problemas")
+        for lang, kinds in result['summary'].items():
+            print(f"   - {lang}: " + ', '.join(f"{kind} {count}" for kind, count in kinds.items()))
+        if args.output:
+            print(f"   - Resultados guardados en: {args.output}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+    main()